@@ -2,6 +2,7 @@
 # para garantir que cada teste seja independente.
 
 import pytest
+from pathlib import Path
 from truco.jogador import Jogador
 from truco.bot import Bot
 from truco.baralho import Baralho
@@ -40,6 +41,12 @@ def mock_dados():
             return lambda *args, **kwargs: None
     return MockDados()
 
+@pytest.fixture
+def casos_cbr():
+    """Caminho da base de casos dbtrucocbr_maos.csv, para os testes que usam o Cbr de verdade."""
+    #a base padrão (dbtrucoimitacao_maos.csv) não acompanha o repositório
+    return str(Path(__file__).resolve().parent.parent / 'dbtrucocbr_maos.csv')
+
 @pytest.fixture
 def iface():
     """Fornece uma instância real da Interface."""
@@ -0,0 +1,37 @@
+import random
+import numpy as np
+import pytest
+from truco.baralho import Baralho
+from truco.aleatorio import criar_gerador, gerador_do_jogo, random_do_jogo, criar_geradores
+
+
+def ids_distribuidos(baralho, maos=20):
+    return [[carta.id for carta in mao] for _ in range(maos) for mao in baralho.distribuir()]
+
+
+@pytest.mark.parametrize("fabrica", [
+    lambda: criar_gerador(42),
+    lambda: random.Random(42),
+])
+def test_baralho_com_gerador_explicito_e_reprodutivel(fabrica):
+    """Dois baralhos com a mesma semente distribuem e embaralham exatamente as mesmas cartas."""
+    baralho_1, baralho_2 = Baralho(fabrica()), Baralho(fabrica())
+    assert ids_distribuidos(baralho_1) == ids_distribuidos(baralho_2)
+
+    baralho_1.embaralhar()
+    baralho_2.embaralhar()
+    assert [c.id for c in baralho_1.cartas] == [c.id for c in baralho_2.cartas]
+
+
+def test_fluxo_do_jogo_nao_depende_da_ordem_de_criacao():
+    """O gerador do jogo 7 é o mesmo, seja criado sozinho ou em lote (ex: em outro processo)."""
+    sozinho = gerador_do_jogo(2024, 7).random(5)
+    em_lote = criar_geradores(2024, 10)[7].random(5)
+    assert np.array_equal(sozinho, em_lote)
+    assert random_do_jogo(2024, 7).random() == random_do_jogo(2024, 7).random()
+
+
+def test_fluxos_de_jogos_diferentes_sao_independentes():
+    """Jogos diferentes (ou sementes raiz diferentes) recebem sequências diferentes."""
+    assert not np.array_equal(gerador_do_jogo(2024, 1).random(5), gerador_do_jogo(2024, 2).random(5))
+    assert not np.array_equal(gerador_do_jogo(2024, 1).random(5), gerador_do_jogo(2025, 1).random(5))
@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+import pytest
+from truco.ambiente import AmbienteVetorizado, DecisorAleatorio, DecisorCbr, COLUNAS_OBSERVACAO, INDICE_OBSERVACAO
+from truco.ambiente import decidir_jogos, jogar_partidas
+from truco.cbr import Cbr
+from truco.motor import Motor, EstadoJogo, TRUCO, QUERO
+
+# Colunas da base de casos sintética: as consultadas pelas decisões do Cbr e as preenchidas nos registros
+COLUNAS_CASOS = [
+    'jogadorMao', 'cartaAltaRobo', 'cartaMediaRobo', 'cartaBaixaRobo', 'primeiraCartaRobo', 'primeiraCartaHumano',
+    'segundaCartaRobo', 'segundaCartaHumano', 'terceiraCartaRobo', 'terceiraCartaHumano', 'ganhadorPrimeiraRodada',
+    'ganhadorSegundaRodada', 'ganhadorTerceiraRodada', 'quemPediuFaltaEnvido', 'quemPediuRealEnvido',
+    'pontosEnvidoRobo', 'pontosEnvidoHumano', 'quemGanhouEnvido', 'quemRetruco', 'quemGanhouTruco',
+    'naipePrimeiraCartaRobo', 'naipePrimeiraCartaHumano', 'qualidadeMaoRobo', 'qualidadeMaoHumano',
+]
+
+
+@pytest.fixture
+def cbr_sintetico():
+    """Cbr sobre uma base de casos aleatória, sem ler os arquivos de dados."""
+    gerador = np.random.default_rng(11)
+    casos = pd.DataFrame({coluna: gerador.integers(0, 3, 400) for coluna in COLUNAS_CASOS})
+    for coluna in ('cartaAltaRobo', 'cartaMediaRobo', 'cartaBaixaRobo', 'primeiraCartaRobo', 'segundaCartaRobo', 'terceiraCartaRobo'):
+        casos[coluna] = gerador.integers(-2, 15, 400)
+    casos['pontosEnvidoRobo'] = gerador.integers(0, 34, 400)
+    casos['pontosEnvidoHumano'] = gerador.integers(0, 34, 400)
+    casos['qualidadeMaoHumano'] = gerador.integers(1, 30, 400)
+
+    cbr = Cbr.__new__(Cbr)
+    cbr.dataset = casos.astype('int16')
+    cbr.nbrs = cbr.vizinhos_proximos()
+    return cbr
+
+
+class RegistroFixo:
+    """Substitui Dados nos métodos escalares do Cbr, devolvendo sempre o mesmo registro."""
+
+    def __init__(self, colunas, valores):
+        self.registro = pd.DataFrame([valores], columns=colunas)
+
+    def retornar_registro(self):
+        return self.registro
+
+
+def test_ambiente_segue_as_regras_do_motor():
+    """Com as mesmas mãos e ações, os K jogos evoluem como K motores independentes."""
+    ambiente = AmbienteVetorizado(64, gerador=5)
+    observacoes = ambiente.reiniciar()
+    assert observacoes.shape == (64, len(COLUNAS_OBSERVACAO))
+
+    motores = []
+    for jogo in range(64):
+        motores.append(Motor())
+        motores[jogo].nova_mao(maos=ambiente.maos[jogo].tolist())
+
+    decisores = [DecisorAleatorio(1), DecisorAleatorio(2)]
+    for _ in range(600):
+        mascaras = ambiente.mascaras()
+        assert mascaras.tolist() == [motor.mascara_legal() for motor in motores]
+        acoes = decidir_jogos(ambiente, decisores)
+        anteriores = [list(motor.estado.pontos) for motor in motores]
+        observacoes, recompensas, terminadas, info = ambiente.avancar(acoes)
+
+        for jogo, motor in enumerate(motores):
+            estado = motor.aplicar(int(acoes[jogo]))
+            assert recompensas[jogo].tolist() == [estado.pontos[0] - anteriores[jogo][0], estado.pontos[1] - anteriores[jogo][1]]
+            assert terminadas[jogo] == bool(estado.vencedor)
+            assert info['maos_encerradas'][jogo] == bool(estado.vencedor_mao)
+            if (estado.vencedor):
+                assert info['vencedores'][jogo] == estado.vencedor
+                motor.estado = EstadoJogo()
+            if (estado.vencedor_mao):
+                motor.nova_mao(maos=ambiente.maos[jogo].tolist())
+            assert motor.estado.pontos == ambiente.pontos[jogo].tolist()
+            assert motor.estado.vez == observacoes[jogo, INDICE_OBSERVACAO['jogador']]
+
+
+def test_avancar_rejeita_acoes_ilegais_sem_alterar_os_jogos():
+    ambiente = AmbienteVetorizado(3, gerador=1)
+    observacoes = ambiente.reset()
+    acoes = np.array([TRUCO, QUERO, TRUCO])
+
+    with pytest.raises(ValueError, match=r"\[1\]"):
+        ambiente.step(acoes)
+    assert (ambiente.observacoes() == observacoes).all()
+
+
+def test_cbr_em_lote_decide_como_os_metodos_escalares(cbr_sintetico):
+    """Uma única consulta de vizinhos para N registros dá as mesmas decisões que N chamadas escalares."""
+    gerador = np.random.default_rng(3)
+    registros = gerador.integers(0, 12, (40, len(COLUNAS_CASOS)))
+    vizinhos = cbr_sintetico.consultar_vizinhos(registros)
+    pontuacoes = gerador.integers(1, 15, (40, 3))
+    rodadas = gerador.integers(1, 4, 40)
+    qualidades = gerador.uniform(1, 30, 40)
+    tipos = gerador.choice([0, 6, 7], 40)
+    envidos = gerador.integers(0, 34, 40)
+    perdendo = gerador.random(40) < 0.5
+
+    cartas = cbr_sintetico.jogar_cartas(vizinhos, rodadas, pontuacoes)
+    trucos = cbr_sintetico.trucos(vizinhos, qualidades)
+    respostas = cbr_sintetico.envidos(vizinhos, tipos, 2, envidos, perdendo)
+    for i, registro in enumerate(registros):
+        cbr_sintetico.dados = RegistroFixo(COLUNAS_CASOS, registro)
+        assert cartas[i] == cbr_sintetico.jogar_carta(int(rodadas[i]), pontuacoes[i].tolist())
+        assert trucos[i] == cbr_sintetico.truco('truco', 1, qualidades[i])
+        assert respostas[i] == cbr_sintetico.envido(int(tipos[i]), 2, int(envidos[i]), bool(perdendo[i]))
+
+
+def test_decisor_cbr_consulta_os_vizinhos_uma_vez_por_passo(cbr_sintetico, monkeypatch):
+    """O bot decide por todos os jogos em que é a sua vez com uma só chamada a kneighbors."""
+    chamadas = []
+    kneighbors = cbr_sintetico.nbrs.kneighbors
+
+    def contar(registros, *args, **kwargs):
+        chamadas.append(len(registros))
+        return kneighbors(registros, *args, **kwargs)
+
+    monkeypatch.setattr(cbr_sintetico.nbrs, 'kneighbors', contar)
+    ambiente = AmbienteVetorizado(32, gerador=2)
+    decisores = [DecisorAleatorio(4), DecisorCbr(cbr_sintetico)]
+
+    ambiente.reiniciar()
+    for _ in range(50):
+        anteriores = len(chamadas)
+        ambiente.avancar(decidir_jogos(ambiente, decisores))
+        assert len(chamadas) - anteriores <= 1
+    assert max(chamadas) > 1
+
+    vitorias = jogar_partidas(ambiente, decisores, 20)
+    assert vitorias.sum() >= 20
+
+
+def test_decisor_cbr_usa_os_limiares_do_envido(cbr_sintetico, monkeypatch):
+    """Como no Bot, o placar a partir do qual o bot se considera perdendo pode ser configurado."""
+    perdendo = []
+    envidos = cbr_sintetico.envidos
+
+    def registrar(vizinhos, tipos, quem_pediu, pontos_envido_robo, robo_perdendo):
+        perdendo.extend(np.asarray(robo_perdendo).tolist())
+        return envidos(vizinhos, tipos, quem_pediu, pontos_envido_robo, robo_perdendo)
+
+    monkeypatch.setattr(cbr_sintetico, 'envidos', registrar)
+    ambiente = AmbienteVetorizado(16, gerador=7)
+    ambiente.reiniciar()
+    decisores = [DecisorAleatorio(1), DecisorCbr(cbr_sintetico, limiar_perdendo=-1)]
+    ambiente.avancar(decidir_jogos(ambiente, decisores))
+    ambiente.avancar(decidir_jogos(ambiente, decisores))
+
+    assert perdendo and all(perdendo)
+    assert DecisorCbr(cbr_sintetico).limiar_perdendo == 6
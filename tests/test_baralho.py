@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
-from truco.baralho import Baralho
+from math import comb
+from truco.baralho import Baralho, enumerar_distribuicoes, enumerar_maos, gerar_distribuicoes, gerar_distribuicoes_em_blocos
 from truco.carta import Carta
 
 @pytest.fixture
@@ -68,4 +70,94 @@ def test_retirar_carta_de_baralho_vazio_levanta_excecao(baralho):
     # 2. Act & 3. Assert (combinados para exceções)
     # Verifica se a 41ª retirada levanta a exceção esperada
     with pytest.raises(IndexError):
-        baralho.retirar_carta()
\ No newline at end of file
+        baralho.retirar_carta()
+
+def test_distribuir_entrega_maos_sem_repetir_cartas_RNF04(baralho):
+    """Testa (RF03 / RNF04): distribuir entrega 3 cartas distintas a cada jogador, sem alterar a pilha de retirar_carta."""
+    maos = baralho.distribuir(jogadores=2, cartas=3)
+
+    assert len(maos) == 2
+    assert all(len(mao) == 3 for mao in maos)
+    assert len({carta.id for mao in maos for carta in mao}) == 6
+    assert len(baralho.cartas) == 40
+
+
+def test_distribuir_varias_maos_reaproveita_o_baralho(baralho):
+    """Várias distribuições seguidas não esgotam o baralho e cobrem todas as cartas."""
+    vistas = set()
+    for _ in range(200):
+        for mao in baralho.distribuir(jogadores=2, cartas=3):
+            vistas.update(carta.id for carta in mao)
+
+    assert vistas == set(range(40))
+    assert sorted(baralho.indices) == list(range(40))
+
+
+def test_distribuir_mais_cartas_que_o_baralho_levanta_excecao(baralho):
+    """Testa (Exceção): não é possível distribuir mais de 40 cartas."""
+    with pytest.raises(ValueError):
+        baralho.distribuir(jogadores=2, cartas=21)
+
+
+def test_gerar_distribuicoes_formato_e_cartas_distintas():
+    """Cada linha é uma distribuição de 6 cartas distintas, em int8."""
+    distribuicoes = gerar_distribuicoes(5000, gerador=1)
+
+    assert distribuicoes.shape == (5000, 2, 3)
+    assert distribuicoes.dtype == np.int8
+    ordenadas = np.sort(distribuicoes.reshape(5000, 6), axis=1)
+    assert (np.diff(ordenadas, axis=1) > 0).all()
+    assert ordenadas.min() >= 0 and ordenadas.max() < 40
+
+
+def test_gerar_distribuicoes_e_aproximadamente_uniforme():
+    """Todas as cartas aparecem em todas as posições com frequência parecida."""
+    distribuicoes = gerar_distribuicoes(40000, gerador=2).reshape(40000, 6)
+    for posicao in range(6):
+        frequencias = np.bincount(distribuicoes[:, posicao], minlength=40)
+        assert frequencias.min() > 800 and frequencias.max() < 1200
+
+
+def test_gerar_distribuicoes_em_blocos_limita_o_tamanho_e_e_reprodutivel():
+    """Os blocos têm no máximo tamanho_bloco linhas e a mesma semente gera os mesmos blocos."""
+    blocos = list(gerar_distribuicoes_em_blocos(1000, gerador=3, tamanho_bloco=300))
+
+    assert [len(bloco) for bloco in blocos] == [300, 300, 300, 100]
+    assert np.array_equal(np.concatenate(blocos), gerar_distribuicoes(1000, gerador=3, tamanho_bloco=300))
+
+
+def test_enumerar_maos_com_a_mao_do_bot_e_uma_carta_do_oponente():
+    """Com as 3 cartas do bot removidas e 1 carta do oponente conhecida, restam C(36, 2) mãos possíveis."""
+    mao_bot = [Carta(1, "ESPADAS"), Carta(7, "OUROS"), Carta(3, "COPAS")]
+    jogada = Carta(4, "BASTOS")
+    maos = np.concatenate(list(enumerar_maos(conhecidas=[jogada], removidas=mao_bot, tamanho_bloco=100)))
+
+    assert maos.shape == (comb(36, 2), 3)
+    assert (maos[:, 0] == jogada.id).all()
+    assert not np.isin(maos, [carta.id for carta in mao_bot]).any()
+    assert len({frozenset(mao) for mao in maos.tolist()}) == comb(36, 2)
+
+
+@pytest.mark.parametrize("tamanho_bloco", [1, 50, 100000])
+def test_enumerar_distribuicoes_cobre_todas_as_distribuicoes_uma_vez(tamanho_bloco):
+    """Cada distribuição consistente com as cartas conhecidas aparece exatamente uma vez, em qualquer tamanho de bloco."""
+    removidas = list(range(20, 40))
+    blocos = list(enumerar_distribuicoes(conhecidas_1=[0], conhecidas_2=[5], removidas=removidas, tamanho_bloco=tamanho_bloco))
+    distribuicoes = np.concatenate(blocos)
+
+    assert max(len(bloco) for bloco in blocos) <= max(tamanho_bloco, comb(16, 2))
+    assert distribuicoes.shape == (comb(18, 2) * comb(16, 2), 2, 3)
+    assert (distribuicoes[:, 0, 0] == 0).all() and (distribuicoes[:, 1, 0] == 5).all()
+    planas = distribuicoes.reshape(len(distribuicoes), 6)
+    assert (np.diff(np.sort(planas, axis=1), axis=1) > 0).all()
+    assert planas.max() < 20
+    assert len({(frozenset(d[:3]), frozenset(d[3:])) for d in planas.tolist()}) == len(planas)
+
+
+def test_distribuir_ids_coincide_com_distribuir():
+    """Com a mesma semente, distribuir_ids retorna os ids das cartas que distribuir entregaria."""
+    import random
+    maos_ids = Baralho(random.Random(4)).distribuir_ids(jogadores=2, cartas=3)
+    maos = Baralho(random.Random(4)).distribuir(jogadores=2, cartas=3)
+
+    assert maos_ids == [[carta.id for carta in mao] for mao in maos]
@@ -0,0 +1,63 @@
+import itertools
+import numpy as np
+from truco.carta import Carta
+from truco.canonico import (
+    canonizar_mao, canonizar_envido, canonizar_forca,
+    indice_canonico, indices_canonicos, CANONICO_MAOS, CANONICO_ENVIDO_MAOS,
+)
+from truco.maos import MAOS, classificar_maos, indice_mao
+from truco.mascara import calcular_envido_bits, tem_flor
+
+
+def ids(*cartas):
+    return [carta.id for carta in cartas]
+
+
+def test_maos_com_naipes_trocados_tem_o_mesmo_representante():
+    """Sem manilhas envolvidas, trocar os naipes não muda a classe da mão."""
+    mao_1 = ids(Carta(3, "COPAS"), Carta(3, "OUROS"), Carta(12, "COPAS"))
+    mao_2 = ids(Carta(3, "BASTOS"), Carta(3, "ESPADAS"), Carta(12, "ESPADAS"))
+    assert canonizar_mao(mao_1) == canonizar_mao(mao_2)
+    assert indice_canonico(mao_1) == indice_canonico(mao_2)
+
+
+def test_manilhas_nao_sao_trocadas():
+    """O 7 de OUROS (manilha) não é equivalente ao 7 de COPAS."""
+    mao_1 = ids(Carta(7, "OUROS"), Carta(4, "OUROS"), Carta(5, "OUROS"))
+    mao_2 = ids(Carta(7, "COPAS"), Carta(4, "COPAS"), Carta(5, "COPAS"))
+    assert canonizar_mao(mao_1) != canonizar_mao(mao_2)
+    assert canonizar_envido(mao_1) == canonizar_envido(mao_2)
+
+
+def test_cartas_conhecidas_usam_a_mesma_troca_de_naipes():
+    """A carta conhecida do oponente acompanha a troca de naipes da mão."""
+    mesmo_naipe = canonizar_mao(ids(Carta(4, "COPAS"), Carta(5, "COPAS"), Carta(6, "OUROS")), ids(Carta(3, "COPAS")))
+    outro_naipe = canonizar_mao(ids(Carta(4, "COPAS"), Carta(5, "COPAS"), Carta(6, "OUROS")), ids(Carta(3, "OUROS")))
+    assert mesmo_naipe != outro_naipe
+    assert mesmo_naipe == canonizar_mao(ids(Carta(4, "OUROS"), Carta(5, "OUROS"), Carta(6, "COPAS")), ids(Carta(3, "OUROS")))
+
+
+def test_representante_preserva_envido_flor_e_pontos():
+    """O representante tem o mesmo envido, flor e pontuação de cartas de todas as mãos da classe."""
+    for mao in MAOS[::13].tolist():
+        canonica, _ = canonizar_mao(mao)
+        bits, bits_canonica = sum(1 << id for id in mao), sum(1 << id for id in canonica)
+        assert calcular_envido_bits(bits) == calcular_envido_bits(bits_canonica)
+        assert tem_flor(bits) == tem_flor(bits_canonica)
+        assert sorted(classificar_maos([mao])[0][0]) == sorted(classificar_maos([canonica])[0][0])
+
+
+def test_tabelas_canonicas_reduzem_o_numero_de_maos():
+    """As tabelas por índice coincidem com a versão escalar e reduzem as 9880 mãos."""
+    assert len(np.unique(CANONICO_MAOS)) < 9880 // 4
+    assert len(np.unique(CANONICO_ENVIDO_MAOS)) < len(np.unique(CANONICO_MAOS))
+    assert indices_canonicos(MAOS[:50]).tolist() == [indice_mao(canonizar_mao(mao)[0]) for mao in MAOS[:50].tolist()]
+
+
+def test_canonizar_forca_usa_somente_a_pontuacao():
+    """Para a força no truco, cartas de mesma pontuação são equivalentes."""
+    mao_1 = ids(Carta(2, "COPAS"), Carta(2, "OUROS"), Carta(1, "ESPADAS"))
+    mao_2 = ids(Carta(2, "BASTOS"), Carta(2, "ESPADAS"), Carta(1, "ESPADAS"))
+    assert canonizar_forca(mao_1) == canonizar_forca(mao_2)
+    classes = {canonizar_forca(mao) for mao in itertools.combinations(range(40), 3)}
+    assert len(classes) < len(np.unique(CANONICO_MAOS))
@@ -0,0 +1,44 @@
+import copy
+import pickle
+import pytest
+from truco.baralho import Baralho
+from truco.carta import Carta, CARTAS
+
+
+def test_carta_do_baralho_e_instancia_unica():
+    """Criar a mesma carta duas vezes retorna o mesmo objeto compartilhado."""
+    assert Carta(7, "OUROS") is Carta(7, "OUROS")
+    assert Carta(7, "OUROS") is CARTAS[Carta(7, "OUROS").id]
+
+
+def test_baralhos_compartilham_as_mesmas_cartas():
+    """Novos baralhos (e novas mãos) reutilizam as 40 cartas, sem alocar novas."""
+    baralho_1 = Baralho()
+    baralho_2 = Baralho()
+    baralho_2.resetar()
+    baralho_2.criar_baralho()
+    assert all(a is b for a, b in zip(baralho_1.cartas, baralho_2.cartas))
+
+
+def test_carta_e_imutavel():
+    """Cartas compartilhadas não podem ser alteradas nem ganhar novos atributos."""
+    carta = Carta(1, "ESPADAS")
+    with pytest.raises(AttributeError):
+        carta.numero = 3
+    with pytest.raises(AttributeError):
+        carta.extra = True
+
+
+def test_carta_e_hashavel_e_sobrevive_a_copias():
+    """Cópias e pickle preservam a instância canônica."""
+    carta = Carta(3, "BASTOS")
+    assert {carta: 1}[Carta(3, "BASTOS")] == 1
+    assert copy.deepcopy(carta) is carta
+    assert pickle.loads(pickle.dumps(carta)) is carta
+
+
+def test_carta_fora_do_baralho_nao_e_compartilhada():
+    """Cartas que não existem no baralho continuam podendo ser criadas."""
+    carta = Carta(8, "COPAS")
+    assert carta.id is None
+    assert carta is not Carta(8, "COPAS")
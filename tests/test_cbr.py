@@ -106,6 +106,30 @@ def test_carregar_dataset(cbr, dados, monkeypatch):
     assert "COPAS" not in df.values
 
 
+def test_com_dados_consulta_outro_registro(cbr):
+    """A cópia consulta o registro do novo Dados, sem refazer a base de casos nem os vizinhos."""
+    outros = MockDados()
+    copia = cbr.com_dados(outros)
+
+    assert copia.dados is outros and cbr.dados is not outros
+    assert copia.dataset is cbr.dataset and copia.nbrs is cbr.nbrs
+
+
+def test_decisoes_sem_vizinhos_favoraveis_usam_valores_neutros(cbr):
+    """Quando os filtros não deixam nenhum caso, as decisões usam os mesmos padrões das versões em lote, em vez de IndexError."""
+    cbr.dataset = DATASET_MOCK.assign(quemGanhouTruco=1, ganhadorPrimeiraRodada=1, ganhadorSegundaRodada=1, ganhadorTerceiraRodada=1,
+                                      pontosEnvidoRobo=20, pontosEnvidoHumano=20, quemGanhouEnvido=0)
+
+    # Sem jogadas vencidas não há carta de referência: -1 deixa a escolha para o Bot
+    assert cbr.jogar_carta(3, [1, 2, 3]) == -1
+    # Sem truco vencido não há qualidade de mão do oponente para comparar: foge
+    assert cbr.truco(1, 2, 200.0) == 0
+    # As modas vazias valem 0, então só os próprios pontos decidem
+    assert cbr.envido(6, 1, 20, False) == 0
+    assert cbr.envido(7, 1, 20, False) == 1
+    assert cbr.envido(0, 2, 20, True) == 1
+
+
 def test_truco(cbr):
     """
     valida a lofica de tomada de decisao do cbr ao receber truco.
@@ -431,4 +431,42 @@ def test_verificar_ganhador_chama_interface(cenario_rodadas): # Remova o 'monkey
     
     # 3. Assert
     assert foi_chamado is True
-    assert carta_ganhadora_spy == c1 # Verifica se a carta correta foi passada
\ No newline at end of file
+    assert carta_ganhadora_spy == c1 # Verifica se a carta correta foi passada
+
+
+@pytest.mark.parametrize("vazas, mao, vencedor", [
+    ([1, 1], 1, 1),
+    ([2, 1], 1, None),
+    ([2, 1, 2], 1, 2),
+    # Parda na primeira: vence quem ganhar a próxima vaza
+    ([0, 2], 1, 2),
+    ([0, 0, 1], 2, 1),
+    # Parda na segunda ou terceira: vence quem ganhou a primeira
+    ([1, 0], 2, 1),
+    ([2, 1, 0], 1, 2),
+    # Três pardas: vence o mão
+    ([0, 0, 0], 2, 2),
+    ([0, 0], 1, None),
+])
+def test_verificar_ganhador_mao_regras_parda_RN03(vazas, mao, vencedor):
+    """Testa (RN03): o vencedor da mão considera as vazas pardas registradas."""
+    jogo = Jogo()
+    jogo.rodadas = vazas
+    assert jogo.verificar_ganhador_mao(mao) == vencedor
+
+
+def test_adicionar_rodada_registra_parda(cenario_rodadas):
+    """Uma parda não dá rodada a nenhum jogador, mas fica registrada nas vazas da mão."""
+    jogo, j1, j2, _, _ = cenario_rodadas
+    c1, c2 = Carta(3, "COPAS"), Carta(3, "BASTOS")
+
+    ganhador = jogo.verificar_carta_vencedora(c1, c2)
+    retorno = jogo.adicionar_rodada(j1, j2, c1, c2, ganhador)
+
+    assert ganhador == "Empate"
+    assert retorno == 0
+    assert j1.rodadas == 0 and j2.rodadas == 0
+    assert jogo.rodadas == [0]
+
+    jogo.resetar()
+    assert jogo.rodadas == []
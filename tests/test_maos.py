@@ -0,0 +1,159 @@
+import itertools
+import numpy as np
+import pytest
+from truco.carta import Carta, CARTAS
+from truco.baralho import Baralho
+from truco.maos import classificar_maos, RANKS, TOTAL_MAOS, MAOS, indice_mao, mao_do_indice, indices_maos, maos_dos_indices
+from truco.maos import ENVIDO_MAOS, FLOR_MAOS, PONTOS_FLOR_MAOS, avaliar_envido_flor, calcular_envido, envido_flor_maos
+from truco.maos import QUALIDADE_MAOS, qualidade_mao, qualidade_maos, qualidade_pontos
+from truco.jogador import Jogador
+from truco.bot import Bot
+
+
+def test_classificar_maos_coincide_com_classificar_carta():
+    """A versão vetorizada deve produzir exatamente o resultado de Carta.classificar_carta, inclusive em empates."""
+    ids_maos = np.array(list(itertools.permutations(range(40), 3)))
+    pontos, ranks = classificar_maos(ids_maos)
+
+    rotulos = np.array(RANKS)
+    for i in range(0, len(ids_maos), 97):
+        mao = [CARTAS[id] for id in ids_maos[i]]
+        lista_pontos, lista_classificacao = mao[0].classificar_carta(mao)
+        assert pontos[i].tolist() == lista_pontos
+        assert rotulos[ranks[i]].tolist() == lista_classificacao
+
+
+def test_classificar_maos_formato_da_saida():
+    """Recebe (N, 3) ids e retorna dois arrays (N, 3)."""
+    mao = [Carta(1, "ESPADAS"), Carta(4, "COPAS"), Carta(3, "OUROS")]
+    pontos, ranks = classificar_maos([[carta.id for carta in mao]])
+
+    assert pontos.shape == ranks.shape == (1, 3)
+    assert pontos.tolist() == [[52, 1, 24]]
+    assert [RANKS[r] for r in ranks[0]] == ['Alta', 'Baixa', 'Media']
+
+
+def test_indice_mao_e_uma_bijecao_sobre_todas_as_maos():
+    """Cada uma das C(40, 3) mãos recebe um índice único em [0, 9880), e o caminho inverso devolve a mesma mão."""
+    assert TOTAL_MAOS == 9880
+    indices = [indice_mao(mao) for mao in itertools.combinations(range(40), 3)]
+    assert sorted(indices) == list(range(TOTAL_MAOS))
+    for indice in (0, 1, 4321, TOTAL_MAOS - 1):
+        assert indice_mao(mao_do_indice(indice)) == indice
+
+
+def test_indice_mao_independe_da_ordem_das_cartas():
+    """A mão é um conjunto: a ordem das cartas não altera o índice."""
+    baralho = Baralho()
+    baralho.embaralhar()
+    ids = [baralho.retirar_carta().id for _ in range(3)]
+    assert indice_mao(ids) == indice_mao(ids[::-1]) == indice_mao(sorted(ids))
+
+
+def test_indices_em_lote_coincidem_com_a_versao_escalar():
+    """As versões vetorizadas aceitam lotes (N, 3) em qualquer ordem de cartas."""
+    rng = np.random.default_rng(7)
+    ids_maos = np.array([rng.permutation(40)[:3] for _ in range(200)])
+    indices = indices_maos(ids_maos)
+
+    assert indices.tolist() == [indice_mao(mao) for mao in ids_maos.tolist()]
+    assert np.array_equal(maos_dos_indices(indices), np.sort(ids_maos, axis=1))
+    assert np.array_equal(maos_dos_indices(np.arange(TOTAL_MAOS)), MAOS)
+
+
+def envido_por_pares(mao):
+    """Referência: o cálculo par a par original de Jogador.calcula_envido."""
+    pontos_envido = []
+    for i, j in itertools.combinations(range(len(mao)), 2):
+        pontos_i, pontos_j = mao[0].retornar_pontos_envido(mao[i]), mao[0].retornar_pontos_envido(mao[j])
+        if mao[i].naipe == mao[j].naipe:
+            pontos_envido.append(20 + pontos_i + pontos_j if pontos_i > 0 and pontos_j > 0 else 0)
+        else:
+            pontos_envido.append(max(pontos_i, pontos_j))
+    return max(pontos_envido)
+
+
+def test_tabela_de_envido_e_flor_coincide_com_o_calculo_por_pares():
+    """A tabela reproduz o envido par a par e a flor para todas as 9880 mãos."""
+    for indice, ids in enumerate(MAOS.tolist()):
+        mao = [CARTAS[id] for id in ids]
+        assert ENVIDO_MAOS[indice] == envido_por_pares(mao)
+        assert FLOR_MAOS[indice] == all(carta.naipe == mao[0].naipe for carta in mao)
+
+
+@pytest.mark.parametrize("mao, envido, flor, pontos_flor", [
+    ([Carta(7, "ESPADAS"), Carta(6, "ESPADAS"), Carta(1, "OUROS")], 33, False, 0),
+    ([Carta(7, "COPAS"), Carta(6, "COPAS"), Carta(5, "COPAS")], 33, True, 38),
+    ([Carta(10, "BASTOS"), Carta(11, "BASTOS"), Carta(4, "BASTOS")], 0, True, 24),
+    ([Carta(10, "OUROS"), Carta(12, "ESPADAS"), Carta(11, "COPAS")], 0, False, 0),
+])
+def test_avaliar_envido_flor_valores_conhecidos(mao, envido, flor, pontos_flor):
+    """Envido, flor e pontos de flor de mãos conhecidas, em qualquer ordem das cartas."""
+    assert avaliar_envido_flor(mao) == (envido, flor, pontos_flor)
+    assert avaliar_envido_flor(mao[::-1]) == (envido, flor, pontos_flor)
+
+
+def test_calcular_envido_com_mao_incompleta_usa_o_calculo_por_pares():
+    """Mãos que não têm 3 cartas do baralho não estão na tabela, mas o resultado é o mesmo critério."""
+    mao = [Carta(7, "ESPADAS"), Carta(5, "ESPADAS")]
+    assert calcular_envido(mao) == envido_por_pares(mao) == 32
+
+
+def test_envido_flor_maos_em_lote():
+    """A consulta em lote coincide com a escalar."""
+    ids_maos = np.array([[0, 1, 2], [16, 15, 34], [39, 20, 21]])
+    envido, flor, pontos_flor = envido_flor_maos(ids_maos)
+
+    for i, ids in enumerate(ids_maos):
+        assert (envido[i], flor[i], pontos_flor[i]) == avaliar_envido_flor([CARTAS[id] for id in ids])
+
+
+@pytest.mark.parametrize("classe", [Jogador, Bot])
+def test_receber_mao_preenche_envido_e_pontos_de_flor(classe):
+    """Jogador e Bot consultam a tabela ao receber a mão."""
+    jogador = classe("Teste")
+    jogador.receber_mao([Carta(7, "COPAS"), Carta(6, "COPAS"), Carta(5, "COPAS")])
+
+    assert jogador.envido == 33
+    assert jogador.pontos_flor == 38
+    assert jogador.checa_flor() is True
+
+
+def test_tabela_de_qualidade_coincide_com_calcular_qualidade_mao():
+    """A tabela reproduz exatamente a média harmônica original do Bot para todas as mãos com carta Alta definida."""
+    bot = Bot("Bot")
+    for indice, ids in enumerate(MAOS.tolist()):
+        mao = [CARTAS[id] for id in ids]
+        pontuacao, ranks = mao[0].classificar_carta(mao)
+        if "Alta" not in ranks:
+            continue
+        alta, media, baixa = (pontuacao[ranks.index(rank)] for rank in ("Alta", "Media", "Baixa"))
+        original = ((2 * (2 / ((1 / alta) + (1 / media)))) + ((2 * media) + baixa / 2 + 1)) / (2 + 1)
+        bot.calcular_qualidade_mao(pontuacao, ranks)
+        assert bot.qualidade_mao == original == QUALIDADE_MAOS[indice]
+
+
+def test_qualidade_definida_para_trinca_de_mesmos_pontos():
+    """Três cartas de mesmos pontos não têm carta Alta em classificar_carta, mas têm qualidade na tabela."""
+    mao = [Carta(2, "ESPADAS"), Carta(2, "OUROS"), Carta(2, "COPAS")]
+    pontos = mao[0].retornar_pontos_carta(mao[0])
+    assert qualidade_mao(mao) == qualidade_pontos(pontos, pontos, pontos)
+
+
+def test_qualidade_em_lote_e_a_partir_dos_pontos():
+    """A consulta por ids e o cálculo pelas colunas de pontos da base de casos dão o mesmo valor."""
+    ids_maos = MAOS[::7]
+    pontos = np.sort(classificar_maos(ids_maos)[0], axis=1)
+    por_pontos = qualidade_pontos(pontos[:, 2], pontos[:, 1], pontos[:, 0])
+
+    assert qualidade_maos(ids_maos).dtype == np.float64
+    assert np.array_equal(qualidade_maos(ids_maos), por_pontos)
+
+
+def test_bot_receber_mao_usa_a_tabela_de_qualidade():
+    """O Bot consulta a qualidade da mão na tabela ao receber as cartas."""
+    mao = [Carta(1, "ESPADAS"), Carta(3, "OUROS"), Carta(4, "COPAS")]
+    bot = Bot("Bot")
+    bot.receber_mao(mao)
+
+    assert bot.qualidade_mao == QUALIDADE_MAOS[indice_mao([carta.id for carta in mao])]
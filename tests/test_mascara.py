@@ -0,0 +1,56 @@
+import itertools
+import pytest
+from truco.carta import Carta, CARTAS
+from truco.jogador import Jogador
+from truco.mascara import (
+    mao_para_bits, bits_para_mao, contar_cartas, tem_carta, remover_carta,
+    tem_naipe, tem_flor, calcular_envido_bits, carta_mais_alta,
+)
+
+
+def test_conversao_ida_e_volta_com_a_lista_da_mao():
+    """A máscara preserva as cartas da mão (devolvidas em ordem de id)."""
+    mao = [Carta(7, "OUROS"), Carta(1, "ESPADAS"), Carta(12, "BASTOS")]
+    bits = mao_para_bits(mao)
+
+    assert contar_cartas(bits) == 3
+    assert bits_para_mao(bits) == sorted(mao, key=lambda carta: carta.id)
+
+
+def test_remover_carta_e_consultar_naipe():
+    """Remover uma carta limpa apenas o seu bit."""
+    bits = mao_para_bits([Carta(7, "OUROS"), Carta(1, "ESPADAS"), Carta(12, "BASTOS")])
+    bits = remover_carta(bits, Carta(1, "ESPADAS"))
+
+    assert not tem_carta(bits, Carta(1, "ESPADAS"))
+    assert tem_carta(bits, Carta(7, "OUROS"))
+    assert not tem_naipe(bits, "ESPADAS")
+    assert tem_naipe(bits, "BASTOS")
+    assert not tem_naipe(bits, "COPAS")
+
+
+@pytest.mark.parametrize("mao, flor", [
+    ([Carta(1, "COPAS"), Carta(5, "COPAS"), Carta(12, "COPAS")], True),
+    ([Carta(1, "COPAS"), Carta(5, "COPAS"), Carta(12, "ESPADAS")], False),
+    ([Carta(1, "COPAS"), Carta(5, "COPAS")], False),
+])
+def test_tem_flor(mao, flor):
+    """Flor exige três cartas do mesmo naipe (RN09)."""
+    assert tem_flor(mao_para_bits(mao)) is flor
+
+
+def test_envido_e_flor_coincidem_com_o_jogador_em_todas_as_maos():
+    """Para todas as 9880 mãos, a máscara dá o mesmo envido e flor que o Jogador."""
+    jogador = Jogador("Teste")
+    for mao in itertools.combinations(CARTAS, 3):
+        jogador.mao = list(mao)
+        bits = mao_para_bits(mao)
+        assert calcular_envido_bits(bits) == jogador.calcula_envido(jogador.mao)
+        assert tem_flor(bits) == jogador.checa_flor()
+
+
+def test_carta_mais_alta():
+    """A carta mais alta considera as manilhas."""
+    mao = [Carta(3, "COPAS"), Carta(7, "OUROS"), Carta(2, "BASTOS")]
+    assert carta_mais_alta(mao_para_bits(mao)) is Carta(7, "OUROS")
+    assert carta_mais_alta(0) is None
@@ -0,0 +1,412 @@
+import copy
+import random
+import pytest
+from truco.carta import Carta
+from truco.motor import Motor, EstadoJogo, TAMANHO_ESTADO, SEM_CARTA, PEDIDO_TRUCO, PEDIDO_ENVIDO, PEDIDO_FLOR
+from truco.motor import JOGAR_CARTA_1, JOGAR_CARTA_2, JOGAR_CARTA_3, TRUCO, FLOR, ENVIDO, REAL_ENVIDO, FALTA_ENVIDO
+from truco.zobrist import chave_estado
+from truco.motor import IR_AO_BARALHO, QUERO, NAO_QUERO, ACOES_MASCARA, mascara_acoes_legais, mascara_vez
+
+
+def ids(*cartas):
+    """Converte (numero, naipe) em ids de cartas."""
+    return [Carta(numero, naipe).id for numero, naipe in cartas]
+
+
+# Mão 1: 1 de ESPADAS, 7 de ESPADAS e 3 de COPAS (envido 28); mão 2: 4 de OUROS, 5 de BASTOS e 6 de COPAS (envido 6)
+MAO_FORTE = ids((1, "ESPADAS"), (7, "ESPADAS"), (3, "COPAS"))
+MAO_FRACA = ids((4, "OUROS"), (5, "BASTOS"), (6, "COPAS"))
+
+
+@pytest.fixture
+def motor():
+    """Motor com uma mão fixa em que o jogador 1 é mão, com a mão forte."""
+    motor = Motor(random.Random(0))
+    motor.nova_partida()
+    motor.nova_mao(maos=[MAO_FORTE, MAO_FRACA])
+    motor.nova_mao(maos=[MAO_FORTE, MAO_FRACA])
+    return motor
+
+
+def aplicar(motor, *acoes):
+    """Aplica as ações em sequência e retorna o estado."""
+    for acao in acoes:
+        motor.aplicar(acao)
+    return motor.estado
+
+
+def test_nova_partida_distribui_seis_cartas_distintas_e_jogador_1_e_mao():
+    """A primeira mão tem seis cartas distintas e o jogador 1 abre a primeira vaza."""
+    motor = Motor(random.Random(1))
+    estado = motor.nova_partida()
+
+    cartas = estado.maos[0] + estado.maos[1]
+    assert len(set(cartas)) == 6 and SEM_CARTA not in cartas
+    assert estado.jogador_mao == 1 and estado.vez == 1
+    assert estado.pontos == [0, 0]
+
+
+def test_nova_mao_alterna_quem_e_mao_RN11():
+    """Testa (RN11): quem é mão alterna a cada mão."""
+    motor = Motor(random.Random(2))
+    motor.nova_partida()
+
+    assert [motor.nova_mao().jogador_mao for _ in range(4)] == [2, 1, 2, 1]
+
+
+def test_vencer_duas_vazas_concede_a_aposta_RN04(motor):
+    """Testa (RN04): vencer duas vazas encerra a mão e dá os pontos da aposta."""
+    estado = aplicar(motor, JOGAR_CARTA_1, JOGAR_CARTA_1)
+    assert estado.vazas == [1] and estado.vez == 1
+
+    aplicar(motor, JOGAR_CARTA_2, JOGAR_CARTA_2)
+    assert estado.vencedor_mao == 1
+    assert estado.pontos == [1, 0]
+    assert motor.acoes_legais() == ()
+
+
+def test_vencedor_da_vaza_abre_a_proxima_UC01(motor):
+    """Testa (UC-01): quem vence a vaza joga primeiro na próxima."""
+    estado = aplicar(motor, JOGAR_CARTA_3, JOGAR_CARTA_1)
+    # 3 de COPAS vence 4 de OUROS: jogador 1 continua abrindo
+    assert estado.vazas == [1] and estado.vez == 1
+
+    aplicar(motor, JOGAR_CARTA_1, JOGAR_CARTA_2)
+    assert estado.vencedor_mao == 1
+
+
+def test_tres_pardas_o_mao_vence_RN03():
+    """Testa (RN03): se as três vazas forem pardas, vence quem é mão."""
+    motor = Motor()
+    motor.nova_mao(maos=[ids((4, "ESPADAS"), (5, "ESPADAS"), (6, "OUROS")), ids((4, "COPAS"), (5, "BASTOS"), (6, "BASTOS"))])
+    estado = aplicar(motor, JOGAR_CARTA_1, JOGAR_CARTA_1, JOGAR_CARTA_2, JOGAR_CARTA_2, JOGAR_CARTA_3, JOGAR_CARTA_3)
+
+    assert estado.vazas == [0, 0, 0]
+    assert estado.vencedor_mao == 1 and estado.pontos == [1, 0]
+
+
+def test_parda_mantem_quem_abriu_a_vaza():
+    """Em uma parda, quem abriu a vaza continua abrindo a próxima."""
+    motor = Motor()
+    motor.nova_mao(maos=[ids((4, "ESPADAS"), (5, "ESPADAS"), (6, "OUROS")), ids((4, "COPAS"), (5, "BASTOS"), (6, "BASTOS"))])
+    estado = aplicar(motor, JOGAR_CARTA_1, JOGAR_CARTA_1)
+
+    assert estado.vazas == [0] and estado.vez == 1
+
+
+def test_truco_aceito_vale_dois_pontos(motor):
+    """Truco aceito: a mão passa a valer 2 pontos e a vez volta a quem pediu."""
+    estado = aplicar(motor, TRUCO)
+    assert estado.pedido == PEDIDO_TRUCO and estado.vez == 2
+
+    aplicar(motor, QUERO)
+    assert estado.valor_aposta == 2 and estado.vez == 1
+    assert TRUCO not in motor.acoes_legais()
+
+    aplicar(motor, JOGAR_CARTA_1, JOGAR_CARTA_1, JOGAR_CARTA_2, JOGAR_CARTA_2)
+    assert estado.pontos == [2, 0]
+
+
+def test_truco_recusado_da_a_aposta_anterior_a_quem_pediu(motor):
+    """Truco recusado: quem pediu vence a mão com o valor anterior ao pedido."""
+    estado = aplicar(motor, JOGAR_CARTA_1, TRUCO, NAO_QUERO)
+
+    assert estado.vencedor_mao == 2 and estado.pontos == [0, 1]
+
+
+def test_retruco_e_vale_quatro_alternam_quem_pode_aumentar(motor):
+    """Cada aumento aceita o pedido anterior; o último a aumentar não pode aumentar de novo."""
+    estado = aplicar(motor, TRUCO, TRUCO)
+    assert estado.valor_aposta == 2 and estado.valor_pedido == 3 and estado.vez == 1
+
+    aplicar(motor, TRUCO)
+    assert estado.valor_pedido == 4 and TRUCO not in motor.acoes_legais()
+
+    aplicar(motor, NAO_QUERO)
+    assert estado.vencedor_mao == 1 and estado.pontos == [3, 0]
+
+
+def test_envido_aceito_vence_o_maior_envido(motor):
+    """Envido aceito vale 2 pontos para quem tem mais pontos de envido."""
+    estado = aplicar(motor, JOGAR_CARTA_1, ENVIDO)
+    assert estado.pedido == PEDIDO_ENVIDO and estado.vez == 1
+
+    aplicar(motor, QUERO)
+    assert estado.vencedor_envido == 1 and estado.pontos == [2, 0]
+    assert estado.vez == 2 and estado.envido_fechado
+
+
+def test_envido_recusado_da_um_ponto_a_quem_pediu(motor):
+    """Envido recusado vale 1 ponto para quem pediu, e não pode ser pedido de novo."""
+    estado = aplicar(motor, ENVIDO, NAO_QUERO)
+
+    assert estado.vencedor_envido == 1 and estado.pontos == [1, 0]
+    assert ENVIDO not in motor.acoes_legais()
+
+
+def test_empate_no_envido_vence_quem_e_mao():
+    """Com o mesmo envido, vence quem é mão; o Real Envido aceito vale 3 pontos (RN10)."""
+    motor = Motor()
+    motor.nova_mao(maos=[ids((4, "ESPADAS"), (1, "OUROS"), (12, "COPAS")), ids((4, "OUROS"), (1, "COPAS"), (12, "BASTOS"))])
+    estado = aplicar(motor, REAL_ENVIDO, QUERO)
+
+    assert estado.envido == [4, 4]
+    assert estado.vencedor_envido == 1 and estado.pontos == [3, 0]
+
+
+def test_falta_envido_vale_o_que_falta_para_quem_esta_ganhando(motor):
+    """Falta envido vale a diferença entre a pontuação de vitória e a de quem está ganhando."""
+    motor.estado.pontos = [3, 7]
+    estado = aplicar(motor, ENVIDO, FALTA_ENVIDO, QUERO)
+
+    assert estado.vencedor_envido == 1 and estado.pontos == [3 + 5, 7]
+
+
+def test_aumentos_do_envido_somam_os_pontos_aceitos(motor):
+    """Envido e Real Envido aceitos valem 2 + 3 pontos; recusar o aumento entrega os 2 do envido já aceito."""
+    estado = aplicar(motor, ENVIDO, REAL_ENVIDO)
+    assert estado.valor_envido == 2 and estado.quem_pediu == 2
+
+    motor.empilhar(QUERO)
+    assert estado.vencedor_envido == 1 and estado.pontos == [5, 0]
+    motor.desempilhar()
+
+    aplicar(motor, NAO_QUERO)
+    assert estado.vencedor_envido == 2 and estado.pontos == [0, 2]
+
+
+def test_recusar_o_primeiro_pedido_entrega_os_pontos_do_tipo(motor):
+    """Sem aumento, o Real Envido recusado vale 2 pontos para quem pediu."""
+    estado = aplicar(motor, REAL_ENVIDO, NAO_QUERO)
+
+    assert estado.valor_envido == 0 and estado.pontos == [2, 0]
+
+
+def test_envido_so_na_primeira_vaza(motor):
+    """Depois da primeira vaza o envido não pode mais ser pedido."""
+    aplicar(motor, JOGAR_CARTA_1, JOGAR_CARTA_1)
+
+    assert not {ENVIDO, REAL_ENVIDO, FALTA_ENVIDO} & set(motor.acoes_legais())
+
+
+def test_flor_sem_flor_do_oponente_vale_tres_pontos():
+    """Quem tem flor e canta sozinho ganha 3 pontos, e o envido é fechado."""
+    motor = Motor()
+    motor.nova_mao(maos=[ids((1, "COPAS"), (5, "COPAS"), (7, "COPAS")), MAO_FRACA])
+    assert FLOR in motor.acoes_legais()
+
+    estado = aplicar(motor, FLOR)
+    assert estado.vencedor_flor == 1 and estado.pontos == [3, 0]
+    assert estado.vez == 1 and ENVIDO not in motor.acoes_legais()
+
+
+@pytest.mark.parametrize("resposta, pontos", [(QUERO, [0, 6]), (NAO_QUERO, [4, 0])])
+def test_contraflor_quando_os_dois_tem_flor(resposta, pontos):
+    """Com flor dos dois lados, o oponente aceita a contraflor (6 pontos ao maior) ou recusa (4 para quem cantou)."""
+    motor = Motor()
+    motor.nova_mao(maos=[ids((4, "COPAS"), (5, "COPAS"), (10, "COPAS")), ids((5, "OUROS"), (6, "OUROS"), (7, "OUROS"))])
+    estado = aplicar(motor, FLOR)
+    assert estado.pedido == PEDIDO_FLOR and estado.vez == 2
+
+    aplicar(motor, resposta)
+    assert estado.pontos == pontos
+
+
+def test_flor_em_resposta_ao_envido():
+    """Quem tem flor pode responder ao envido com a flor, que anula o envido."""
+    motor = Motor()
+    motor.nova_mao(maos=[MAO_FRACA, ids((1, "COPAS"), (5, "COPAS"), (7, "COPAS"))])
+    estado = aplicar(motor, ENVIDO)
+    assert FLOR in motor.acoes_legais()
+
+    aplicar(motor, FLOR)
+    assert estado.vencedor_flor == 2 and estado.vencedor_envido == 0
+    assert estado.pontos == [0, 3] and estado.vez == 1
+
+
+def test_ir_ao_baralho_da_a_aposta_ao_oponente(motor):
+    """Testa (RN01): ir ao baralho entrega os pontos da aposta ao oponente."""
+    estado = aplicar(motor, TRUCO, QUERO, IR_AO_BARALHO)
+
+    assert estado.vencedor_mao == 2 and estado.pontos == [0, 2]
+
+
+def test_acao_ilegal_levanta_excecao(motor):
+    """Ações fora das legais levantam ValueError sem alterar o estado."""
+    with pytest.raises(ValueError):
+        motor.aplicar(QUERO)
+
+    aplicar(motor, JOGAR_CARTA_1)
+    with pytest.raises(ValueError):
+        motor.aplicar(JOGAR_CARTA_1 + 20)
+    assert motor.estado.jogadas == [(1, MAO_FORTE[0])]
+
+
+def test_mascara_das_acoes_legais(motor):
+    """A máscara tem um bit por ação legal e corresponde à tupla de acoes_legais."""
+    assert motor.mascara_legal() == 0b1111010111 == mascara_vez(0b111, True, False, True)
+    assert motor.acoes_legais() == (JOGAR_CARTA_1, JOGAR_CARTA_2, JOGAR_CARTA_3, TRUCO, ENVIDO, REAL_ENVIDO, FALTA_ENVIDO, IR_AO_BARALHO)
+
+    aplicar(motor, ENVIDO)
+    assert motor.acoes_legais() == (REAL_ENVIDO, FALTA_ENVIDO, QUERO, NAO_QUERO)
+
+
+def test_acoes_fora_da_mascara_sao_recusadas():
+    """Em partidas aleatórias, toda ação fora da máscara levanta ValueError e toda ação da máscara é aceita."""
+    escolhas = random.Random(11)
+    motor = Motor(random.Random(11))
+    for _ in range(20):
+        estado = motor.nova_partida()
+        while not estado.vencedor:
+            mascara = mascara_acoes_legais(estado)
+            assert ACOES_MASCARA[mascara] == motor.acoes_legais()
+            for acao in range(NAO_QUERO + 1):
+                if not mascara >> acao & 1:
+                    with pytest.raises(ValueError):
+                        motor.aplicar(acao)
+
+            motor.aplicar(escolhas.choice(motor.acoes_legais()))
+            if estado.vencedor_mao and not estado.vencedor:
+                motor.nova_mao()
+
+
+def retrato(estado):
+    """Cópia de todos os atributos do estado, para comparação."""
+    return {nome: copy.deepcopy(getattr(estado, nome)) for nome in EstadoJogo.__slots__}
+
+
+def test_desempilhar_restaura_o_estado_em_toda_a_arvore(motor):
+    """Percorre a árvore de jogadas até a profundidade 6, desfazendo cada ação: o estado volta a ser idêntico."""
+    visitados = 0
+
+    def percorrer(profundidade):
+        nonlocal visitados
+        visitados += 1
+        if profundidade == 0:
+            return
+        antes = retrato(motor.estado)
+        for acao in motor.acoes_legais():
+            motor.empilhar(acao)
+            percorrer(profundidade - 1)
+            assert motor.desempilhar() == acao
+            assert retrato(motor.estado) == antes
+            assert motor.acoes_legais() == ACOES_MASCARA[mascara_acoes_legais(motor.estado)]
+
+    percorrer(6)
+    assert visitados > 1000
+
+
+def test_desempilhar_desfaz_fim_de_mao_e_pontos(motor):
+    """Desfazer a jogada que encerra a mão devolve a carta, a vaza e os pontos."""
+    motor.estado.pontos = [10, 0]
+    aplicar(motor, TRUCO, QUERO, JOGAR_CARTA_1, JOGAR_CARTA_1, JOGAR_CARTA_2)
+    antes = retrato(motor.estado)
+
+    motor.empilhar(JOGAR_CARTA_2)
+    assert motor.estado.vencedor == 1
+    motor.desempilhar()
+
+    assert retrato(motor.estado) == antes
+    assert motor.acoes_legais() == (JOGAR_CARTA_2, JOGAR_CARTA_3, TRUCO, IR_AO_BARALHO)
+
+
+def test_empilhar_acao_ilegal_nao_altera_a_pilha(motor):
+    """Uma ação ilegal levanta ValueError sem deixar registro na pilha."""
+    with pytest.raises(ValueError):
+        motor.empilhar(QUERO)
+
+    motor.empilhar(JOGAR_CARTA_1)
+    motor.desempilhar()
+    with pytest.raises(IndexError):
+        motor.desempilhar()
+
+
+def test_serializar_e_restaurar_durante_partidas_aleatorias():
+    """Em qualquer ponto da partida, o estado codificado tem tamanho fixo e volta idêntico."""
+    escolhas = random.Random(5)
+    motor = Motor(random.Random(5))
+    for _ in range(20):
+        estado = motor.nova_partida()
+        while not estado.vencedor:
+            dados = estado.serializar()
+            assert len(dados) == TAMANHO_ESTADO
+            assert retrato(EstadoJogo.desserializar(dados)) == retrato(estado)
+
+            motor.aplicar(escolhas.choice(motor.acoes_legais()))
+            if estado.vencedor_mao and not estado.vencedor:
+                motor.nova_mao()
+
+
+def test_restaurar_continua_a_partida_do_ponto_salvo(motor):
+    """Um motor restaurado a partir dos bytes segue a partida como o original."""
+    aplicar(motor, JOGAR_CARTA_1, ENVIDO)
+    outro = Motor()
+    estado = outro.restaurar(motor.estado.serializar())
+
+    assert outro.acoes_legais() == motor.acoes_legais()
+    aplicar(outro, QUERO, JOGAR_CARTA_1)
+    aplicar(motor, QUERO, JOGAR_CARTA_1)
+    assert retrato(estado) == retrato(motor.estado)
+
+
+def test_chave_incremental_igual_a_calculada_do_zero():
+    """A chave mantida pelo motor é a mesma calculada do zero em todos os estados, inclusive ao desfazer."""
+    escolhas = random.Random(9)
+    motor = Motor(random.Random(9))
+    for _ in range(20):
+        estado = motor.nova_partida()
+        while not estado.vencedor:
+            chave = motor.chave()
+            assert chave == chave_estado(estado)
+            acao = escolhas.choice(motor.acoes_legais())
+            motor.empilhar(acao)
+            assert motor.chave() == chave_estado(estado)
+            motor.desempilhar()
+            assert motor.chave() == chave
+
+            motor.aplicar(acao)
+            if estado.vencedor_mao and not estado.vencedor:
+                motor.nova_mao()
+
+
+def test_transposicao_tem_a_mesma_chave(motor):
+    """Caminhos diferentes para o mesmo estado (envido recusado antes ou depois do truco) dão a mesma chave."""
+    outro = Motor()
+    outro.nova_mao(maos=[MAO_FORTE, MAO_FRACA])
+    inicial = motor.chave()
+    assert outro.chave() == inicial
+
+    aplicar(motor, ENVIDO, NAO_QUERO, TRUCO, QUERO)
+    aplicar(outro, TRUCO, QUERO, ENVIDO, NAO_QUERO)
+    assert motor.chave() == outro.chave() != inicial
+
+    aplicar(motor, JOGAR_CARTA_1)
+    assert motor.chave() != outro.chave()
+
+
+def test_partida_termina_ao_chegar_a_12_pontos(motor):
+    """A partida termina quando um jogador chega aos 12 pontos."""
+    motor.estado.pontos = [10, 0]
+    estado = aplicar(motor, TRUCO, QUERO, JOGAR_CARTA_1, JOGAR_CARTA_1, JOGAR_CARTA_2, JOGAR_CARTA_2)
+
+    assert estado.vencedor == 1 and estado.pontos == [12, 0]
+
+
+def test_motor_nao_usa_entrada_nem_saida(monkeypatch, capsys):
+    """Partidas inteiras com escolhas aleatórias, sem ler do teclado nem escrever na tela."""
+    def sem_input(*args):
+        raise AssertionError("o motor não deve ler da entrada")
+
+    monkeypatch.setattr("builtins.input", sem_input)
+    escolhas = random.Random(7)
+    motor = Motor(random.Random(7))
+    for _ in range(50):
+        estado = motor.nova_partida()
+        while not estado.vencedor:
+            while not estado.vencedor_mao:
+                motor.aplicar(escolhas.choice(motor.acoes_legais()))
+            if not estado.vencedor:
+                motor.nova_mao()
+        assert max(estado.pontos) >= 12
+
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,113 @@
+import random
+import pytest
+from truco.bot import Bot
+from truco.carta import Carta
+from truco.cbr import Cbr
+from truco.dados import Dados
+from truco.flor import Flor
+from truco.motor import Motor, JOGAR_CARTA_1, JOGAR_CARTA_2, TRUCO, ENVIDO, REAL_ENVIDO, FALTA_ENVIDO, QUERO, NAO_QUERO
+from truco.politicas import Politica, PoliticaHumana, PoliticaAleatoria, PoliticaRoteirizada, PoliticaCbr, jogar_partida
+
+# Mão 1: 1 de ESPADAS, 7 de ESPADAS e 3 de COPAS; mão 2: 4 de OUROS, 5 de BASTOS e 6 de COPAS
+MAO_FORTE = [Carta(1, "ESPADAS").id, Carta(7, "ESPADAS").id, Carta(3, "COPAS").id]
+MAO_FRACA = [Carta(4, "OUROS").id, Carta(5, "BASTOS").id, Carta(6, "COPAS").id]
+
+
+def test_partida_entre_politicas_aleatorias_sem_terminal(monkeypatch, capsys):
+    """Duas políticas aleatórias jogam partidas inteiras sem ler do teclado nem escrever na tela."""
+    def sem_input(*args):
+        raise AssertionError("nenhuma política deve ler da entrada")
+
+    monkeypatch.setattr("builtins.input", sem_input)
+    motor = Motor(random.Random(3))
+    for semente in range(20):
+        vencedor = jogar_partida(motor, [PoliticaAleatoria(semente), PoliticaAleatoria(semente + 100)])
+        assert motor.estado.pontos[vencedor - 1] >= 12
+
+    assert capsys.readouterr().out == ""
+
+
+def test_politica_roteirizada_segue_o_roteiro():
+    """A política roteirizada devolve as ações na ordem e recusa ações que não são legais."""
+    motor = Motor()
+    motor.nova_mao(maos=[MAO_FORTE, MAO_FRACA])
+    politicas = [PoliticaRoteirizada([TRUCO, JOGAR_CARTA_1, JOGAR_CARTA_2]), PoliticaRoteirizada([QUERO, JOGAR_CARTA_1, JOGAR_CARTA_2])]
+
+    while not motor.estado.vencedor_mao:
+        motor.aplicar(politicas[motor.estado.vez - 1].decidir(motor))
+    assert motor.estado.pontos == [2, 0]
+
+    motor.nova_mao(maos=[MAO_FORTE, MAO_FRACA])
+    with pytest.raises(ValueError):
+        PoliticaRoteirizada([QUERO]).decidir(motor)
+
+
+def test_politica_humana_numera_respostas_como_os_pedidos():
+    """O menu de respostas segue a numeração [0] Recusar, [1] Aceitar, [2] aumento, qualquer que seja a ordem das opções."""
+    politica = PoliticaHumana(entrada=lambda _: '2')
+
+    assert politica.responder_truco(1, 2, [TRUCO, QUERO, NAO_QUERO]) == TRUCO
+    assert politica.responder_envido(1, ENVIDO, [FALTA_ENVIDO, QUERO, NAO_QUERO, REAL_ENVIDO]) == REAL_ENVIDO
+
+
+def test_politica_humana_insistente_repete_entradas_nao_numericas(capsys):
+    """Com 'insistir', entradas não numéricas repetem a pergunta em vez de levantar ValueError."""
+    entradas = iter(['abc', '5', '1'])
+    politica = PoliticaHumana('Ana', entrada=lambda _: next(entradas), insistir=True)
+
+    assert politica.responder_truco(1, 2, [NAO_QUERO, QUERO]) == QUERO
+    assert capsys.readouterr().out.count('Selecione um valor válido!') == 2
+
+
+def test_truco_consulta_a_politica_do_jogador(cenario_truco, monkeypatch):
+    """O Truco pergunta à política do Jogador 1 em vez de ler do teclado."""
+    truco, j1, j2, cbr, dados = cenario_truco
+    truco.politica = PoliticaRoteirizada([NAO_QUERO])
+    monkeypatch.setattr("builtins.input", lambda _: pytest.fail("não deve ler da entrada"))
+
+    assert truco.controlador_truco(cbr, dados, 2, j1, j2) is False
+    assert j2.pontos == 1
+
+
+def test_flor_consulta_a_politica_do_jogador():
+    """A decisão do Jogador 1 sobre a contraflor vem da política."""
+    assert Flor(PoliticaRoteirizada([QUERO])).decisao_jogador() is True
+    assert Flor(PoliticaRoteirizada([NAO_QUERO])).decisao_jogador() is False
+
+
+@pytest.mark.parametrize("escolha, acao", [(0, NAO_QUERO), (1, QUERO), (2, TRUCO)])
+def test_politica_cbr_traduz_respostas_do_bot(monkeypatch, escolha, acao):
+    """As respostas do Bot ao truco (0, 1 e 2) viram as ações correspondentes do motor."""
+    monkeypatch.setattr(Bot, 'avaliar_truco', lambda *args: escolha)
+    motor = Motor()
+    motor.nova_mao(maos=[MAO_FORTE, MAO_FRACA])
+    politica = PoliticaCbr(Bot("Bot"), None, None)
+    politica.iniciar_mao(motor.estado, 2)
+    motor.aplicar(TRUCO)
+
+    assert politica.decidir(motor) == acao
+
+
+def test_politica_cbr_com_tres_cartas_de_mesmos_pontos(casos_cbr):
+    """Com três 12 na mão, o Bot e a base de casos de verdade registram a mão sem faltar a carta Alta."""
+    dados = Dados(casos_cbr)
+    politica = PoliticaCbr(Bot("Bot"), Cbr(dados), dados, salvar=False)
+    motor = Motor()
+    motor.nova_mao(maos=[MAO_FRACA, [Carta(12, "OUROS").id, Carta(12, "COPAS").id, Carta(12, "BASTOS").id]])
+    politica.iniciar_mao(motor.estado, 2)
+    assert sorted(politica.bot.mao_rank) == ['Alta', 'Baixa', 'Media']
+    pontos = politica.bot.pontuacao_cartas[0]
+    motor.aplicar(JOGAR_CARTA_1)
+
+    assert politica.decidir(motor) in motor.acoes_legais()
+    assert dados.registro.cartaAltaRobo[0] == dados.registro.cartaBaixaRobo[0] == pontos
+
+
+def test_politica_incompleta_falha_ao_ser_criada():
+    """Uma política sem algum dos métodos de decisão não pode ser instanciada."""
+    class SoJogaCartas(Politica):
+        def escolher_carta(self, jogador, opcoes, estado):
+            return opcoes[0]
+
+    with pytest.raises(TypeError, match="responder_envido"):
+        SoJogaCartas()
@@ -0,0 +1,27 @@
+import pytest
+from truco.baralho import Baralho
+from truco.carta import Carta
+from truco.pontos import MANILHA, CARTAS_VALORES, CARTA_ID, PONTOS_CARTAS
+
+
+def test_ids_das_cartas_seguem_a_ordem_do_baralho():
+    """Os ids vão de 0 a 39, na mesma ordem em que o Baralho cria as cartas."""
+    baralho = Baralho()
+    assert [carta.id for carta in baralho.cartas] == list(range(40))
+    assert sorted(CARTA_ID.values()) == list(range(40))
+
+
+@pytest.mark.parametrize("numero, naipe", [
+    (1, "ESPADAS"), (1, "BASTOS"), (7, "ESPADAS"), (7, "OUROS"),
+    (1, "OUROS"), (7, "COPAS"), (3, "BASTOS"), (12, "COPAS"), (4, "ESPADAS"),
+])
+def test_pontos_cartas_inclui_manilhas(numero, naipe):
+    """A tabela por id deve coincidir com MANILHA e CARTAS_VALORES."""
+    carta = Carta(numero, naipe)
+    esperado = MANILHA.get(f"{numero} de {naipe}", CARTAS_VALORES[str(numero)])
+    assert PONTOS_CARTAS[carta.id] == esperado
+
+
+def test_carta_fora_do_baralho_nao_tem_id():
+    """Cartas inexistentes no baralho espanhol (ex: 8) não recebem id."""
+    assert Carta(8, "COPAS").id is None
@@ -0,0 +1,69 @@
+import io
+import pytest
+import truco.__main__ as cli
+
+
+class MockCBR:
+    """CBR que sempre aceita os pedidos e joga a primeira carta."""
+
+    def jogar_carta(self, *args):
+        return 0
+
+    def truco(self, *args):
+        return 1
+
+    def envido(self, *args):
+        return 1
+
+    def flor(self, *args):
+        return 1
+
+
+@pytest.fixture
+def sem_terminal(monkeypatch, mock_dados):
+    """Substitui CBR e Dados por mocks e faz qualquer chamada a input() falhar."""
+    monkeypatch.setattr(cli, 'Cbr', MockCBR)
+    monkeypatch.setattr(cli, 'Dados', lambda: mock_dados)
+    monkeypatch.setattr('builtins.input', lambda *args: pytest.fail("o modo roteirizado não deve ler do terminal"))
+
+
+def escrever_roteiro(pasta, nome, linhas):
+    caminho = pasta / nome
+    caminho.write_text('\n'.join(linhas) + '\n', encoding='utf-8')
+    return str(caminho)
+
+
+def test_ler_roteiro_ignora_linhas_vazias_e_comentarios():
+    """Cada linha não vazia é uma resposta; linhas iniciadas por '#' são comentários."""
+    arquivo = io.StringIO("# partida gravada\nAna\n\n  Bot \n# jogadas\n0\n9\n")
+
+    assert cli.ler_roteiro(arquivo) == ['Ana', 'Bot', '0', '9']
+
+
+def test_entrada_roteirizada_responde_em_ordem_e_levanta_eoferror(capsys):
+    """As respostas são exibidas após a pergunta, como no terminal, e o fim do roteiro levanta EOFError."""
+    entrada = cli.entrada_roteirizada(['Ana'])
+
+    assert entrada("Nome Jogador 1: ") == 'Ana'
+    assert capsys.readouterr().out == "Nome Jogador 1: Ana\n"
+    with pytest.raises(EOFError):
+        entrada("Nome Jogador 2 (Bot): ")
+
+
+def test_main_com_roteiro_joga_partidas_inteiras_sem_terminal(sem_terminal, tmp_path, capsys):
+    """Cada roteiro joga uma partida completa lendo as jogadas do arquivo."""
+    jogadas = ['0', '1', '2'] * 2000
+    roteiros = [escrever_roteiro(tmp_path, f"roteiro{i}.txt", ['Ana', 'Bot'] + jogadas) for i in range(2)]
+
+    assert cli.main(['--roteiro', *roteiros, '--semente', '7']) == 0
+    assert capsys.readouterr().out.count("ganhou o jogo") == 2
+
+
+def test_main_silencioso_e_roteiro_incompleto(sem_terminal, tmp_path, capsys):
+    """Com --silencioso nada é exibido; um roteiro que acaba antes da partida é relatado e o código de saída é 1."""
+    roteiro = escrever_roteiro(tmp_path, "curto.txt", ['Ana', 'Bot', '0'])
+
+    assert cli.main(['--roteiro', roteiro, '--silencioso']) == 1
+    saida = capsys.readouterr()
+    assert saida.out == ""
+    assert "curto.txt: o roteiro terminou antes do fim da partida" in saida.err
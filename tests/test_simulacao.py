@@ -0,0 +1,155 @@
+import json
+import random
+import pytest
+import truco.__main__ as cli
+import truco.simulacao as simulacao
+from truco.cbr import Cbr
+from truco.dados import Dados
+from truco.motor import Motor, TRUCO, ENVIDO, QUERO, NAO_QUERO
+from truco.simulacao import ComparacaoDuplicada, Estatisticas, comparar_duplicado, simular
+
+
+class MockCBR:
+    """CBR que aceita os pedidos e joga a primeira carta, com um Dados que não lê nem grava arquivos."""
+
+    def __init__(self, dados):
+        self.dados = dados
+
+    com_dados = Cbr.com_dados
+
+    def jogar_carta(self, *args):
+        return 0
+
+    def truco(self, *args):
+        return 1
+
+    def envido(self, *args):
+        return 1
+
+
+def test_estatisticas_contam_respostas_aos_pedidos():
+    """Cada resposta conta para quem respondeu; aumentar a aposta também é aceitar."""
+    estatisticas = Estatisticas()
+    motor = Motor()
+    motor.nova_mao()
+    for acao in (ENVIDO, QUERO, TRUCO, TRUCO, NAO_QUERO):
+        jogador = motor.estado.vez
+        motor.aplicar(acao)
+        estatisticas.observar(motor, jogador, acao)
+
+    assert estatisticas.pedidos == {'truco': [1, 1], 'envido': [0, 1], 'flor': [0, 0]}
+    assert estatisticas.aceitos == {'truco': [0, 1], 'envido': [0, 1], 'flor': [0, 0]}
+    assert estatisticas.maos == 1
+
+
+def test_cada_bot_consulta_o_registro_que_enriquece(monkeypatch, mock_dados):
+    """O Cbr de cada bot lê o mesmo registro de caso que a sua PoliticaCbr preenche, e não o de outro bot."""
+    monkeypatch.setattr(simulacao, 'Cbr', lambda: MockCBR(mock_dados))
+    simulacao.iniciar_processo(['cbr', 'cbr'])
+    politicas = [simulacao.criar_politica('cbr', random.Random(0), cbr) for cbr in simulacao._processo['cbrs']]
+
+    assert all(politica.dados is politica.cbr.dados for politica in politicas)
+    assert politicas[0].dados is not politicas[1].dados
+
+
+def test_simular_no_pool_repete_o_resultado_sem_pool():
+    """Cada partida tem o seu fluxo aleatório, então o pool e o processo único chegam aos mesmos números."""
+    no_pool = simular(['aleatorio', 'heuristico'], 30, processos=2, semente=5, partidas_por_bloco=7)
+    sem_pool = simular(['aleatorio', 'heuristico'], 30, processos=1, semente=5)
+
+    assert no_pool.como_dict() == sem_pool.como_dict()
+    assert sum(no_pool.vitorias) == 30
+    assert no_pool.maos >= 30
+
+
+def test_simular_com_cbr_no_pool_repete_o_resultado_sem_pool(monkeypatch, casos_cbr):
+    """Cada partida começa com o registro de caso zerado, então o bot do CBR joga igual em qualquer processo."""
+    monkeypatch.setattr(simulacao, 'Cbr', lambda: Cbr(Dados(casos_cbr)))
+    no_pool = simular(['cbr', 'heuristico'], 24, processos=2, semente=3, partidas_por_bloco=6)
+    sem_pool = simular(['cbr', 'heuristico'], 24, processos=1, semente=3, partidas_por_bloco=6)
+
+    assert no_pool.como_dict() == sem_pool.como_dict()
+
+
+def test_duplicado_cancela_a_sorte_das_cartas_entre_politicas_iguais():
+    """Com as mesmas cartas e os lugares trocados, políticas iguais dividem cada distribuição."""
+    comparacao = comparar_duplicado(['heuristico', 'heuristico'], 12, processos=1, semente=3)
+
+    assert comparacao.vitorias == [12, 12]
+    assert comparacao.saldos_vitorias == [0] * 12
+    assert comparacao.diferenca(comparacao.saldos_pontos) == (0.0, 0.0)
+
+
+def test_duplicado_com_cbr_repete_a_mesma_distribuicao(monkeypatch, casos_cbr):
+    """As duas partidas de cada distribuição começam com o registro de caso zerado, então repeti-la dá o mesmo saldo."""
+    monkeypatch.setattr(simulacao, 'Cbr', lambda: Cbr(Dados(casos_cbr)))
+    simulacao.iniciar_processo(['cbr', 'heuristico'])
+    primeira = simulacao.jogar_duplicadas(3, 0, 1)
+    segunda = simulacao.jogar_duplicadas(3, 0, 1)
+
+    assert primeira.saldos_pontos == segunda.saldos_pontos
+    assert primeira.saldos_vitorias == segunda.saldos_vitorias
+
+
+def test_duplicado_no_pool_repete_o_resultado_sem_pool():
+    no_pool = comparar_duplicado(['aleatorio', 'heuristico'], 10, processos=2, semente=6, partidas_por_bloco=3)
+    sem_pool = comparar_duplicado(['aleatorio', 'heuristico'], 10, processos=1, semente=6)
+
+    assert no_pool.como_dict() == sem_pool.como_dict()
+    assert sum(no_pool.vitorias) == 20
+
+
+def test_intervalo_da_diferenca_pareada():
+    comparacao = ComparacaoDuplicada()
+    for vitorias in ([2, 0], [1, 1], [0, 2], [2, 0]):
+        comparacao.registrar(vitorias, [0, 0])
+
+    media, margem = comparacao.diferenca(comparacao.saldos_vitorias)
+    assert media == pytest.approx(0.25)
+    assert margem == pytest.approx(1.959964 * 0.957427 / 2, rel=1e-5)
+    assert comparacao.como_dict()['distribuicoes_divididas'] == 0.25
+
+
+def test_simular_rejeita_politica_desconhecida():
+    with pytest.raises(ValueError, match="desconhecida"):
+        simular(['aleatorio', 'genio'], 1, processos=1)
+
+
+@pytest.mark.parametrize("comando", ["simular", "simulate"])
+def test_comando_simular_grava_os_resultados(comando, monkeypatch, mock_dados, tmp_path, capsys):
+    """O subcomando carrega o CBR uma vez por processo, exibe o relatório e grava o JSON com --saida."""
+    carregamentos = []
+
+    def criar_cbr():
+        carregamentos.append(1)
+        return MockCBR(mock_dados)
+
+    monkeypatch.setattr(simulacao, 'Cbr', criar_cbr)
+    saida = tmp_path / "resultado.json"
+
+    assert cli.main([comando, 'cbr', 'heuristico', '-n', '6', '--processos', '1', '--semente', '2', '--saida', str(saida)]) == 0
+    assert carregamentos == [1]
+    assert "Vitórias: cbr (1)" in capsys.readouterr().out
+
+    resultados = json.loads(saida.read_text(encoding='utf-8'))
+    assert resultados['partidas'] == 6
+    assert resultados['semente'] == 2
+    assert set(resultados['jogadores']['cbr (1)']['aceitacao']) == {'truco', 'envido', 'flor'}
+
+
+def test_comando_simular_usa_a_semente_informada_antes_do_subcomando(tmp_path):
+    saida = tmp_path / "resultado.json"
+
+    assert cli.main(['--semente', '5', 'simular', 'aleatorio', 'heuristico', '-n', '2', '--processos', '1', '--saida', str(saida)]) == 0
+    assert json.loads(saida.read_text(encoding='utf-8'))['semente'] == 5
+
+
+def test_comando_simular_duplicado(tmp_path, capsys):
+    saida = tmp_path / "duplicado.json"
+
+    assert cli.main(['simular', 'aleatorio', 'heuristico', '-n', '4', '--duplicado', '--processos', '1', '--saida', str(saida)]) == 0
+    assert "Diferença na taxa de vitória (aleatorio (1) - heuristico (2), IC 95%)" in capsys.readouterr().out
+
+    resultados = json.loads(saida.read_text(encoding='utf-8'))
+    assert resultados['distribuicoes'] == 4 and resultados['partidas'] == 8
+    assert resultados['diferenca_taxa_vitoria']['intervalo'][0] <= resultados['diferenca_taxa_vitoria']['media']
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from truco.baralho import gerar_distribuicoes
+from truco.carta import Carta
+from truco.maos import PONTOS_IDS
+from truco.motor import Motor
+from truco.simulador import REGRAS, simular_maos, comparar_regras, menor_que_vence
+from truco.vazas import SEM_VAZA
+
+
+def jogar_no_motor(distribuicao, regras, mao):
+    """Joga a mão no Motor, escolhendo cada carta com a regra aplicada a uma única linha."""
+    motor = Motor()
+    motor.estado.jogador_mao = 3 - mao
+    estado = motor.nova_mao(maos=distribuicao.tolist())
+    while not estado.vencedor_mao:
+        jogador = estado.vez
+        pontos = np.array([[PONTOS_IDS[carta] if carta >= 0 else -1 for carta in estado.maos[jogador - 1]]], dtype=np.int16)
+        mesa = np.array([PONTOS_IDS[estado.carta_mesa] if estado.carta_mesa >= 0 else -1], dtype=np.int16)
+        motor.aplicar(int(REGRAS[regras[jogador - 1]](pontos, mesa)[0]))
+    return estado
+
+
+@pytest.mark.parametrize("regras", [("maior_primeiro", "menor_que_vence"), ("menor_primeiro", "maior_primeiro"),
+                                    ("menor_que_vence", "menor_que_vence")])
+@pytest.mark.parametrize("mao", [1, 2])
+def test_simulador_coincide_com_o_motor(regras, mao):
+    """Vazas, pardas e o fim antecipado da mão seguem as regras do Motor."""
+    distribuicoes = gerar_distribuicoes(300, 4)
+    vazas, vencedores = simular_maos(distribuicoes.reshape(300, 6), regras, mao)
+
+    for i, distribuicao in enumerate(distribuicoes):
+        estado = jogar_no_motor(distribuicao, regras, mao)
+        assert vencedores[i] == estado.vencedor_mao
+        assert vazas[i].tolist() == estado.vazas + [SEM_VAZA] * (3 - len(estado.vazas))
+
+
+def test_menor_que_vence_escolhe_a_menor_carta_que_vence():
+    """Respondendo, joga a menor carta que vence a da mesa, ou a menor se nenhuma vence; abrindo, a maior."""
+    mao = [Carta(7, "OUROS").id, Carta(3, "COPAS").id, Carta(4, "OUROS").id]
+    pontos = np.array([PONTOS_IDS[mao]] * 3, dtype=np.int16)
+    mesa = np.array([PONTOS_IDS[Carta(2, "BASTOS").id], PONTOS_IDS[Carta(1, "BASTOS").id], -1], dtype=np.int16)
+
+    assert menor_que_vence(pontos, mesa).tolist() == [1, 2, 0]
+
+
+def test_regra_aleatoria_e_comparacao_de_regras():
+    """A regra aleatória só joga cartas que restam, e a comparação cobre todos os pares de regras."""
+    distribuicoes = gerar_distribuicoes(2000, 5)
+    vazas, vencedores = simular_maos(distribuicoes, ('aleatoria', 'aleatoria'), gerador=1)
+    assert set(np.unique(vencedores)) == {1, 2}
+    assert ((vazas[:, :2] != SEM_VAZA).all())
+
+    taxas = comparar_regras(distribuicoes, gerador=1)
+    assert taxas.shape == (len(REGRAS), len(REGRAS))
+    assert ((taxas > 0) & (taxas < 1)).all()
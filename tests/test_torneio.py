@@ -0,0 +1,161 @@
+import json
+import pytest
+import truco.__main__ as cli
+import truco.torneio as torneio_modulo
+from truco.cbr import Cbr
+from truco.dados import Dados
+from truco.torneio import atualizar_elo, esperado, classificacao, torneio
+
+CONFIGURACOES = ['aleatorio', 'heuristico', {'nome': 'heuristico-b', 'politica': 'heuristico'}]
+
+
+class Interrupcao(Exception):
+    pass
+
+
+class CbrFixo:
+    """Cbr que aceita os pedidos e joga a primeira carta, sem base de casos."""
+    vizinhos = 100
+    com_dados = Cbr.com_dados
+
+    def __init__(self, dados, vizinhos):
+        self.dados = dados
+        self.vizinhos = vizinhos
+
+    def jogar_carta(self, *args):
+        return 0
+
+    def truco(self, *args):
+        return 1
+
+    def envido(self, *args):
+        return 1
+
+
+def test_atualizar_elo_conserva_a_soma_dos_ratings():
+    elos = {'a': 1500.0, 'b': 1700.0}
+    atualizar_elo(elos, 'a', 'b', fator=32)
+
+    assert elos['a'] + elos['b'] == pytest.approx(3200)
+    assert elos['a'] - 1500 == pytest.approx(32 * (1 - esperado(1500, 1700)))
+    assert esperado(1500, 1700) == pytest.approx(1 - esperado(1700, 1500))
+
+
+def test_torneio_interrompido_continua_de_onde_parou(tmp_path):
+    """Retomado a partir do arquivo, o torneio joga só os lotes que faltam e chega ao mesmo estado."""
+    arquivo = tmp_path / "torneio.json"
+
+    def interromper(estado, lote):
+        if (len(estado['lotes']) == 2):
+            raise Interrupcao
+
+    with pytest.raises(Interrupcao):
+        torneio(CONFIGURACOES, 12, str(arquivo), processos=1, semente=8, partidas_por_lote=5, observador=interromper)
+    assert len(json.loads(arquivo.read_text(encoding='utf-8'))['lotes']) == 2
+
+    retomados = []
+    retomado = torneio(CONFIGURACOES, 12, str(arquivo), processos=1, partidas_por_lote=5,
+                       observador=lambda estado, lote: retomados.append(lote))
+    completo = torneio(CONFIGURACOES, 12, processos=1, semente=8, partidas_por_lote=5)
+
+    assert len(retomados) == 9 - 2
+    assert retomado == completo
+    assert json.loads(arquivo.read_text(encoding='utf-8')) == completo
+    assert sum(linha[2] for linha in classificacao(completo)) == 2 * 3 * 12
+
+
+def test_torneio_no_pool_tem_os_mesmos_resultados(monkeypatch, tmp_path, casos_cbr):
+    """Os lotes terminam em qualquer ordem no pool, mas entram nos ratings na ordem da agenda.
+
+    O bot do CBR começa cada partida com o registro zerado, então joga igual em qualquer processo.
+    """
+    monkeypatch.setattr(torneio_modulo, 'Dados', lambda arquivo=None: Dados(casos_cbr))
+    configuracoes = [{'nome': 'cbr', 'politica': 'cbr'}, {'nome': 'cbr-10', 'politica': 'cbr', 'vizinhos': 10}, 'aleatorio']
+    no_pool = torneio(configuracoes, 8, str(tmp_path / "pool.json"), processos=3, semente=4, partidas_por_lote=2)
+    de_novo = torneio(configuracoes, 8, processos=3, semente=4, partidas_por_lote=2)
+    sem_pool = torneio(configuracoes, 8, processos=1, semente=4, partidas_por_lote=2)
+
+    def ordenar(lotes):
+        return sorted(lotes, key=lambda lote: (lote['par'], lote['inicio']))
+
+    assert ordenar(no_pool['lotes']) == ordenar(sem_pool['lotes'])
+    assert no_pool['elo'] == de_novo['elo'] == sem_pool['elo']
+    assert no_pool['lotes_no_elo'] == 12
+    assert sum(no_pool['elo'].values()) == pytest.approx(3 * 1500)
+
+
+def test_torneio_rejeita_arquivo_de_outro_torneio(tmp_path):
+    arquivo = str(tmp_path / "torneio.json")
+    torneio(CONFIGURACOES[:2], 2, arquivo, processos=1, semente=1)
+
+    with pytest.raises(ValueError, match="configuracoes"):
+        torneio(CONFIGURACOES, 2, arquivo, processos=1)
+    with pytest.raises(ValueError, match="únicos"):
+        torneio(['heuristico', 'heuristico'], 2, processos=1)
+
+
+def test_comando_torneio_carrega_cada_cbr_uma_vez(monkeypatch, tmp_path, capsys):
+    """Configurações do CBR com a mesma base de casos compartilham a leitura; cada quantidade de vizinhos tem o seu Cbr."""
+    bases, cbrs, bots = [], [], []
+
+    class BaseDeCasos:
+        def __init__(self, arquivo=None):
+            bases.append(arquivo)
+
+        def carregar_modelo_zerado(self):
+            return None
+
+        def __getattr__(self, nome):
+            return lambda *args, **kwargs: None
+
+    class CbrRegistrado(CbrFixo):
+        def __init__(self, dados, vizinhos):
+            cbrs.append(vizinhos)
+            super().__init__(dados, vizinhos)
+
+    class BotRegistrado(torneio_modulo.Bot):
+        def __init__(self, nome, **limiares):
+            super().__init__(nome, **limiares)
+            bots.append((nome, self.limiar_perdendo, self.fator_perdendo))
+
+    monkeypatch.setattr(torneio_modulo, 'Dados', BaseDeCasos)
+    monkeypatch.setattr(torneio_modulo, 'Cbr', CbrRegistrado)
+    monkeypatch.setattr(torneio_modulo, 'Bot', BotRegistrado)
+    configuracoes = tmp_path / "bots.json"
+    configuracoes.write_text(json.dumps([
+        {'nome': 'cbr-50', 'politica': 'cbr', 'vizinhos': 50, 'casos': 'casos.csv'},
+        {'nome': 'cbr-10', 'politica': 'cbr', 'vizinhos': 10, 'casos': 'casos.csv', 'limiar_perdendo': 3},
+        'heuristico',
+    ]), encoding='utf-8')
+    resultado = tmp_path / "torneio.json"
+
+    assert cli.main(['torneio', str(configuracoes), '-n', '4', '--processos', '1', '--semente', '2',
+                     '--resultado', str(resultado)]) == 0
+    assert bases == ['casos.csv']
+    assert sorted(cbrs) == [10, 50]
+    assert ('cbr-10', 3, 1.5) in bots and ('cbr-50', 6, 1.5) in bots
+    assert "Partidas: 12/12, semente 2" in capsys.readouterr().out
+    assert set(json.loads(resultado.read_text(encoding='utf-8'))['elo']) == {'cbr-50', 'cbr-10', 'heuristico'}
+
+
+def test_comando_torneio_usa_a_semente_informada_antes_do_subcomando(tmp_path):
+    configuracoes = tmp_path / "bots.json"
+    configuracoes.write_text(json.dumps(CONFIGURACOES[:2]), encoding='utf-8')
+    resultado = tmp_path / "torneio.json"
+
+    assert cli.main(['--semente', '5', 'torneio', str(configuracoes), '-n', '2', '--processos', '1',
+                     '--resultado', str(resultado)]) == 0
+    assert json.loads(resultado.read_text(encoding='utf-8'))['semente'] == 5
+
+
+def test_cada_configuracao_do_cbr_consulta_o_proprio_registro(monkeypatch, mock_dados):
+    """Configurações sobre o mesmo Cbr compartilham a base, mas cada uma consulta o registro que a sua política enriquece."""
+    monkeypatch.setattr(torneio_modulo, 'Dados', lambda arquivo=None: mock_dados)
+    monkeypatch.setattr(torneio_modulo, 'Cbr', CbrFixo)
+    torneio_modulo.iniciar_processo(torneio_modulo.validar_configuracoes([
+        {'nome': 'cbr-a', 'politica': 'cbr'}, {'nome': 'cbr-b', 'politica': 'cbr', 'limiar_perdendo': 2}]))
+    politicas = [torneio_modulo.criar_politica_configurada(indice, None) for indice in (0, 1)]
+
+    assert all(politica.dados is politica.cbr.dados for politica in politicas)
+    assert politicas[0].dados is not politicas[1].dados
+    assert len(torneio_modulo._processo['cbrs']) == 1
@@ -0,0 +1,53 @@
+import itertools
+import numpy as np
+import pytest
+from truco.carta import Carta, CARTAS
+from truco.pontos import PONTOS_CARTAS
+from truco.vazas import RESULTADO_VAZAS, SEM_VAZA, ganhador_mao, ganhadores_maos, resultado_vaza, resolver_vazas, VITORIA, PARDA, DERROTA
+
+
+def test_matriz_de_vazas_e_int8_40x40():
+    """A matriz cobre todos os pares ordenados de cartas e é somente leitura."""
+    assert RESULTADO_VAZAS.shape == (40, 40)
+    assert RESULTADO_VAZAS.dtype == np.int8
+    assert not RESULTADO_VAZAS.flags.writeable
+
+
+def test_matriz_de_vazas_e_antissimetrica():
+    """Se a carta A vence a carta B, então B perde para A."""
+    assert np.array_equal(RESULTADO_VAZAS, -RESULTADO_VAZAS.T)
+
+
+@pytest.mark.parametrize("carta_01, carta_02, esperado", [
+    (Carta(1, "ESPADAS"), Carta(1, "BASTOS"), VITORIA),
+    (Carta(7, "OUROS"), Carta(3, "COPAS"), VITORIA),
+    (Carta(4, "BASTOS"), Carta(5, "COPAS"), DERROTA),
+    (Carta(3, "COPAS"), Carta(3, "BASTOS"), PARDA),
+    (Carta(7, "COPAS"), Carta(7, "BASTOS"), PARDA),
+    (Carta(7, "COPAS"), Carta(7, "ESPADAS"), DERROTA),
+])
+def test_resultado_vaza(carta_01, carta_02, esperado):
+    """Consulta escalar, incluindo as pardas entre cartas comuns de mesmo valor."""
+    assert resultado_vaza(carta_01.id, carta_02.id) == esperado
+
+
+def test_resolver_vazas_em_lote_coincide_com_a_consulta_escalar():
+    """Resolver arrays de vazas com uma indexação deve dar o mesmo resultado da consulta individual."""
+    ids_01 = np.repeat(np.arange(40), 40)
+    ids_02 = np.tile(np.arange(40), 40)
+    resultados = resolver_vazas(ids_01, ids_02)
+    esperado = [resultado_vaza(a, b) for a, b in zip(ids_01.tolist(), ids_02.tolist())]
+    assert resultados.tolist() == esperado
+    assert all(
+        np.sign(PONTOS_CARTAS[a.id] - PONTOS_CARTAS[b.id]) == resultado_vaza(a.id, b.id)
+        for a in CARTAS for b in CARTAS
+    )
+
+
+def test_ganhadores_maos_em_lote_coincide_com_ganhador_mao():
+    """Todas as sequências de até três vazas, com cada jogador como mão."""
+    sequencias = [list(vazas[:jogadas]) for jogadas in range(4) for vazas in itertools.product((0, 1, 2), repeat=3)]
+    vazas = np.array([sequencia + [SEM_VAZA] * (3 - len(sequencia)) for sequencia in sequencias])
+    for mao in (1, 2):
+        esperado = [ganhador_mao(sequencia, mao) or 0 for sequencia in sequencias]
+        assert ganhadores_maos(vazas, mao).tolist() == esperado
@@ -1,270 +1,199 @@
-from .baralho import Baralho
-from .carta import Carta
-from .jogador import Jogador
-from .jogo import Jogo
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+from .carta import CARTAS
+from .bot import Bot
 from .cbr import Cbr
 from .interface import Interface
 from .dados import Dados
-from .truco import Truco
-from .envido import Envido
-from .flor import Flor
-import random
-import os
-
-
-def reiniciarJogo():
-    """Reseta todos os parâmetros do jogo, referente as rodadas"""
-    dados.finalizar_partida()
-    jogador1.resetar()
-    jogador2.resetar()
-    baralho.resetar()
-    baralho.criar_baralho()
-    baralho.embaralhar()
-    jogador1.criar_mao(baralho)
-    jogador2.criar_mao(baralho)
-    # jogo.resetarTrucoPontos()
-    envido.resetar()
-    truco.resetar()
-
-
-def turno_do_humano(jogador2):
-    """Turno de jogadas do humano, para selecionar o que ele gostaria de jogar."""
-    
-    if (len(jogador1.checa_mao()) == 3 and jogador2.envido):
-        envido_jogador2 = jogador2.avaliar_envido(cbr, 'Envido', 2, jogador1.pontos)
-        if (envido_jogador2):
-            jogador1.mostrar_opcoes(interface)
-            envido.controlador_envido(cbr, dados, 6, 2, jogador1, jogador2, interface)
-    
-    carta_escolhida = -1
-    while (carta_escolhida > len(jogador1.checa_mao()) or int(carta_escolhida) <= 1):
-        print(f"\n<< {jogador1.nome} - Jogador 1 >>")
-        jogador1.mostrar_opcoes(interface)
-        carta_escolhida = int(input(f"\n{jogador1.nome} Qual carta você quer jogar? "))
-
-        # Chama a flor antes do jogador1 jogar envido 
-        if ((len(jogador1.checa_mao()) == 3) and (carta_escolhida in [6, 7, 8]) and (jogador2.flor is True)):
-            print('Bloqueou o envido com a flor')
-            flor.pedir_flor(1, jogador1, jogador2, interface)
-            carta_escolhida = -1
-        
-        if (carta_escolhida <= len(jogador1.checa_mao()) and int(carta_escolhida) >= 0):
-            carta_jogador_01 = jogador1.jogar_carta(carta_escolhida)
-            # interface.limpar_tela()
-            break
-
-        elif (carta_escolhida == 4):
-            chamou_truco = (truco.controlador_truco(cbr, dados, 1, jogador1, jogador2))
-            # print(f"temp: {chamou_truco}")
-            if ((chamou_truco) is False):
-                print('pontos truco', truco.retornar_valor_aposta())
-                return -1
-                break
-                # jogador1.adicionar_rodada()
-
-        elif ((len(jogador1.mao) == 3) and (jogador1.flor) and carta_escolhida == 5):
-            print('flor')
-            flor.pedir_flor(1, jogador1, jogador2, interface)
-            interface.border_msg(f"Jogador 1 - {jogador1.nome}: {jogador1.pontos} Pontos Acumulados\nJogador 2 - {jogador2.nome}: {jogador2.pontos} Pontos Acumulados")
-
-        elif ((len(jogador1.checa_mao()) == 3) and (jogador2.pediu_flor is False) and (carta_escolhida in [6, 7, 8])):
-            # print('envido')
-            # envido.pedir_envido(1, jogador1, jogador2)
-            if (carta_escolhida == 6):
-                envido.controlador_envido(cbr, dados, 6, 1, jogador1, jogador2, interface)
-            elif (carta_escolhida == 7):
-                envido.controlador_envido(cbr, dados, 7, 1, jogador1, jogador2, interface)
-            elif (carta_escolhida == 8):
-                envido.controlador_envido(cbr, dados, 8, 1, jogador1, jogador2, interface)
-                # self, dados, tipo, quem_pediu, jogador1, jogador2, interface
-                #  dados, tipo, quem_pediu, jogador1, jogador2, interface
-
-        elif (carta_escolhida == 9):
-            jogador2.adicionar_pontos(truco.retornar_valor_aposta())
-            carta1 = -1
-            return carta1
-        
-        else:
-            print('Selecione um valor válido!')
-
-    carta1 = Carta(carta_jogador_01.retornar_numero(), carta_jogador_01.retornar_naipe())
-    return carta1
-
-
-def turno_do_bot(carta_jogador_01):
-    """Turno do Bot, para avaliar o estado atual do jogo e jogar suas cartas."""
-    if (len(jogador2.checa_mao()) == 3 and carta_jogador_01):
-        jogador2.enriquecer_bot(dados=dados, carta_jogador_01=carta_jogador_01)
-
-    carta_escolhida = -1
-    while (carta_escolhida > len(jogador2.checa_mao()) or int(carta_escolhida) <= 1):
-        print(f"\n<< {jogador2.nome} - Jogador 2 >>")
-        # carta_jogador_02 = jogador2.jogar_carta(cbr, truco)
-        # carta_escolhida = -1
-        carta_escolhida = jogador2.jogar_carta(cbr, truco)
-
-        if (jogador2.pediu_flor is False and (carta_escolhida == 5 and (len(jogador1.mao) == 3))):
-            print('flor do Bot')
-            flor.pedir_flor(2, jogador1, jogador2, interface)
-            interface.border_msg(f"Jogador 1 - {jogador1.nome}: {jogador1.pontos} Pontos Acumulados\nJogador 2 - {jogador2.nome}: {jogador2.pontos} Pontos Acumulados")
-        
-        if (carta_escolhida <= len(jogador2.checa_mao()) and int(carta_escolhida) >= 0):
-            # interface.limpar_tela()
-            carta_jogador_02 = jogador2.mao.pop(carta_escolhida)
-            break
-
-        elif (carta_escolhida == 4):
-            chamou_truco = (truco.controlador_truco(cbr, dados, 2, jogador1, jogador2))
-            # print(f"temp: {chamou_truco}")
-            if ((chamou_truco) is False):
-                # print('pontos truco', truco.retornar_valor_aposta())
-                return -1
-                break
-                # jogador1.adicionar_rodada()
-
-        elif ((jogador1.pediu_flor or jogador2.pediu_flor) is False and carta_escolhida in [6, 7, 8]):
-            print('envido')
-            # envido.pedir_envido(2, jogador2, jogador1)
-            envido.controlador_envido('Envido', 2, jogador1, jogador2, interface)
-            if (carta_escolhida == 6):
-                envido.controlador_envido(cbr, dados, 6, 1, jogador1, jogador2, interface)
-
-            if (carta_escolhida == 7):
-                envido.controlador_envido(cbr, dados, 7, 1, jogador1, jogador2, interface)
-
-            if (carta_escolhida == 8):
-                envido.controlador_envido(cbr, dados, 8, 1, jogador1, jogador2, interface)
-
-        elif (carta_escolhida == 7):
-            jogador1.adicionar_pontos(1)
-            return -1
-        
-        else:
-            print('Selecione um valor válido!')
-
-
-    # interface.limpar_tela()
-    if (carta_jogador_02 is not None):
-        carta2 = Carta(carta_jogador_02.retornar_numero(), carta_jogador_02.retornar_naipe())
-    return carta2
-
-
-jogo = Jogo()
-baralho = Baralho()
-baralho.embaralhar() # Voltar a embaralhar para o jogo funcionar normalmente.
-cbr = Cbr()
-interface = Interface()
-dados = Dados()
-truco = Truco()
-flor = Flor()
-envido = Envido()
-
-truco_aceito = False
-pontos_truco = 0
-carta_jogador_01 = 0
-carta_jogador_02 = 0
-ganhador = 0
-nome = str(input("Nome Jogador 1: "))
-jogador1 = jogo.criar_jogador(nome, baralho)
-nome = str(input("Nome Jogador 2 (Bot): "))
-jogador2 = jogo.criar_bot(nome, baralho)
-jogador1.primeiro = True
-jogador2.ultimo = True
-# interface.limpar_tela()
-# interface.mostrar_jogador_mao(jogador1.nome)
-
-while True:
-    truco_fugiu = False
-    ocultar_pontos_ac = False
-
-    if jogador1.primeiro == True:
-        carta_jogador_01 = turno_do_humano(jogador2)
-        if (carta_jogador_01 != -1):
-            interface.mostrar_carta_jogada(jogador1.nome, carta_jogador_01)
-            carta_jogador_02 = turno_do_bot(carta_jogador_01)
-            if (carta_jogador_02 != -1):
-                interface.mostrar_carta_jogada(jogador2.nome, carta_jogador_02)
-
-    elif jogador2.primeiro == True:
-        carta_jogador_02 = turno_do_bot(None)
-        if (carta_jogador_02 != -1):
-            interface.mostrar_carta_jogada(jogador2.nome, carta_jogador_02)
-            carta_jogador_01 = turno_do_humano(jogador2)
-            if (carta_jogador_01 != -1):
-                interface.mostrar_carta_jogada(jogador1.nome, carta_jogador_01)
-    
-    
-    if ((carta_jogador_01 == -1 or carta_jogador_02 == -1)):
-        truco_fugiu = True
-        if (carta_jogador_01 == -1 or carta_jogador_01 is None):
-            # jogo.jogador_fugiu(jogador1, jogador1, jogador2, -1)
-            interface.mostrar_placar_total_jogador_fugiu(jogador1, jogador1.nome, jogador1.pontos, jogador2.nome, jogador2.pontos)
-        
+from .motor import Motor, NOMES_ACOES, JOGAR_CARTA, TRUCO, IR_AO_BARALHO
+from .politicas import PoliticaHumana, PoliticaCbr, jogar_partida
+from .simulacao import POLITICAS, comparar_duplicado, simular
+from .torneio import PARTIDAS_POR_LOTE, relatorio, torneio
+
+NOMES_TRUCO = {2: 'Truco', 3: 'Retruco', 4: 'Vale 4'}
+
+
+def criar_narrador(interface, nomes):
+    """Cria o observador que exibe o que mudou no estado depois de cada ação aplicada."""
+    # O que já foi narrado: vazas, vencedores de envido e flor e o placar antes da última ação
+    anterior = {'mao': 0, 'vazas': 0, 'vencedor_envido': 0, 'vencedor_flor': 0, 'pontos': [0, 0]}
+
+    def narrar(motor, jogador, acao):
+        estado = motor.estado
+        nome = nomes[jogador - 1]
+        if (estado.numero_mao != anterior['mao']):
+            anterior.update(mao=estado.numero_mao, vazas=0, vencedor_envido=0, vencedor_flor=0)
+
+        if (acao in JOGAR_CARTA):
+            interface.mostrar_carta_jogada(nome, CARTAS[estado.jogadas[-1][1]])
+        elif (acao == TRUCO):
+            print(f"{nome}: {NOMES_TRUCO[estado.valor_pedido]}")
+        elif (acao != IR_AO_BARALHO):
+            print(f"{nome}: {NOMES_ACOES[acao]}")
+
+        vaza_encerrada = len(estado.vazas) > anterior['vazas']
+        if (vaza_encerrada):
+            cartas = dict(estado.jogadas[-2:])
+            vencedor = estado.vazas[-1]
+            interface.mostrar_carta_ganhadora(CARTAS[cartas[vencedor]] if vencedor else "Empate")
+
+        if (estado.vencedor_envido and not anterior['vencedor_envido']):
+            interface.mostrar_vencedor_envido(estado.vencedor_envido, nomes[0], estado.envido[0], nomes[1], estado.envido[1])
+
+        if (estado.vencedor_flor and not anterior['vencedor_flor']):
+            vencedor = estado.vencedor_flor - 1
+            interface.mostrar_vencedor_flor(estado.vencedor_flor, nomes[0], nomes[1], estado.pontos[vencedor] - anterior['pontos'][vencedor])
+
+        if (estado.vencedor_mao):
+            if (acao == IR_AO_BARALHO):
+                print(f'Jogador {nome} foi ao baralho!')
+            interface.mostrar_ganhador_rodada(nomes[estado.vencedor_mao - 1])
+            interface.mostrar_placar_total(nomes[0], estado.pontos[0], nomes[1], estado.pontos[1])
+
+        elif (vaza_encerrada):
+            vazas_1 = estado.vazas.count(1)
+            vazas_2 = estado.vazas.count(2)
+            interface.mostrar_placar_rodadas(nomes[0], vazas_1, nomes[1], vazas_2)
+
+        anterior.update(vazas=len(estado.vazas), vencedor_envido=estado.vencedor_envido,
+                        vencedor_flor=estado.vencedor_flor, pontos=list(estado.pontos))
+
+    return narrar
+
+
+def ler_roteiro(arquivo):
+    """Lê as respostas de um roteiro: uma por linha, ignorando linhas vazias e comentários iniciados por '#'."""
+    return [linha.strip() for linha in arquivo if linha.strip() and not linha.lstrip().startswith('#')]
+
+
+def entrada_roteirizada(respostas):
+    """Substituto de input() que responde com as linhas do roteiro, em ordem, e levanta EOFError ao fim delas."""
+    respostas = iter(respostas)
+
+    def entrada(mensagem=''):
+        resposta = next(respostas, None)
+        if (resposta is None):
+            raise EOFError("o roteiro terminou antes do fim da partida")
+        print(f"{mensagem}{resposta}")
+        return resposta
+
+    return entrada
+
+
+def jogar(cbr, dados, entrada=None, gerador=None):
+    """Joga uma partida do humano contra o Bot, lendo nomes e jogadas do humano de 'entrada' (por padrão, input)."""
+    entrada = entrada or input
+    interface = Interface()
+    nomes = [str(entrada("Nome Jogador 1: ")), str(entrada("Nome Jogador 2 (Bot): "))]
+    politicas = [PoliticaHumana(nomes[0], entrada=entrada, insistir=True), PoliticaCbr(Bot(nomes[1]), cbr, dados)]
+    vencedor = jogar_partida(Motor(gerador), politicas, criar_narrador(interface, nomes))
+    interface.mostrar_ganhador_jogo(nomes[vencedor - 1])
+    return vencedor
+
+
+def executar_simulacao(argumentos):
+    """Executa o comando 'simular': joga as partidas, exibe o relatório e, com --saida, grava o JSON."""
+    nomes = [f"{nome} ({jogador})" for jogador, nome in enumerate(argumentos.politicas, 1)]
+    executar = comparar_duplicado if argumentos.duplicado else simular
+    estatisticas = executar(argumentos.politicas, argumentos.partidas, argumentos.processos, argumentos.semente)
+    print(estatisticas.relatorio(nomes))
+    if (argumentos.saida):
+        with open(argumentos.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(estatisticas.como_dict(nomes), arquivo, ensure_ascii=False, indent=2)
+    return 0
+
+
+def executar_torneio(argumentos):
+    """Executa o comando 'torneio': joga (ou retoma) o torneio gravado em --resultado e exibe a classificação."""
+    with open(argumentos.configuracoes, encoding='utf-8') as arquivo:
+        configuracoes = json.load(arquivo)
+
+    def mostrar_lote(estado, lote):
+        nomes = [estado['configuracoes'][indice]['nome'] for indice in lote['par']]
+        vitorias = lote['vencedores'].count(0)
+        print(f"{nomes[0]} x {nomes[1]}: {vitorias}-{len(lote['vencedores']) - vitorias} "
+              f"(Elo {estado['elo'][nomes[0]]:.0f} x {estado['elo'][nomes[1]]:.0f})")
+
+    estado = torneio(configuracoes, argumentos.partidas, argumentos.resultado, argumentos.processos,
+                     argumentos.semente, argumentos.lote, observador=mostrar_lote)
+    print(relatorio(estado))
+    return 0
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(prog='python -m truco', description='Truco Gaudério contra o Bot.')
+    parser.add_argument('--roteiro', nargs='+', metavar='ARQUIVO',
+                        help="joga sem interação, uma partida por arquivo, lendo os nomes e as jogadas do humano "
+                             "(uma resposta por linha, como seriam digitadas); '-' lê da entrada padrão")
+    parser.add_argument('--silencioso', action='store_true', help='não exibe a saída das partidas roteirizadas')
+    parser.add_argument('--semente', type=int, help='semente do embaralhamento, para repetir as mesmas cartas')
+
+    comandos = parser.add_subparsers(dest='comando', metavar='COMANDO')
+    simulacao = comandos.add_parser('simular', aliases=['simulate'], help='simula partidas entre duas políticas',
+                                    description='Joga partidas completas entre duas políticas num pool de processos '
+                                                'e exibe os resultados agregados.')
+    simulacao.add_argument('politicas', nargs=2, choices=POLITICAS, metavar='POLITICA',
+                           help=f"políticas dos jogadores 1 e 2: {', '.join(POLITICAS)}")
+    simulacao.add_argument('-n', '--partidas', type=int, default=1000, help='quantidade de partidas (padrão: 1000)')
+    simulacao.add_argument('--processos', type=int, help='processos do pool (padrão: um por CPU; 1 joga sem pool)')
+    # Sem --semente no subcomando, vale a informada antes dele
+    simulacao.add_argument('--semente', type=int, default=argparse.SUPPRESS,
+                           help='semente da simulação, para repetir as mesmas partidas')
+    simulacao.add_argument('--saida', metavar='ARQUIVO', help='grava os resultados agregados em JSON')
+    simulacao.add_argument('--duplicado', action='store_true',
+                           help='joga cada uma das N distribuições duas vezes, com as políticas trocando de lugar, e '
+                                'exibe a diferença pareada entre elas com o intervalo de confiança')
+    simulacao.set_defaults(executar=executar_simulacao)
+
+    campeonato = comandos.add_parser('torneio', aliases=['tournament'], help='torneio todos contra todos com rating Elo',
+                                     description='Joga partidas entre cada par de configurações de bots num pool de '
+                                                 'processos, atualizando os ratings Elo. O resultado é gravado depois '
+                                                 'de cada lote e o torneio continua de onde parou se for interrompido.')
+    campeonato.add_argument('configuracoes', metavar='CONFIGURACOES',
+                            help="arquivo JSON com a lista de configurações, cada uma com 'nome' e 'politica' e, "
+                                 "para o CBR, 'vizinhos', 'casos', 'limiar_perdendo' e 'fator_perdendo'")
+    campeonato.add_argument('-n', '--partidas', type=int, default=100, help='partidas por par de configurações (padrão: 100)')
+    campeonato.add_argument('--lote', type=int, default=PARTIDAS_POR_LOTE,
+                            help=f'partidas por lote, a unidade gravada e retomada (padrão: {PARTIDAS_POR_LOTE})')
+    campeonato.add_argument('--processos', type=int, help='processos do pool (padrão: um por CPU; 1 joga sem pool)')
+    campeonato.add_argument('--semente', type=int, default=argparse.SUPPRESS,
+                            help='semente do torneio, para repetir as mesmas partidas')
+    campeonato.add_argument('--resultado', metavar='ARQUIVO', default='torneio.json',
+                            help='arquivo JSON do torneio, gravado a cada lote e lido para retomar (padrão: torneio.json)')
+    campeonato.set_defaults(executar=executar_torneio)
+    argumentos = parser.parse_args(argumentos)
+
+    if (argumentos.comando is not None):
+        return argumentos.executar(argumentos)
+
+    cbr = Cbr()
+    dados = Dados()
+    if (not argumentos.roteiro):
+        jogar(cbr, dados, gerador=random.Random(argumentos.semente))
+        return 0
+
+    incompletos = 0
+    for caminho in argumentos.roteiro:
+        if (caminho == '-'):
+            respostas = ler_roteiro(sys.stdin)
         else:
-            # jogo.jogador_fugiu(jogador2, jogador1, jogador2)
-            interface.mostrar_placar_total_jogador_fugiu(jogador2, jogador1.nome, jogador1.pontos, jogador2.nome, jogador2.pontos)
-        
-        # reiniciarJogo()
-
-    else:
-        ganhador = jogo.verificar_ganhador(carta_jogador_01, carta_jogador_02, interface)
-        jogo.quem_joga_primeiro(jogador1, jogador2, carta_jogador_01, carta_jogador_02, ganhador)
-        jogador_ganhou = jogo.adicionar_rodada(jogador1, jogador2, carta_jogador_01, carta_jogador_02, ganhador)
-        if (carta_jogador_01 and carta_jogador_02):
-            jogador2.enriquecer_bot(dados, carta_jogador_01, carta_jogador_02, jogador_ganhou)
-
-    if (jogador1.rodadas == 2 or jogador2.rodadas == 2):
-        ocultar_pontos_ac = True
-        if jogador1.rodadas == 2:
-            jogador1.adicionar_pontos(truco.retornar_valor_aposta())
-            interface.mostrar_ganhador_rodada(jogador1.nome)
-            jogador2.enriquecer_bot(dados, carta_jogador_01, carta_jogador_02, 2)
-            reiniciarJogo()
-
-        elif jogador2.rodadas == 2:
-            jogador2.adicionar_pontos(truco.retornar_valor_aposta())
-            jogador2.enriquecer_bot(dados, carta_jogador_01, carta_jogador_02, 1)
-            interface.mostrar_ganhador_rodada(jogador2.nome)
-            reiniciarJogo()
-
-        interface.mostrar_placar_total(jogador1.nome, jogador1.pontos, jogador2.nome, jogador2.pontos)
-
-    # Caso acabem as cartas nas mãos dos jogadores, ou houve fuga, finaliza as jogadas
-    elif (not(jogador1.checa_mao()) and not(jogador2.checa_mao()) or truco_fugiu is True):
-        pontos_truco = truco.retornar_valor_aposta()
-        ocultar_pontos_ac = True
-        if truco_fugiu is True:
-
-            # jogador1.adicionar_pontos(truco.retornar_valor_aposta())
-            # interface.mostrar_ganhador_rodada(jogador1.nome)
-            reiniciarJogo()
-        
-        elif jogador1.rodadas > jogador2.rodadas:
-            jogador1.adicionar_pontos(truco.retornar_valor_aposta())
-            interface.mostrar_ganhador_rodada(jogador1.nome)
-            reiniciarJogo()
-
-        elif jogador2.rodadas > jogador1.rodadas:
-            jogador2.adicionar_pontos(truco.retornar_valor_aposta())
-            interface.mostrar_ganhador_rodada(jogador2.nome)
-            reiniciarJogo()
-        
-        interface.mostrar_placar_total(jogador1.nome, jogador1.pontos, jogador2.nome, jogador2.pontos)
-
-    if (ocultar_pontos_ac is False):
-        interface.mostrar_placar_rodadas(jogador1.nome, jogador1.rodadas, jogador2.nome, jogador2.rodadas)
-
-    if jogador1.pontos >= 12:
-        interface.mostrar_ganhador_jogo(jogador1.nome)
-        break
-
-    elif jogador2.pontos >= 12:
-        interface.mostrar_ganhador_jogo(jogador2.nome)
-        break
-'''
-To do:
-- Checar funcionamento do Truco/Envido;
-- Diferenciar flag -1 do fugiu_truco da flag de ir ao baralho;
-- Pegar valor da aposta de truco da classe Truco e não do Jogo (verificar atribuição de pontos);
-- Remover o NA da bases de caso, para que os Nearest Neighbors desconsiderem valores inexistentes. Scikit-Learn não aceita valores NaN, então no estado atual foi usado o método fillna, que não é a abordagem ideal para CBR.
-'''
\ No newline at end of file
+            with open(caminho, encoding='utf-8') as arquivo:
+                respostas = ler_roteiro(arquivo)
+
+        saida = io.StringIO() if argumentos.silencioso else sys.stdout
+        try:
+            with contextlib.redirect_stdout(saida):
+                jogar(cbr, dados, entrada_roteirizada(respostas), random.Random(argumentos.semente))
+        except EOFError as erro:
+            incompletos += 1
+            print(f"{caminho}: {erro}", file=sys.stderr)
+
+    return 1 if incompletos else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+import random
+import numpy as np
+
+
+def criar_gerador(semente=None):
+    """Cria um numpy.random.Generator a partir de uma semente (ou de uma SeedSequence)."""
+    return np.random.default_rng(semente)
+
+
+def semente_do_jogo(semente_raiz, jogo):
+    """Retorna a SeedSequence independente do jogo de número 'jogo', derivada da semente raiz.
+
+    'jogo' também pode ser uma tupla de números, para numerar jogos em mais de um nível (por exemplo,
+    o par de jogadores e a partida do par num torneio).
+    """
+    # Equivale ao filho de índice 'jogo' de SeedSequence(semente_raiz).spawn(), então o fluxo de cada
+    # jogo não depende de qual processo o executa nem da ordem de execução.
+    return np.random.SeedSequence(semente_raiz, spawn_key=tuple(jogo) if isinstance(jogo, tuple) else (jogo,))
+
+
+def gerador_do_jogo(semente_raiz, jogo):
+    """Cria o numpy.random.Generator do jogo de número 'jogo'."""
+    return np.random.default_rng(semente_do_jogo(semente_raiz, jogo))
+
+
+def random_do_jogo(semente_raiz, jogo):
+    """Cria um random.Random, semeado pelo fluxo independente do jogo de número 'jogo'."""
+    return random.Random(int(semente_do_jogo(semente_raiz, jogo).generate_state(2, np.uint64)[0]))
+
+
+def criar_geradores(semente_raiz, quantidade, inicio=0):
+    """Cria os geradores de 'quantidade' jogos consecutivos, a partir do jogo 'inicio'."""
+    return [gerador_do_jogo(semente_raiz, jogo) for jogo in range(inicio, inicio + quantidade)]
+
+
+def sortear_uniformes(gerador, quantidade):
+    """Sorteia 'quantidade' números em [0, 1) com um Generator do NumPy, um random.Random ou o módulo random."""
+    if (isinstance(gerador, np.random.Generator)):
+        return gerador.random(quantidade).tolist()
+
+    aleatorio = gerador.random
+    return [aleatorio() for _ in range(quantidade)]
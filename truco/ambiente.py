@@ -0,0 +1,546 @@
+import numpy as np
+from .aleatorio import criar_gerador
+from .baralho import gerar_distribuicoes
+from .bot import Bot
+from .carta import CARTAS
+from .maos import ENVIDO_MAOS, FLOR_MAOS, PONTOS_FLOR_MAOS, PONTOS_IDS, QUALIDADE_MAOS, RANK_ALTA, RANK_MEDIA, RANK_BAIXA
+from .maos import classificar_maos, indices_maos
+from .motor import JOGAR_CARTA_3, TRUCO, FLOR, ENVIDO, REAL_ENVIDO, FALTA_ENVIDO, IR_AO_BARALHO, QUERO, NAO_QUERO
+from .motor import ACOES_MASCARA, BIT_TRUCO, BIT_FLOR, BITS_ENVIDO, BIT_IR_AO_BARALHO, BITS_RESPOSTA, BITS_AUMENTO_ENVIDO
+from .motor import SEM_PEDIDO, PEDIDO_TRUCO, PEDIDO_ENVIDO, PEDIDO_FLOR, SEM_CARTA, PONTOS_VITORIA
+from .motor import VALOR_ENVIDO, PONTOS_RECUSA_ENVIDO, VALOR_FLOR, VALOR_CONTRAFLOR, PONTOS_RECUSA_CONTRAFLOR
+from .vazas import GANHADOR_VAZAS, resolver_vazas, VITORIA, DERROTA
+
+# Colunas das observações (array int16 (K, len(COLUNAS_OBSERVACAO))), do ponto de vista do jogador da vez:
+# só a mão, o envido e a flor dele aparecem. As cartas são ids (SEM_CARTA quando não há), as vazas seguem
+# EstadoJogo.vazas (1 ou 2 para o vencedor, 0 para parda ou não jogada) e 'jogada_<vaza>_<jogador>' é a
+# carta que o jogador jogou na vaza. 'mascara' é a máscara das ações legais, como Motor.mascara_legal.
+COLUNAS_OBSERVACAO = (
+    'jogador', 'jogador_mao', 'carta_1', 'carta_2', 'carta_3', 'carta_mesa',
+    'vaza_1', 'vaza_2', 'vaza_3', 'vazas_jogadas',
+    'jogada_1_1', 'jogada_1_2', 'jogada_2_1', 'jogada_2_2', 'jogada_3_1', 'jogada_3_2',
+    'pontos_1', 'pontos_2', 'valor_aposta', 'quem_aumentou', 'pedido', 'quem_pediu', 'valor_pedido',
+    'envido_fechado', 'envido', 'flor', 'mascara',
+)
+INDICE_OBSERVACAO = {nome: indice for indice, nome in enumerate(COLUNAS_OBSERVACAO)}
+
+# Tabelas por tipo de envido (índice = código da ação), para consultas em lote
+_AUMENTO_ENVIDO = np.zeros(NAO_QUERO + 1, dtype=np.int16)
+_VALOR_ENVIDO = np.zeros(NAO_QUERO + 1, dtype=np.int16)
+_RECUSA_ENVIDO = np.zeros(NAO_QUERO + 1, dtype=np.int16)
+for _tipo, _bits in BITS_AUMENTO_ENVIDO.items():
+    _AUMENTO_ENVIDO[_tipo] = _bits
+for _tipo, _valor in VALOR_ENVIDO.items():
+    _VALOR_ENVIDO[_tipo] = _valor
+for _tipo, _valor in PONTOS_RECUSA_ENVIDO.items():
+    _RECUSA_ENVIDO[_tipo] = _valor
+
+_PESOS_CARTAS = np.array([1, 2, 4], dtype=np.int16)
+
+
+class AmbienteVetorizado():
+    """K partidas independentes avançadas juntas, com o estado de todas em arrays do NumPy.
+
+    Cada campo do EstadoJogo vira um array com uma posição por jogo (e uma coluna por jogador, quando for
+    o caso), e cada passo aplica uma ação em cada jogo seguindo as mesmas regras do Motor. Mãos e partidas
+    encerradas são distribuídas de novo automaticamente, então todo jogo sempre tem um jogador da vez.
+
+    Os nomes reset e step, da interface dos ambientes do gym, são sinônimos de reiniciar e avancar.
+    """
+
+    def __init__(self, quantidade, gerador=None, pontos_vitoria=PONTOS_VITORIA):
+        self.quantidade = quantidade
+        # numpy.random.Generator para as distribuições; aceita também uma semente
+        self.gerador = criar_gerador(gerador)
+        self.pontos_vitoria = pontos_vitoria
+        self._jogos = np.arange(quantidade)
+        self._mascaras = None
+
+        self.pontos = np.zeros((quantidade, 2), dtype=np.int16)
+        self.maos = np.full((quantidade, 2, 3), SEM_CARTA, dtype=np.int8)
+        # Mãos como foram distribuídas, para as consultas que dependem das três cartas
+        self.maos_iniciais = np.zeros((quantidade, 2, 3), dtype=np.int8)
+        self.jogador_mao = np.full(quantidade, 2, dtype=np.int8)
+        # Mãos distribuídas em cada jogo desde a criação do ambiente, sem zerar entre partidas
+        self.maos_distribuidas = np.zeros(quantidade, dtype=np.int64)
+        self.vez = np.ones(quantidade, dtype=np.int8)
+        self.lider = np.ones(quantidade, dtype=np.int8)
+        self.carta_mesa = np.full(quantidade, SEM_CARTA, dtype=np.int8)
+        self.vazas = np.zeros((quantidade, 3), dtype=np.int8)
+        self.vazas_jogadas = np.zeros(quantidade, dtype=np.int8)
+        # Carta jogada por cada jogador em cada vaza: jogadas[jogo, vaza, jogador - 1]
+        self.jogadas = np.full((quantidade, 3, 2), SEM_CARTA, dtype=np.int8)
+
+        self.valor_aposta = np.ones(quantidade, dtype=np.int8)
+        self.quem_aumentou = np.zeros(quantidade, dtype=np.int8)
+        self.pedido = np.zeros(quantidade, dtype=np.int8)
+        self.quem_pediu = np.zeros(quantidade, dtype=np.int8)
+        self.valor_pedido = np.zeros(quantidade, dtype=np.int8)
+        self.vez_retorno = np.zeros(quantidade, dtype=np.int8)
+
+        self.valor_envido = np.zeros(quantidade, dtype=np.int8)
+        self.envido_fechado = np.zeros(quantidade, dtype=bool)
+        self.envido = np.zeros((quantidade, 2), dtype=np.int8)
+        self.flor = np.zeros((quantidade, 2), dtype=bool)
+        self.pontos_flor = np.zeros((quantidade, 2), dtype=np.int8)
+        self.vencedor_envido = np.zeros(quantidade, dtype=np.int8)
+        self.vencedor_flor = np.zeros(quantidade, dtype=np.int8)
+
+        self.vencedor_mao = np.zeros(quantidade, dtype=np.int8)
+        self.pontos_mao = np.zeros(quantidade, dtype=np.int8)
+        self.vencedor = np.zeros(quantidade, dtype=np.int8)
+
+    def reiniciar(self):
+        """Começa uma nova partida em todos os jogos e retorna as K observações."""
+        self._nova_partida(self._jogos)
+        return self.observacoes()
+
+    def mascaras(self):
+        """Máscaras de bits (K,) das ações legais do jogador da vez em cada jogo, como Motor.mascara_legal."""
+        if (self._mascaras is not None):
+            return self._mascaras
+
+        jogos = self._jogos
+        vez = self.vez
+        pode_flor = self.flor[jogos, vez - 1] & ~self.envido_fechado
+        bit_flor = np.where(pode_flor, BIT_FLOR, 0)
+
+        cartas = (self.maos[jogos, vez - 1] != SEM_CARTA) @ _PESOS_CARTAS
+        livre = (cartas | bit_flor | BIT_IR_AO_BARALHO
+                 | np.where((self.valor_aposta < 4) & (self.quem_aumentou != vez), BIT_TRUCO, 0)
+                 | np.where(self.envido_fechado, 0, BITS_ENVIDO))
+        truco = BITS_RESPOSTA | np.where(self.valor_pedido < 4, BIT_TRUCO, 0)
+        envido = BITS_RESPOSTA | _AUMENTO_ENVIDO[self.valor_pedido] | bit_flor
+
+        pedido = self.pedido
+        mascaras = np.select([pedido == SEM_PEDIDO, pedido == PEDIDO_TRUCO, pedido == PEDIDO_ENVIDO],
+                             [livre, truco, envido], BITS_RESPOSTA).astype(np.int16)
+        mascaras[self.vencedor_mao > 0] = 0
+        self._mascaras = mascaras
+        return mascaras
+
+    def acoes_legais(self, jogo):
+        """Tupla das ações legais do jogador da vez no jogo informado."""
+        return ACOES_MASCARA[int(self.mascaras()[jogo])]
+
+    def observacoes(self):
+        """Observações (K, len(COLUNAS_OBSERVACAO)) do jogador da vez em cada jogo."""
+        jogos = self._jogos
+        jogador = self.vez - 1
+        observacoes = np.empty((self.quantidade, len(COLUNAS_OBSERVACAO)), dtype=np.int16)
+        observacoes[:, 0] = self.vez
+        observacoes[:, 1] = self.jogador_mao
+        observacoes[:, 2:5] = self.maos[jogos, jogador]
+        observacoes[:, 5] = self.carta_mesa
+        observacoes[:, 6:9] = self.vazas
+        observacoes[:, 9] = self.vazas_jogadas
+        observacoes[:, 10:16] = self.jogadas.reshape(self.quantidade, 6)
+        observacoes[:, 16:18] = self.pontos
+        observacoes[:, 18] = self.valor_aposta
+        observacoes[:, 19] = self.quem_aumentou
+        observacoes[:, 20] = self.pedido
+        observacoes[:, 21] = self.quem_pediu
+        observacoes[:, 22] = self.valor_pedido
+        observacoes[:, 23] = self.envido_fechado
+        observacoes[:, 24] = self.envido[jogos, jogador]
+        observacoes[:, 25] = self.flor[jogos, jogador]
+        observacoes[:, 26] = self.mascaras()
+        return observacoes
+
+    def avancar(self, acoes):
+        """Aplica uma ação (código de truco.motor) do jogador da vez em cada jogo.
+
+        Levanta ValueError, sem alterar nenhum jogo, se alguma ação não for legal. Retorna as novas
+        observações, os pontos (K, 2) feitos por cada jogador no passo, quais partidas terminaram (K,)
+        e um dicionário com as mãos encerradas ('maos_encerradas') e o vencedor de cada partida
+        terminada ('vencedores', 0 nas demais). Os jogos encerrados já voltam com a nova mão distribuída.
+        """
+        acoes = np.asarray(acoes, dtype=np.intp)
+        if (acoes.shape != (self.quantidade,)):
+            raise ValueError(f"São esperadas {self.quantidade} ações, uma por jogo.")
+
+        validas = (acoes >= 0) & (acoes <= NAO_QUERO)
+        ilegais = ~validas | ((self.mascaras() >> np.where(validas, acoes, 0)) & 1 == 0)
+        if (ilegais.any()):
+            raise ValueError(f"Ações não permitidas no estado atual dos jogos {np.flatnonzero(ilegais).tolist()}.")
+
+        pontos = self.pontos.copy()
+        pedido = self.pedido.copy()
+        self._mascaras = None
+
+        # Cada jogo aplica exatamente uma ação, então os grupos abaixo não se sobrepõem
+        cartas = np.flatnonzero(acoes <= JOGAR_CARTA_3)
+        self._jogar_cartas(cartas, acoes[cartas])
+
+        baralho = np.flatnonzero(acoes == IR_AO_BARALHO)
+        self._encerrar_mao(baralho, 3 - self.vez[baralho], self.valor_aposta[baralho])
+
+        self._pedir_truco(np.flatnonzero(acoes == TRUCO))
+        self._cantar_flor(np.flatnonzero(acoes == FLOR))
+
+        envidos = np.flatnonzero((acoes >= ENVIDO) & (acoes <= FALTA_ENVIDO))
+        self._pedir_envido(envidos, acoes[envidos])
+
+        respostas = acoes >= QUERO
+        for tipo, responder in ((PEDIDO_TRUCO, self._responder_truco), (PEDIDO_ENVIDO, self._responder_envido),
+                                (PEDIDO_FLOR, self._responder_flor)):
+            jogos = np.flatnonzero(respostas & (pedido == tipo))
+            responder(jogos, acoes[jogos] == QUERO)
+
+        recompensas = self.pontos - pontos
+        maos_encerradas = self.vencedor_mao > 0
+        terminadas = self.vencedor > 0
+        vencedores = self.vencedor.copy()
+        self._nova_partida(np.flatnonzero(terminadas))
+        self._nova_mao(np.flatnonzero(maos_encerradas & ~terminadas))
+        return self.observacoes(), recompensas, terminadas, {'maos_encerradas': maos_encerradas, 'vencedores': vencedores}
+
+    reset = reiniciar
+    step = avancar
+
+    def _nova_partida(self, jogos):
+        """Zera o placar dos jogos e distribui a primeira mão, com o jogador 1 como mão."""
+        self.pontos[jogos] = 0
+        self.jogador_mao[jogos] = 2
+        self.vencedor[jogos] = 0
+        self._nova_mao(jogos)
+
+    def _nova_mao(self, jogos, maos=None):
+        """Distribui uma nova mão nos jogos (ou usa os ids (N, 2, 3) de 'maos'), alternando quem é mão."""
+        if (len(jogos) == 0):
+            return
+
+        if (maos is None):
+            maos = gerar_distribuicoes(len(jogos), self.gerador)
+        self._mascaras = None
+        self.maos[jogos] = maos
+        self.maos_iniciais[jogos] = maos
+        indices = indices_maos(np.reshape(maos, (-1, 3))).reshape(-1, 2)
+        self.envido[jogos] = ENVIDO_MAOS[indices]
+        self.flor[jogos] = FLOR_MAOS[indices]
+        self.pontos_flor[jogos] = PONTOS_FLOR_MAOS[indices]
+
+        self.jogador_mao[jogos] = 3 - self.jogador_mao[jogos]
+        self.maos_distribuidas[jogos] += 1
+        self.vez[jogos] = self.lider[jogos] = self.jogador_mao[jogos]
+        self.carta_mesa[jogos] = SEM_CARTA
+        self.vazas[jogos] = 0
+        self.vazas_jogadas[jogos] = 0
+        self.jogadas[jogos] = SEM_CARTA
+        self.valor_aposta[jogos] = 1
+        for campo in (self.quem_aumentou, self.pedido, self.quem_pediu, self.valor_pedido, self.vez_retorno,
+                      self.valor_envido, self.vencedor_envido, self.vencedor_flor, self.vencedor_mao, self.pontos_mao):
+            campo[jogos] = 0
+        self.envido_fechado[jogos] = False
+
+    def _pedir(self, jogos, jogadores):
+        """Registra quem fez o pedido e passa a vez ao oponente, que deve responder."""
+        self.quem_pediu[jogos] = jogadores
+        self.vez[jogos] = 3 - jogadores
+
+    def _fechar_pedido(self, jogos):
+        """Encerra o pedido pendente e devolve a vez a quem estava jogando."""
+        self.pedido[jogos] = SEM_PEDIDO
+        self.vez[jogos] = self.vez_retorno[jogos]
+
+    def _jogar_cartas(self, jogos, posicoes):
+        jogadores = self.vez[jogos]
+        cartas = self.maos[jogos, jogadores - 1, posicoes]
+        self.maos[jogos, jogadores - 1, posicoes] = SEM_CARTA
+        self.jogadas[jogos, self.vazas_jogadas[jogos], jogadores - 1] = cartas
+
+        abertura = self.carta_mesa[jogos] == SEM_CARTA
+        abrem = jogos[abertura]
+        self.carta_mesa[abrem] = cartas[abertura]
+        self.vez[abrem] = 3 - jogadores[abertura]
+
+        # Segunda carta das vazas: todas resolvidas numa só consulta, do ponto de vista de quem abriu
+        fecham = jogos[~abertura]
+        jogadores = jogadores[~abertura]
+        resultados = resolver_vazas(self.carta_mesa[fecham], cartas[~abertura])
+        lideres = self.lider[fecham]
+        vencedores = np.where(resultados == VITORIA, lideres, np.where(resultados == DERROTA, jogadores, 0)).astype(np.int8)
+
+        indices = self.vazas_jogadas[fecham]
+        self.vazas[fecham, indices] = vencedores
+        self.vazas_jogadas[fecham] = indices + 1
+        self.carta_mesa[fecham] = SEM_CARTA
+        self.envido_fechado[fecham] = True
+
+        vazas = self.vazas[fecham]
+        vencedores_mao = GANHADOR_VAZAS[indices + 1, vazas[:, 0], vazas[:, 1], vazas[:, 2], self.jogador_mao[fecham]]
+        encerradas = vencedores_mao > 0
+        self._encerrar_mao(fecham[encerradas], vencedores_mao[encerradas], self.valor_aposta[fecham[encerradas]])
+
+        # Quem vence a vaza abre a próxima; em caso de parda, quem abriu continua abrindo
+        continuam = fecham[~encerradas]
+        lideres = np.where(vencedores[~encerradas] > 0, vencedores[~encerradas], lideres[~encerradas])
+        self.lider[continuam] = lideres
+        self.vez[continuam] = lideres
+
+    def _pedir_truco(self, jogos):
+        jogadores = self.vez[jogos]
+        aumento = self.pedido[jogos] == PEDIDO_TRUCO
+        # Aumentar a aposta aceita o pedido anterior
+        aumentam = jogos[aumento]
+        self.valor_aposta[aumentam] = self.valor_pedido[aumentam]
+        self.quem_aumentou[aumentam] = self.quem_pediu[aumentam]
+        pedem = jogos[~aumento]
+        self.pedido[pedem] = PEDIDO_TRUCO
+        self.vez_retorno[pedem] = jogadores[~aumento]
+
+        self.valor_pedido[jogos] = self.valor_aposta[jogos] + 1
+        self._pedir(jogos, jogadores)
+
+    def _pedir_envido(self, jogos, tipos):
+        jogadores = self.vez[jogos]
+        # Aumentar o envido aceita o pedido anterior, cujos pontos se somam aos do aumento
+        aumentam = jogos[self.pedido[jogos] == PEDIDO_ENVIDO]
+        self.valor_envido[aumentam] += _VALOR_ENVIDO[self.valor_pedido[aumentam]]
+        livres = self.pedido[jogos] == SEM_PEDIDO
+        self.pedido[jogos[livres]] = PEDIDO_ENVIDO
+        self.vez_retorno[jogos[livres]] = jogadores[livres]
+        self.valor_pedido[jogos] = tipos
+        self._pedir(jogos, jogadores)
+
+    def _cantar_flor(self, jogos):
+        jogadores = self.vez[jogos]
+        livres = self.pedido[jogos] == SEM_PEDIDO
+        self.vez_retorno[jogos[livres]] = jogadores[livres]
+        self.envido_fechado[jogos] = True
+
+        # Se o oponente também tem flor, ele decide se aceita a contraflor
+        contraflor = self.flor[jogos, 2 - jogadores]
+        self.pedido[jogos[contraflor]] = PEDIDO_FLOR
+        self._pedir(jogos[contraflor], jogadores[contraflor])
+
+        cantam = jogos[~contraflor]
+        self._fechar_pedido(cantam)
+        self.vencedor_flor[cantam] = jogadores[~contraflor]
+        self._adicionar_pontos(cantam, jogadores[~contraflor], VALOR_FLOR)
+
+    def _responder_truco(self, jogos, aceitou):
+        aceitam = jogos[aceitou]
+        self.valor_aposta[aceitam] = self.valor_pedido[aceitam]
+        self.quem_aumentou[aceitam] = self.quem_pediu[aceitam]
+        self._fechar_pedido(aceitam)
+
+        # Quem recusou entrega a aposta que valia antes do pedido
+        recusam = jogos[~aceitou]
+        self._encerrar_mao(recusam, self.quem_pediu[recusam], self.valor_aposta[recusam])
+
+    def _responder_envido(self, jogos, aceitou):
+        tipos = self.valor_pedido[jogos]
+        self.envido_fechado[jogos] = True
+        self._fechar_pedido(jogos)
+
+        # A falta é o que falta para quem está ganhando vencer a partida
+        aceitos = self.valor_envido[jogos]
+        valores = np.where(tipos == FALTA_ENVIDO, self.pontos_vitoria - self.pontos[jogos].max(axis=1), aceitos + _VALOR_ENVIDO[tipos])
+        envido = self.envido[jogos]
+        vencedores = np.where(envido[:, 0] == envido[:, 1], self.jogador_mao[jogos], np.where(envido[:, 0] > envido[:, 1], 1, 2))
+
+        vencedores = np.where(aceitou, vencedores, self.quem_pediu[jogos]).astype(np.int8)
+        self.vencedor_envido[jogos] = vencedores
+        # Recusar um aumento entrega o envido já aceito; recusar o primeiro pedido, os pontos do seu tipo
+        recusa = np.where(aceitos > 0, aceitos, _RECUSA_ENVIDO[tipos])
+        self._adicionar_pontos(jogos, vencedores, np.where(aceitou, valores, recusa))
+
+    def _responder_flor(self, jogos, aceitou):
+        self._fechar_pedido(jogos)
+
+        flor = self.pontos_flor[jogos]
+        vencedores = np.where(flor[:, 0] == flor[:, 1], self.jogador_mao[jogos], np.where(flor[:, 0] > flor[:, 1], 1, 2))
+        vencedores = np.where(aceitou, vencedores, self.quem_pediu[jogos]).astype(np.int8)
+        self.vencedor_flor[jogos] = vencedores
+        self._adicionar_pontos(jogos, vencedores, np.where(aceitou, VALOR_CONTRAFLOR, PONTOS_RECUSA_CONTRAFLOR))
+
+    def _adicionar_pontos(self, jogos, jogadores, pontos):
+        """Soma pontos fora do resultado da mão (envido e flor), encerrando a partida de quem chegar à vitória."""
+        self.pontos[jogos, jogadores - 1] += pontos
+        venceram = self.pontos[jogos, jogadores - 1] >= self.pontos_vitoria
+        self.vencedor[jogos[venceram]] = jogadores[venceram]
+        self.vencedor_mao[jogos[venceram]] = jogadores[venceram]
+
+    def _encerrar_mao(self, jogos, vencedores, pontos):
+        self.pedido[jogos] = SEM_PEDIDO
+        self.vencedor_mao[jogos] = vencedores
+        self.pontos_mao[jogos] = pontos
+        self.pontos[jogos, vencedores - 1] += pontos
+        venceram = self.pontos[jogos, vencedores - 1] >= self.pontos_vitoria
+        self.vencedor[jogos[venceram]] = vencedores[venceram]
+
+
+class DecisorAleatorio():
+    """Escolhe uniformemente entre as ações legais, em todos os jogos de uma vez."""
+
+    def __init__(self, gerador=None):
+        self.gerador = criar_gerador(gerador)
+
+    def decidir(self, ambiente, jogos):
+        """Retorna uma ação legal para cada um dos jogos informados."""
+        bits = (ambiente.mascaras()[jogos, None] >> np.arange(NAO_QUERO + 1)) & 1
+        sorteios = np.where(bits == 1, self.gerador.random(bits.shape), -1.0)
+        return np.argmax(sorteios, axis=1)
+
+
+# Número e naipe (na codificação da base de casos) de cada id; a última posição serve para SEM_CARTA
+NUMERO_IDS = np.array([carta.retornar_numero() for carta in CARTAS] + [0], dtype=np.int16)
+NAIPE_IDS = np.array([carta.retornar_naipe_codificado() for carta in CARTAS] + [0], dtype=np.int16)
+
+_RANKS_CBR = ((RANK_ALTA, 'Alta'), (RANK_MEDIA, 'Media'), (RANK_BAIXA, 'Baixa'))
+_VAZAS_CBR = (('primeira', 'Primeira'), ('segunda', 'Segunda'), ('terceira', 'Terceira'))
+
+
+class DecisorCbr():
+    """Aproximação em lote da PoliticaCbr: decide por todos os jogos em que é a vez do bot com uma só consulta ao CBR.
+
+    Os registros de caso são montados a partir do estado de cada jogo, com os campos que o Bot
+    preenche via Dados (cartas e naipes das duas mãos já jogadas, ganhador de cada vaza e a mão
+    do bot), e os vizinhos de todos eles vêm de uma única chamada a kneighbors. As regras de decisão
+    são as da PoliticaCbr, com as versões em lote dos métodos do Cbr; 'limiar_perdendo' e
+    'fator_perdendo' são os limiares de Bot.avaliar_envido.
+
+    Os registros consultados não são os mesmos da PoliticaCbr, então as decisões podem diferir:
+    a mão do bot (cartaAlta/Media/Baixa) e as vazas já estão preenchidas desde a primeira decisão,
+    a carta de abertura do oponente já está no registro quando o bot sonda o envido, e nada do
+    registro passa de uma mão para a outra.
+    """
+
+    RESPOSTAS_TRUCO = np.array([NAO_QUERO, QUERO, TRUCO])
+    RESPOSTAS_ENVIDO = np.array([NAO_QUERO, QUERO, REAL_ENVIDO, FALTA_ENVIDO])
+
+    def __init__(self, cbr, jogador=2, limiar_perdendo=Bot.LIMIAR_PERDENDO, fator_perdendo=Bot.FATOR_PERDENDO):
+        self.cbr = cbr
+        self.jogador = jogador
+        self.limiar_perdendo = limiar_perdendo
+        self.fator_perdendo = fator_perdendo
+        # Por jogo: se o bot já considerou pedir truco na mão atual, e de qual mão é essa informação
+        self.pediu_truco = None
+        self._maos = None
+
+    def registros(self, ambiente, jogos):
+        """Registros de caso (N, colunas de cbr.dataset) dos jogos, com o bot como jogador 2 da base de casos."""
+        bot = self.jogador - 1
+        oponente = 1 - bot
+        vazas = ambiente.vazas[jogos]
+        # Na base de casos o oponente é sempre o jogador 1 e o bot, o jogador 2
+        vencedores = np.select([vazas == self.jogador, vazas > 0], [2, 1], 0)
+        vencedores[np.arange(3) >= ambiente.vazas_jogadas[jogos, None]] = 0
+
+        mao = ambiente.maos_iniciais[jogos, bot]
+        pontos, ranks = classificar_maos(mao)
+        campos = {
+            'jogadorMao': np.where(ambiente.jogador_mao[jogos] == self.jogador, 2, 1),
+            'qualidadeMaoRobo': QUALIDADE_MAOS[indices_maos(mao)],
+            'pontosEnvidoRobo': ambiente.envido[jogos, bot],
+        }
+        for rank, nome in _RANKS_CBR:
+            posicoes = np.argmax(ranks == rank, axis=1)[:, None]
+            campos[f'carta{nome}Robo'] = np.take_along_axis(pontos, posicoes, axis=1)[:, 0]
+            campos[f'naipeCarta{nome}Robo'] = NAIPE_IDS[np.take_along_axis(mao, posicoes, axis=1)[:, 0]]
+
+        for vaza, (nome, Nome) in enumerate(_VAZAS_CBR):
+            jogadas = ambiente.jogadas[jogos, vaza]
+            campos[f'{nome}CartaRobo'] = NUMERO_IDS[jogadas[:, bot]]
+            campos[f'naipe{Nome}CartaRobo'] = NAIPE_IDS[jogadas[:, bot]]
+            campos[f'{nome}CartaHumano'] = NUMERO_IDS[jogadas[:, oponente]]
+            campos[f'naipe{Nome}CartaHumano'] = NAIPE_IDS[jogadas[:, oponente]]
+            campos[f'ganhador{Nome}Rodada'] = vencedores[:, vaza]
+
+        colunas = self.cbr.dataset.columns
+        registros = np.zeros((len(jogos), len(colunas)))
+        for nome, valores in campos.items():
+            if (nome in colunas):
+                registros[:, colunas.get_loc(nome)] = valores
+        return registros
+
+    def decidir(self, ambiente, jogos):
+        """Retorna a ação do bot em cada um dos jogos informados, em que deve ser a vez dele."""
+        if (self._maos is None or len(self._maos) != ambiente.quantidade):
+            self.pediu_truco = np.zeros(ambiente.quantidade, dtype=bool)
+            self._maos = np.zeros(ambiente.quantidade, dtype=np.int64)
+        novas = jogos[ambiente.maos_distribuidas[jogos] != self._maos[jogos]]
+        self.pediu_truco[novas] = False
+        self._maos[novas] = ambiente.maos_distribuidas[novas]
+
+        acoes = np.full(len(jogos), QUERO, dtype=np.intp)
+        mascaras = ambiente.mascaras()[jogos]
+        pedido = ambiente.pedido[jogos]
+        flor = (pedido == SEM_PEDIDO) & (mascaras >> FLOR & 1 == 1)
+        acoes[flor] = FLOR
+
+        # Contraflor é sempre aceita; as demais decisões consultam o CBR, todas numa só chamada
+        consultas = np.flatnonzero(~flor & (pedido != PEDIDO_FLOR))
+        if (len(consultas)):
+            vizinhos = self.cbr.consultar_vizinhos(self.registros(ambiente, jogos[consultas]))
+            acoes[consultas] = self._decidir_consultas(ambiente, jogos[consultas], vizinhos, mascaras[consultas], pedido[consultas])
+        return acoes
+
+    def _decidir_consultas(self, ambiente, jogos, vizinhos, mascaras, pedido):
+        cbr = self.cbr
+        bot = self.jogador - 1
+        pontos_bot = ambiente.pontos[jogos, bot]
+        pontos_oponente = ambiente.pontos[jogos, 1 - bot]
+        perdendo = (pontos_oponente > self.limiar_perdendo) | (pontos_oponente > (pontos_bot / self.fator_perdendo).astype(int))
+        envido = ambiente.envido[jogos, bot]
+        qualidade = QUALIDADE_MAOS[indices_maos(ambiente.maos_iniciais[jogos, bot])]
+        acoes = np.full(len(jogos), QUERO, dtype=np.intp)
+
+        def legais(linhas, escolhidas):
+            return np.where(mascaras[linhas] >> escolhidas & 1 == 1, escolhidas, QUERO)
+
+        truco = np.flatnonzero(pedido == PEDIDO_TRUCO)
+        acoes[truco] = legais(truco, self.RESPOSTAS_TRUCO[cbr.trucos(vizinhos[truco], qualidade[truco])])
+
+        envidos = np.flatnonzero(pedido == PEDIDO_ENVIDO)
+        quem_pediu = np.where(ambiente.quem_pediu[jogos[envidos]] == self.jogador, 2, 1)
+        escolhas = cbr.envidos(vizinhos[envidos], ambiente.valor_pedido[jogos[envidos]], quem_pediu, envido[envidos], perdendo[envidos])
+        acoes[envidos] = legais(envidos, np.where(escolhas <= 3, self.RESPOSTAS_ENVIDO[np.minimum(escolhas, 3)], QUERO))
+
+        # Na vez do bot: pedir envido, pedir truco ou, se não pedir nada, jogar a carta sugerida pelo CBR
+        livres = pedido == SEM_PEDIDO
+        sonda = np.flatnonzero(livres & (mascaras >> ENVIDO & 1 == 1) & (envido > 0))
+        escolhas = cbr.envidos(vizinhos[sonda], 0, 2, envido[sonda], perdendo[sonda])
+        pede_envido = np.isin(escolhas, (ENVIDO, REAL_ENVIDO, FALTA_ENVIDO))
+        acoes[sonda[pede_envido]] = escolhas[pede_envido]
+        livres[sonda[pede_envido]] = False
+
+        mao = ambiente.maos[jogos, bot]
+        restantes = np.count_nonzero(mao != SEM_CARTA, axis=1)
+        sonda = np.flatnonzero(livres & (restantes <= 2) & ~self.pediu_truco[jogos])
+        querem = np.isin(cbr.trucos(vizinhos[sonda], qualidade[sonda]), (1, 2))
+        self.pediu_truco[jogos[sonda[querem]]] = True
+        # Sem truco legal, o bot desiste do pedido e joga a carta, como na PoliticaCbr
+        pede_truco = sonda[querem][mascaras[sonda[querem]] >> TRUCO & 1 == 1]
+        acoes[pede_truco] = TRUCO
+        livres[pede_truco] = False
+
+        cartas = np.flatnonzero(livres)
+        mao = mao[cartas]
+        pontuacoes = np.where(mao != SEM_CARTA, PONTOS_IDS[mao], -1)
+        escolhas = cbr.jogar_cartas(vizinhos[cartas], 4 - restantes[cartas], pontuacoes)
+        # Sem referência (-1), o bot joga a última carta que resta
+        ultimas = 2 - np.argmax(mao[:, ::-1] != SEM_CARTA, axis=1)
+        acoes[cartas] = np.where(escolhas >= 0, escolhas, ultimas)
+        return acoes
+
+
+def decidir_jogos(ambiente, decisores):
+    """Ações de todos os jogos do ambiente, pedindo a cada decisor (dos jogadores 1 e 2) as dos jogos em que é a sua vez."""
+    acoes = np.empty(ambiente.quantidade, dtype=np.intp)
+    for jogador, decisor in enumerate(decisores, 1):
+        jogos = np.flatnonzero(ambiente.vez == jogador)
+        if (len(jogos)):
+            acoes[jogos] = decisor.decidir(ambiente, jogos)
+    return acoes
+
+
+def jogar_partidas(ambiente, decisores, partidas):
+    """Joga no ambiente até terminar pelo menos 'partidas' partidas, retornando as vitórias de cada jogador (array (2,))."""
+    vitorias = np.zeros(2, dtype=np.int64)
+    ambiente.reiniciar()
+    while (vitorias.sum() < partidas):
+        _, _, terminadas, info = ambiente.avancar(decidir_jogos(ambiente, decisores))
+        vitorias += np.bincount(info['vencedores'][terminadas], minlength=3)[1:]
+    return vitorias
@@ -1,25 +1,57 @@
-from .carta import Carta
+from .carta import CARTAS
+from .aleatorio import sortear_uniformes
+from functools import lru_cache
+import itertools
+from math import comb
+import numpy as np
 import random
 
+# Quantidade padrão de distribuições geradas por bloco, limitando a memória das chaves aleatórias (40 floats por distribuição)
+TAMANHO_BLOCO = 65536
+
 
 class Baralho():
     
-    def __init__(self):
+    def __init__(self, gerador=None):
+        # Gerador de números aleatórios: numpy.random.Generator, random.Random ou, por padrão, o módulo random
+        self.gerador = random if gerador is None else gerador
         # self.vira = []
         self.manilhas = []
         self.cartas = []
+        # Permutação dos ids das cartas usada por distribuir(), reaproveitada entre as mãos
+        self.indices = list(range(len(CARTAS)))
         self.criar_baralho() 
 
     def criar_baralho(self):
         """Cria o baralho baseado nos 4 diferentes naipes, removendo cartas de 8 a 10."""
-        for i in ["ESPADAS", "OUROS", "COPAS", "BASTOS"]:
-            for n in range(1, 13):
-                if n < 8 or n >= 10:
-                    self.cartas.append(Carta(n, i))
+        # As cartas são compartilhadas (imutáveis), então não é preciso criá-las novamente a cada mão
+        self.cartas.extend(CARTAS)
     
     def embaralhar(self):
         """Embaralha o baralho de forma aleatõria."""
-        random.shuffle(self.cartas)
+        self.gerador.shuffle(self.cartas)
+
+    def distribuir(self, jogadores=2, cartas=3):
+        """Distribui as mãos a partir do baralho completo, sem recriá-lo nem alterar self.cartas, retornando uma mão por jogador."""
+        return [[CARTAS[id] for id in mao] for mao in self.distribuir_ids(jogadores, cartas)]
+
+    def distribuir_ids(self, jogadores=2, cartas=3):
+        """Como distribuir(), mas retorna os ids das cartas de cada mão."""
+        # Fisher-Yates parcial sobre os índices: só as posições distribuídas são sorteadas.
+        # A lista continua sendo uma permutação, então pode ser reaproveitada na próxima mão.
+        indices = self.indices
+        total = jogadores * cartas
+        restantes = len(indices)
+        if (total > restantes):
+            raise ValueError(f"Não há cartas suficientes para distribuir {cartas} cartas a {jogadores} jogadores.")
+
+        sorteios = sortear_uniformes(self.gerador, total)
+        for i in range(total):
+            j = i + int(sorteios[i] * (restantes - i))
+            indices[i], indices[j] = indices[j], indices[i]
+
+        # As cartas são entregues alternadamente, uma a cada jogador
+        return [indices[jogador:total:jogadores] for jogador in range(jogadores)]
 
     def retirar_carta(self):
         """Retira uma carta quando o jogador for receber as cartas na mesa."""
@@ -34,4 +66,96 @@ class Baralho():
     def printar_baralho(self):
         """Exibe o baralho inteiro."""
         for c in self.cartas:
-            c.exibir_carta()
\ No newline at end of file
+            c.exibir_carta()
+
+
+def _sortear_distribuicoes(gerador, quantidade, total):
+    """Sorteia 'quantidade' distribuições de 'total' cartas distintas, ordenando as cartas por chaves aleatórias."""
+    chaves = gerador.random((quantidade, len(CARTAS)))
+    escolhidas = np.argpartition(chaves, total - 1, axis=1)[:, :total]
+    # argpartition não garante a ordem entre as escolhidas, então elas são ordenadas pela própria chave
+    ordem = np.argsort(np.take_along_axis(chaves, escolhidas, axis=1), axis=1)
+    return np.take_along_axis(escolhidas, ordem, axis=1).astype(np.int8)
+
+
+def gerar_distribuicoes_em_blocos(quantidade, gerador=None, jogadores=2, cartas=3, tamanho_bloco=TAMANHO_BLOCO):
+    """Gera 'quantidade' distribuições aleatórias em blocos de arrays int8 (até tamanho_bloco, jogadores, cartas) com os ids das cartas."""
+    gerador = np.random.default_rng(gerador)
+    total = jogadores * cartas
+    while (quantidade > 0):
+        bloco = min(quantidade, tamanho_bloco)
+        yield _sortear_distribuicoes(gerador, bloco, total).reshape(bloco, jogadores, cartas)
+        quantidade -= bloco
+
+
+def gerar_distribuicoes(quantidade, gerador=None, jogadores=2, cartas=3, tamanho_bloco=TAMANHO_BLOCO):
+    """Gera 'quantidade' distribuições aleatórias num único array int8 (quantidade, jogadores, cartas); use reshape(quantidade, -1) para (N, 6)."""
+    distribuicoes = np.empty((quantidade, jogadores, cartas), dtype=np.int8)
+    inicio = 0
+    for bloco in gerar_distribuicoes_em_blocos(quantidade, gerador, jogadores, cartas, tamanho_bloco):
+        distribuicoes[inicio:inicio + len(bloco)] = bloco
+        inicio += len(bloco)
+
+    return distribuicoes
+
+
+@lru_cache(maxsize=None)
+def _combinacoes(n, k):
+    """Todas as combinações de k posições entre n, como array (C(n, k), k), calculadas uma única vez."""
+    combinacoes = np.fromiter(itertools.chain.from_iterable(itertools.combinations(range(n), k)), dtype=np.int8, count=comb(n, k) * k)
+    combinacoes = combinacoes.reshape(comb(n, k), k)
+    combinacoes.flags.writeable = False
+    return combinacoes
+
+
+def _ids(cartas):
+    """Aceita cartas (Carta) ou ids e retorna a lista de ids."""
+    return [getattr(carta, 'id', carta) for carta in cartas]
+
+
+def _cartas_livres(*grupos):
+    """Retorna, em ordem, os ids que não aparecem em nenhum dos grupos."""
+    usadas = set(itertools.chain.from_iterable(grupos))
+    return np.array([id for id in range(len(CARTAS)) if id not in usadas], dtype=np.int8)
+
+
+def enumerar_maos(conhecidas=(), removidas=(), cartas=3, tamanho_bloco=TAMANHO_BLOCO):
+    """Gera, em blocos int8 (m, cartas), todas as mãos que contêm as cartas conhecidas e nenhuma das removidas."""
+    conhecidas, removidas = _ids(conhecidas), _ids(removidas)
+    livres = _cartas_livres(conhecidas, removidas)
+    completar = livres[_combinacoes(len(livres), cartas - len(conhecidas))]
+
+    for inicio in range(0, len(completar), tamanho_bloco):
+        bloco = completar[inicio:inicio + tamanho_bloco]
+        fixas = np.broadcast_to(np.array(conhecidas, dtype=np.int8), (len(bloco), len(conhecidas)))
+        yield np.hstack((fixas, bloco))
+
+
+def enumerar_distribuicoes(conhecidas_1=(), conhecidas_2=(), removidas=(), cartas=3, tamanho_bloco=TAMANHO_BLOCO):
+    """Gera, em blocos int8 (m, 2, cartas), todas as distribuições de duas mãos consistentes com as cartas conhecidas de cada jogador e as removidas."""
+    conhecidas_1, conhecidas_2, removidas = _ids(conhecidas_1), _ids(conhecidas_2), _ids(removidas)
+    livres = _cartas_livres(conhecidas_1, conhecidas_2, removidas)
+    faltam_1, faltam_2 = cartas - len(conhecidas_1), cartas - len(conhecidas_2)
+    posicoes_1 = _combinacoes(len(livres), faltam_1)
+    posicoes_2 = _combinacoes(len(livres) - faltam_1, faltam_2)
+
+    # Para cada mão do jogador 1, as cartas livres que sobram para o jogador 2 (em ordem)
+    sobra = np.ones((len(posicoes_1), len(livres)), dtype=bool)
+    np.put_along_axis(sobra, posicoes_1.astype(np.intp), False, axis=1)
+    restantes = np.broadcast_to(livres, sobra.shape)[sobra].reshape(len(posicoes_1), -1)
+    maos_1 = livres[posicoes_1]
+
+    fixas_1 = np.array(conhecidas_1, dtype=np.int8)
+    fixas_2 = np.array(conhecidas_2, dtype=np.int8)
+    linhas_por_bloco = max(1, tamanho_bloco // max(1, len(posicoes_2)))
+    for inicio in range(0, len(posicoes_1), linhas_por_bloco):
+        fim = min(inicio + linhas_por_bloco, len(posicoes_1))
+        quantidade = (fim - inicio) * len(posicoes_2)
+        mao_1 = np.repeat(maos_1[inicio:fim], len(posicoes_2), axis=0)
+        mao_2 = restantes[inicio:fim][:, posicoes_2].reshape(quantidade, faltam_2)
+        bloco = np.empty((quantidade, 2, cartas), dtype=np.int8)
+        bloco[:, 0, :len(fixas_1)] = fixas_1
+        bloco[:, 0, len(fixas_1):] = mao_1
+        bloco[:, 1, :len(fixas_2)] = fixas_2
+        bloco[:, 1, len(fixas_2):] = mao_2
+        yield bloco
@@ -1,9 +1,17 @@
 import random 
 import pandas as pd
+from .maos import avaliar_envido_flor, calcular_envido, checar_flor, qualidade_mao, qualidade_pontos, rotular_mao
 
 class Bot():
-    def __init__(self, nome):
+    # Limiares de avaliar_envido: o bot se considera perdendo quando o adversário tem mais que
+    # LIMIAR_PERDENDO pontos ou mais que os seus pontos divididos por FATOR_PERDENDO
+    LIMIAR_PERDENDO = 6
+    FATOR_PERDENDO = 1.5
+
+    def __init__(self, nome, limiar_perdendo=LIMIAR_PERDENDO, fator_perdendo=FATOR_PERDENDO):
         self.nome = nome
+        self.limiar_perdendo = limiar_perdendo
+        self.fator_perdendo = fator_perdendo
         self.mao = []
         self.mao_rank = []
         self.indices = []
@@ -12,6 +20,7 @@ class Bot():
         self.pontos = 0
         self.rodadas = 0
         self.envido = 0
+        self.pontos_flor = 0
         self.rodada = 1
         self.primeiro = False
         self.ultimo = False
@@ -21,14 +30,19 @@ class Bot():
 
     def criar_mao(self, baralho):
         """Cria a mão do jogador e insere três cartas do baralho a ela."""
+        self.receber_mao([baralho.retirar_carta() for i in range(3)])
+
+
+    def receber_mao(self, cartas):
+        """Recebe as cartas já distribuídas (ex: por Baralho.distribuir) e avalia a mão."""
         self.indices = [0, 1, 2]
-        for i in range(3):
-            self.mao.append(baralho.retirar_carta())
+        self.mao.extend(cartas)
 
-        self.flor = self.checa_flor()
-        self.pontuacao_cartas, self.mao_rank = self.mao[0].classificar_carta(self.mao)
-        self.calcular_qualidade_mao(self.pontuacao_cartas, self.mao_rank)
-        self.envido = self.calcula_envido(self.mao)
+        self.envido, self.flor, self.pontos_flor = avaliar_envido_flor(self.mao)
+        self.pontuacao_cartas, _ = self.mao[0].classificar_carta(self.mao)
+        # Um rank de cada: classificar_carta não dá 'Alta' a três cartas de mesmos pontos
+        self.mao_rank = rotular_mao(self.pontuacao_cartas)
+        self.qualidade_mao = qualidade_mao(self.mao)
         # print(self.mostrar_mao())
 
 
@@ -87,19 +101,7 @@ class Bot():
 
     def calcula_envido(self, mao):
         """Realização do cálculo de envido."""
-        pontos_envido = []
-
-        for i in range(len(mao)):
-            for j in range(i+1, len(mao)):
-                if ((mao[i].retornar_naipe() == mao[j].retornar_naipe())):
-                    if (mao[0].retornar_pontos_envido(mao[i]) > 0 and mao[0].retornar_pontos_envido(mao[j]) > 0):
-                        pontos_envido.append(20 + (mao[0].retornar_pontos_envido(mao[i]) + mao[0].retornar_pontos_envido(mao[j])))
-                    else:
-                        pontos_envido.append(0)
-                else:
-                    pontos_envido.append(max(mao[0].retornar_pontos_envido(mao[i]), mao[0].retornar_pontos_envido(mao[j])))
-        
-        return max(pontos_envido)
+        return calcular_envido(mao)
     
 
 
@@ -142,11 +144,7 @@ class Bot():
 
     def checa_flor(self):
         """Verifica se o bot possui flor em sua mão."""
-        if all(carta.retornar_naipe() == self.mao[0].retornar_naipe() for carta in self.mao):
-            # print('Flor do Bot!')
-            return True
-
-        return False
+        return checar_flor(self.mao)
 
 
     def avaliar_truco(self, cbr, tipo, quem_pediu):
@@ -157,7 +155,7 @@ class Bot():
 
     def avaliar_envido(self, cbr, tipo, quem_pediu, pontos_totais_adversario):
         """Verifica se a melhor jogada para o bot seria aceitar, pedir real ou falta envido."""
-        if (pontos_totais_adversario > 6 or pontos_totais_adversario > int((self.pontos/1.5))):
+        if (pontos_totais_adversario > self.limiar_perdendo or pontos_totais_adversario > int((self.pontos/self.fator_perdendo))):
             # print(f'{pontos_totais_adversario} - {self.pontos}')
             perdendo = True
         
@@ -173,11 +171,11 @@ class Bot():
 
 
     def calcular_qualidade_mao(self, lista_pontuacao, lista_mao_rank):
-        """Calcula a qualidade da mão do bot, baseado na média harmônica da codificação."""
-        m1 = (2 / ((1/lista_pontuacao[int(lista_mao_rank.index('Alta'))]) + (1/lista_pontuacao[int(lista_mao_rank.index('Media'))])))
-        m2 = ((2 * lista_pontuacao[int(lista_mao_rank.index('Media'))]) + (lista_pontuacao[int(lista_mao_rank.index('Baixa'))])/2+1)
-        m3 = ((2 * m1) + m2) / (2+1)
-        self.qualidade_mao = m3
+        """Calcula a qualidade da mão do bot, baseado na média harmônica da codificação (mesmo valor da tabela QUALIDADE_MAOS)."""
+        alta = lista_pontuacao[int(lista_mao_rank.index('Alta'))]
+        media = lista_pontuacao[int(lista_mao_rank.index('Media'))]
+        baixa = lista_pontuacao[int(lista_mao_rank.index('Baixa'))]
+        self.qualidade_mao = float(qualidade_pontos(alta, media, baixa))
 
     def retorna_pontos_totais(self):
         """Retorna os pontos totais do bot."""
@@ -193,6 +191,7 @@ class Bot():
         self.qualidade_mao = 0
         self.rodadas = 0
         self.envido = 0
+        self.pontos_flor = 0
         self.rodada = 1
         self.flor = False
         self.pediu_flor = False
@@ -0,0 +1,100 @@
+import itertools
+import numpy as np
+from .pontos import NAIPES, NUMEROS, PONTOS_CARTAS
+from .maos import MAOS, TOTAL_MAOS, indice_mao, indices_maos
+
+# Canonicalização de mãos por isomorfismo de naipes.
+#
+# Trocar os naipes de um conjunto de cartas (mão e, opcionalmente, cartas conhecidas do oponente)
+# não altera o envido nem a flor. Para a força no truco, a troca só é válida se cada carta mantiver
+# sua pontuação, o que impede mover as manilhas (1 de ESPADAS, 1 de BASTOS, 7 de ESPADAS, 7 de OUROS)
+# e as cartas que virariam manilhas. O representante de cada classe é o de menores ids.
+#
+# Observação: as classes valem para características das cartas visíveis (envido, flor, pontos,
+# classificação e qualidade da mão). O restante do baralho não é trocado junto, então estimativas
+# que dependem das cartas desconhecidas do oponente só são exatas com canonizar_forca.
+
+# PERMUTACOES_NAIPES[p, id] é o id da carta após aplicar a p-ésima permutação de naipes
+PERMUTACOES_NAIPES = np.array([
+    [permutacao[id // len(NUMEROS)] * len(NUMEROS) + id % len(NUMEROS) for id in range(40)]
+    for permutacao in itertools.permutations(range(len(NAIPES)))
+], dtype=np.int8)
+
+_PONTOS = np.array(PONTOS_CARTAS, dtype=np.int8)
+_PERMUTACOES = tuple(tuple(linha) for linha in PERMUTACOES_NAIPES.tolist())
+
+# Para a força no truco, o representante de cada carta é a carta de menor id com a mesma pontuação
+_CARTAS_POR_PONTOS = {}
+for _id, _pontos in enumerate(PONTOS_CARTAS):
+    _CARTAS_POR_PONTOS.setdefault(_pontos, []).append(_id)
+
+
+def _canonizar(ids_mao, conhecidas, preservar_pontos):
+    """Aplica todas as permutações de naipes válidas e retorna a menor (mão, conhecidas), em ordem colexicográfica."""
+    melhor = None
+    for permutacao in _PERMUTACOES:
+        if (preservar_pontos and any(PONTOS_CARTAS[permutacao[id]] != PONTOS_CARTAS[id] for id in itertools.chain(ids_mao, conhecidas))):
+            continue
+
+        # Comparar os ids em ordem decrescente equivale à ordem dos índices de maos.indice_mao
+        candidato = (tuple(sorted((permutacao[id] for id in ids_mao), reverse=True)), tuple(sorted((permutacao[id] for id in conhecidas), reverse=True)))
+        if (melhor is None or candidato < melhor):
+            melhor = candidato
+
+    return melhor[0][::-1], melhor[1][::-1]
+
+
+def canonizar_mao(ids_mao, conhecidas=()):
+    """Representante da classe da mão (e das cartas conhecidas do oponente) que preserva envido, flor e pontos de cada carta."""
+    return _canonizar(ids_mao, conhecidas, True)
+
+
+def canonizar_envido(ids_mao, conhecidas=()):
+    """Representante da classe para envido e flor, em que todos os naipes são intercambiáveis."""
+    return _canonizar(ids_mao, conhecidas, False)
+
+
+def canonizar_forca(ids_mao, conhecidas=()):
+    """Representante da classe para a força no truco: cada carta é trocada pela de menor id com a mesma pontuação."""
+    usados = {}
+    canonicos = []
+    for grupo in (ids_mao, conhecidas):
+        ids = []
+        for id in sorted(grupo, key=lambda id: (PONTOS_CARTAS[id], id)):
+            pontos = PONTOS_CARTAS[id]
+            ids.append(_CARTAS_POR_PONTOS[pontos][usados.get(pontos, 0)])
+            usados[pontos] = usados.get(pontos, 0) + 1
+
+        canonicos.append(tuple(sorted(ids)))
+
+    return tuple(canonicos)
+
+
+def _canonizar_indices(maos, preservar_pontos):
+    """Calcula, para um array (N, 3) de mãos, o índice da mão canônica de cada uma."""
+    maos = np.asarray(maos, dtype=np.intp)
+    permutadas = PERMUTACOES_NAIPES[:, maos]
+    indices = np.stack([indices_maos(p) for p in permutadas])
+    if (preservar_pontos):
+        validas = (_PONTOS[permutadas] == _PONTOS[maos]).all(axis=2)
+        indices = np.where(validas, indices, TOTAL_MAOS)
+
+    return indices.min(axis=0).astype(np.int16)
+
+
+# Índice canônico de cada uma das 9880 mãos, indexado pelo índice da mão
+CANONICO_MAOS = _canonizar_indices(MAOS, True)
+CANONICO_MAOS.flags.writeable = False
+
+CANONICO_ENVIDO_MAOS = _canonizar_indices(MAOS, False)
+CANONICO_ENVIDO_MAOS.flags.writeable = False
+
+
+def indice_canonico(ids_mao):
+    """Retorna o índice da mão canônica (ver canonizar_mao) de uma mão de 3 cartas."""
+    return int(CANONICO_MAOS[indice_mao(ids_mao)])
+
+
+def indices_canonicos(ids_maos):
+    """Versão vetorizada de indice_canonico para um array (N, 3) de ids."""
+    return CANONICO_MAOS[indices_maos(ids_maos)]
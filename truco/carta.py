@@ -1,66 +1,59 @@
 import itertools
-from .pontos import MANILHA, CARTAS_VALORES, ENVIDO
+from .pontos import ENVIDO, NAIPES, NUMEROS, CARTA_ID, PONTOS_CARTAS
 
 class Carta():
-    def __init__(self, numero, naipe):
-        self.numero = numero
-        self.naipe = naipe
+    """Carta imutável. As 40 cartas do baralho são instâncias únicas, compartilhadas por todos os baralhos e mãos."""
+    __slots__ = ('numero', 'naipe', 'id')
 
-    def verificar_carta_alta(self, carta_01, carta_02):
-        """Verificação de qual carta é a carta mais alta, entre duas cartas."""
-        if (str(carta_01.numero)+" de "+carta_01.naipe) in MANILHA and (str(carta_02.numero)+" de "+carta_02.naipe) in MANILHA:
-            if MANILHA[str(carta_01.numero)+" de "+carta_01.naipe] > MANILHA[str(carta_02.numero)+" de "+carta_02.naipe]:
-                return carta_01
-            elif MANILHA[str(carta_02.numero)+" de "+carta_02.naipe] > MANILHA[str(carta_01.numero)+" de "+carta_01.naipe]:
-                return carta_02
+    def __new__(cls, numero, naipe):
+        carta = _CARTAS_CANONICAS.get((numero, naipe))
+        if (carta is None):
+            # Cartas fora do baralho (ex: 8 de COPAS) não são compartilhadas e não possuem id
+            carta = cls._criar(numero, naipe, CARTA_ID.get((numero, naipe)))
 
-        elif (str(carta_01.numero)+" de "+carta_01.naipe) in MANILHA:
-            return carta_01
+        return carta
 
-        elif (str(carta_02.numero)+" de "+carta_02.naipe) in MANILHA:
-            return carta_02
+    @classmethod
+    def _criar(cls, numero, naipe, id):
+        """Cria uma nova instância, sem consultar as cartas canônicas."""
+        carta = object.__new__(cls)
+        object.__setattr__(carta, 'numero', numero)
+        object.__setattr__(carta, 'naipe', naipe)
+        # Identificador inteiro (0..39) usado nas tabelas de pontos.py
+        object.__setattr__(carta, 'id', id)
+        return carta
 
-        else:
-            if CARTAS_VALORES[str(carta_01.numero)] > CARTAS_VALORES[str(carta_02.numero)]:
-                return carta_01
-            else:
-                return carta_02
+    def __setattr__(self, nome, valor):
+        raise AttributeError(f"Carta é imutável, não é possível alterar '{nome}'")
 
-        return carta_01
+    def __delattr__(self, nome):
+        raise AttributeError(f"Carta é imutável, não é possível remover '{nome}'")
 
+    def __reduce__(self):
+        return (Carta, (self.numero, self.naipe))
 
-    def verificar_carta_baixa(self, carta_01, carta_02):
-        """Verificação de qual é a carta mais baixa entre duas cartas."""
-        if (str(carta_01.numero)+" de "+carta_01.naipe) in MANILHA and (str(carta_02.numero)+" de "+carta_02.naipe) in MANILHA:
-            if MANILHA[str(carta_01.numero)+" de "+carta_01.naipe] < MANILHA[str(carta_02.numero)+" de "+carta_02.naipe]:
-                return carta_01
+    def __repr__(self):
+        return f"Carta({self.numero!r}, {self.naipe!r})"
 
-            elif MANILHA[str(carta_02.numero)+" de "+carta_02.naipe] < MANILHA[str(carta_01.numero)+" de "+carta_01.naipe]:
-                return carta_02
-
-        elif (str(carta_01.numero)+" de "+carta_01.naipe) in MANILHA:
-            return carta_02
-
-        elif (str(carta_02.numero)+" de "+carta_02.naipe) in MANILHA:
+    def verificar_carta_alta(self, carta_01, carta_02):
+        """Verificação de qual carta é a carta mais alta, entre duas cartas."""
+        if PONTOS_CARTAS[carta_01.id] > PONTOS_CARTAS[carta_02.id]:
             return carta_01
 
-        else:
-            if CARTAS_VALORES[str(carta_01.numero)] < CARTAS_VALORES[str(carta_02.numero)]:
-                return carta_01
+        return carta_02
 
-            else:
-                return carta_02
 
-        return carta_01
+    def verificar_carta_baixa(self, carta_01, carta_02):
+        """Verificação de qual é a carta mais baixa entre duas cartas."""
+        if PONTOS_CARTAS[carta_01.id] < PONTOS_CARTAS[carta_02.id]:
+            return carta_01
+
+        return carta_02
 
     
     def retornar_pontos_carta(self, carta):
         """Retorna a pontuação equivalente de determinada carta."""
-        if (str(carta.numero)+" de "+carta.naipe) in MANILHA:
-            return MANILHA[str(carta.numero)+" de "+carta.naipe]
-
-        else:
-            return CARTAS_VALORES[str(carta.numero)]
+        return PONTOS_CARTAS[carta.id]
 
 
     def classificar_carta(self, cartas):
@@ -131,3 +124,11 @@ class Carta():
     # df.replace('OURO', '2', inplace=True)
     # df.replace('BASTOS', '3', inplace=True)
     # df.replace('COPAS', '4', inplace=True)
+
+
+_CARTAS_CANONICAS = {}
+
+# As 40 cartas do baralho, indexadas pelo id
+CARTAS = tuple(Carta._criar(numero, naipe, CARTA_ID[(numero, naipe)]) for naipe in NAIPES for numero in NUMEROS)
+
+_CARTAS_CANONICAS.update(((carta.numero, carta.naipe), carta) for carta in CARTAS)
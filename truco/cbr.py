@@ -1,18 +1,31 @@
+import copy
 from sklearn.neighbors import NearestNeighbors
+import numpy as np
 import pandas as pd
 import warnings
 from pathlib import Path
 from .dados import Dados
 
 class Cbr():
-    def __init__(self):
+    # Quantidade de vizinhos consultados na base de casos
+    vizinhos = 100
+
+    def __init__(self, dados=None, vizinhos=vizinhos):
         self.indice = 0
-        self.dados = Dados()
+        self.vizinhos = vizinhos
+        self.dados = Dados() if dados is None else dados
         self.dataset = self.dados.retornar_casos()
         # self.dados = self.retornarSimilares()
         self.nbrs = self.vizinhos_proximos()
 
 
+    def com_dados(self, dados):
+        """Retorna um Cbr que consulta o registro de caso de 'dados', compartilhando a base de casos e os vizinhos já calculados."""
+        cbr = copy.copy(self)
+        cbr.dados = dados
+        return cbr
+
+
     def carregar_dataset(self):
         """Carrega o dataset, caso necessário"""
         base_dir = Path(__file__).resolve().parent.parent
@@ -42,11 +55,11 @@ class Cbr():
 
 
     def vizinhos_proximos(self, df=None):
-        """Cálculo dos 100 Nearest Neighbors."""
+        """Cálculo dos Nearest Neighbors (100, a menos que outra quantidade seja passada ao Cbr)."""
         if (df is None):
-            return NearestNeighbors(n_neighbors=100, algorithm='ball_tree').fit(self.dataset)
+            return NearestNeighbors(n_neighbors=self.vizinhos, algorithm='ball_tree').fit(self.dataset)
             
-        return NearestNeighbors(n_neighbors=100, algorithm='ball_tree').fit(df)
+        return NearestNeighbors(n_neighbors=self.vizinhos, algorithm='ball_tree').fit(df)
 
 
     def jogar_carta(self, rodada, pontuacao_cartas):
@@ -61,7 +74,7 @@ class Cbr():
         elif ((rodada) == 2): ordem_carta_jogada = 'segunda' + ordem_carta_jogada
         elif ((rodada) == 1): ordem_carta_jogada = 'terceira' + ordem_carta_jogada
 
-        valor_referencia = jogadas_vencidas[ordem_carta_jogada].value_counts().index.to_list()[0]
+        valor_referencia = moda(jogadas_vencidas[ordem_carta_jogada])
         if (valor_referencia <= 0): 
             return -1
 
@@ -80,11 +93,14 @@ class Cbr():
         jogadas = perdidas = self.dataset.iloc[indices.tolist()[0]]
         jogadas = jogadas[(jogadas.quemGanhouTruco == 2)]
         perdidas = perdidas[(perdidas.quemGanhouTruco == 1)]
+        # Sem vizinhos em que o bot ganhou o truco não há qualidade de mão do oponente para comparar
+        if (jogadas.empty):
+            return 0
 
-        vencidas = jogadas['quemGanhouTruco'].value_counts().index.to_list()[0]
-        perdidas = perdidas['quemGanhouTruco'].value_counts().index.to_list()[0]
-        retruco = jogadas['quemRetruco'].value_counts().index.to_list()[0]
-        qualidade_mao_humana = jogadas['qualidadeMaoHumano'].dropna().value_counts().index.to_list()[0]
+        vencidas = moda(jogadas['quemGanhouTruco'])
+        perdidas = moda(perdidas['quemGanhouTruco'])
+        retruco = moda(jogadas['quemRetruco'])
+        qualidade_mao_humana = moda(jogadas['qualidadeMaoHumano'].dropna())
 
 
         if (vencidas > perdidas and qualidade_mao_bot > qualidade_mao_humana):
@@ -107,13 +123,13 @@ class Cbr():
         perdidas = jogadas[((jogadas.pontosEnvidoRobo < jogadas.pontosEnvidoHumano) | (jogadas.quemGanhouEnvido == 1))]
         # 'quemPediuEnvido', 'quemPediuFaltaEnvido', 'quemPediuRealEnvido', 'pontosEnvidoRobo', 'pontosEnvidoHumano', 'quemNegouEnvido', 'quemGanhouEnvido', 'quemEscondeuPontosEnvido'
         # print(jogadas)
-        envido_ganhas = ganhas['quemGanhouEnvido'].value_counts().index.to_list()[0]
-        envido_perdidas = perdidas['quemGanhouEnvido'].value_counts().index.to_list()[0]
-        real_envido_ganhas = ganhas['quemPediuRealEnvido'].value_counts().index.to_list()[0]
-        real_envido_perdidas = perdidas['quemPediuFaltaEnvido'].value_counts().index.to_list()[0]
-        falta_envido_ganhas = ganhas['quemPediuFaltaEnvido'].value_counts().index.to_list()[0]
-        falta_envido_perdidas = perdidas['quemPediuFaltaEnvido'].value_counts().index.to_list()[0]
-        pontos_jogador = ganhas['pontosEnvidoHumano'].value_counts().index.to_list()[0]
+        envido_ganhas = moda(ganhas['quemGanhouEnvido'])
+        envido_perdidas = moda(perdidas['quemGanhouEnvido'])
+        real_envido_ganhas = moda(ganhas['quemPediuRealEnvido'])
+        real_envido_perdidas = moda(perdidas['quemPediuFaltaEnvido'])
+        falta_envido_ganhas = moda(ganhas['quemPediuFaltaEnvido'])
+        falta_envido_perdidas = moda(perdidas['quemPediuFaltaEnvido'])
+        pontos_jogador = moda(ganhas['pontosEnvidoHumano'])
 
         # Condição especial quando o robô considera pedir o envido na primeira jogada
         if (quem_pediu == 2 and pontos_envido_robo > 5):
@@ -154,4 +170,124 @@ class Cbr():
                 return 1
 
             else:
-                return 0
\ No newline at end of file
+                return 0
+
+
+    # Versões em lote dos métodos acima: recebem os índices (N, 100) dos vizinhos de N registros,
+    # obtidos numa única consulta com consultar_vizinhos, e retornam as N decisões de uma vez.
+    # Onde não há casos (ex: nenhum vizinho vencedor), as versões em lote usam os mesmos valores
+    # neutros que os métodos acima, descritos em cada método.
+
+    def consultar_vizinhos(self, registros):
+        """Consulta os vizinhos de vários registros (array (N, colunas) na ordem de self.dataset) numa única chamada a kneighbors."""
+        with warnings.catch_warnings():
+            warnings.simplefilter(action='ignore', category=UserWarning)
+            return self.nbrs.kneighbors(np.asarray(registros), return_distance=False)
+
+    def _valores_vizinhos(self, vizinhos, coluna):
+        """Valores da coluna em cada caso vizinho, como array (N, 100)."""
+        return self.dataset[coluna].to_numpy()[vizinhos]
+
+    def jogar_cartas(self, vizinhos, rodadas, pontuacoes):
+        """Versão em lote de jogar_carta; 'pontuacoes' é um array (N, 3) com os pontos das cartas na mão e -1 nas posições já jogadas.
+
+        Retorna a posição (0 a 2) da carta escolhida, ou -1 como jogar_carta, inclusive quando nenhum vizinho venceu a mão.
+        """
+        primeira, segunda, terceira = (self._valores_vizinhos(vizinhos, coluna) == 2 for coluna in
+                                       ('ganhadorPrimeiraRodada', 'ganhadorSegundaRodada', 'ganhadorTerceiraRodada'))
+        vencidas = (((primeira & segunda) | primeira) & terceira) | (segunda & terceira)
+
+        referencia = np.zeros(len(vizinhos))
+        for rodada, coluna in ((3, 'primeiraCartaRobo'), (2, 'segundaCartaRobo'), (1, 'terceiraCartaRobo')):
+            linhas = np.flatnonzero(np.asarray(rodadas) == rodada)
+            if (len(linhas)):
+                moda, existe = moda_vizinhos(self._valores_vizinhos(vizinhos[linhas], coluna), vencidas[linhas])
+                referencia[linhas] = np.where(existe, moda, 0)
+
+        # A carta mais próxima da referência, a primeira em caso de empate, como min() em jogar_carta
+        pontuacoes = np.asarray(pontuacoes)
+        distancias = np.where(pontuacoes >= 0, np.abs(pontuacoes - referencia[:, None]), np.inf)
+        return np.where(referencia > 0, np.argmin(distancias, axis=1), -1)
+
+    def trucos(self, vizinhos, qualidades_mao_bot):
+        """Versão em lote de truco: retorna 2 (aumentar), 1 (aceitar) ou 0 (fugir) para cada registro.
+
+        Sem vizinhos em que o bot ganhou o truco, não há qualidade de mão do oponente para comparar e a resposta é 0.
+        """
+        ganhou_truco = self._valores_vizinhos(vizinhos, 'quemGanhouTruco')
+        vencidas = np.where((ganhou_truco == 2).any(axis=1), 2, 0)
+        perdidas = np.where((ganhou_truco == 1).any(axis=1), 1, 0)
+        qualidade_mao_humana, existe = moda_vizinhos(self._valores_vizinhos(vizinhos, 'qualidadeMaoHumano'), ganhou_truco == 2)
+        melhor = existe & (np.asarray(qualidades_mao_bot) > qualidade_mao_humana)
+        return np.where(melhor & (vencidas > perdidas), 2, np.where(melhor, 1, 0))
+
+    def envidos(self, vizinhos, tipos, quem_pediu, pontos_envido_robo, robo_perdendo):
+        """Versão em lote de envido, com um tipo, quem pediu, pontos e situação do placar por registro.
+
+        As contagens sem nenhum caso valem 0.
+        """
+        tipos, quem_pediu, pontos_envido_robo, robo_perdendo = np.broadcast_arrays(tipos, quem_pediu, pontos_envido_robo, robo_perdendo)
+        pontos_robo = self._valores_vizinhos(vizinhos, 'pontosEnvidoRobo')
+        pontos_humano = self._valores_vizinhos(vizinhos, 'pontosEnvidoHumano')
+        ganhou_envido = self._valores_vizinhos(vizinhos, 'quemGanhouEnvido')
+        ganhas = (pontos_robo > pontos_humano) | (ganhou_envido == 2)
+        perdidas = (pontos_robo < pontos_humano) | (ganhou_envido == 1)
+        real_envido = self._valores_vizinhos(vizinhos, 'quemPediuRealEnvido')
+        falta_envido = self._valores_vizinhos(vizinhos, 'quemPediuFaltaEnvido')
+
+        # Na falta envido (último caso de envido) a comparação das faltas só vale junto com a dos pontos,
+        # então basta a dos pontos e as modas das faltas não são calculadas
+        envido_ganhas, envido_perdidas, real_envido_ganhas, real_envido_perdidas, pontos_jogador = (
+            np.where(existe, moda, 0) for moda, existe in (
+                moda_vizinhos(ganhou_envido, ganhas), moda_vizinhos(ganhou_envido, perdidas),
+                moda_vizinhos(real_envido, ganhas), moda_vizinhos(falta_envido, perdidas),
+                moda_vizinhos(pontos_humano, ganhas)))
+
+        menos_pontos = pontos_jogador < pontos_envido_robo
+        mais_real = real_envido_ganhas > real_envido_perdidas
+        mais_envido = envido_ganhas > envido_perdidas
+        diferente = envido_ganhas != envido_perdidas
+
+        escolhas = np.select(
+            [tipos == 6, tipos == 7],
+            [np.select([menos_pontos & mais_real & mais_envido, mais_real & mais_envido & robo_perdendo, diferente], [2, 3, 1], 0),
+             np.where(menos_pontos | (mais_envido & mais_real), 1, 0)],
+            np.where(menos_pontos, 1, 0))
+
+        # Condição especial quando o robô considera pedir o envido na primeira jogada
+        especial = (quem_pediu == 2) & (pontos_envido_robo > 5)
+        pedido = np.where(robo_perdendo, 8, np.where(menos_pontos & mais_real & mais_envido, 7, 6))
+        return np.where(especial & ((menos_pontos & mais_real & mais_envido) | diferente), pedido, escolhas)
+
+
+def moda(valores, padrao=0):
+    """Valor mais frequente da Series 'valores' (nos empates, o que aparece primeiro), ou 'padrao' se ela estiver vazia."""
+    contagens = valores.value_counts()
+    return contagens.index[0] if len(contagens) else padrao
+
+
+def moda_vizinhos(valores, mascara):
+    """Moda de cada linha de 'valores' (N, K) considerando só as posições marcadas em 'mascara'.
+
+    Como value_counts().index[0], os empates ficam com o valor que aparece primeiro na linha, ou seja,
+    no vizinho mais próximo. Retorna as modas e um array booleano indicando as linhas com algum valor.
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    linhas, colunas = valores.shape
+    chaves = np.where(mascara, valores, np.inf)
+    # A ordenação estável deixa no início de cada sequência de valores iguais a sua primeira posição na linha
+    ordem = np.argsort(chaves, axis=1, kind='stable')
+    ordenados = np.take_along_axis(chaves, ordem, axis=1)
+    validos = np.count_nonzero(mascara, axis=1)
+
+    inicios = np.ones(ordenados.shape, dtype=bool)
+    inicios[:, 1:] = ordenados[:, 1:] != ordenados[:, :-1]
+    posicoes = np.arange(colunas)
+    proximos = np.full(ordenados.shape, colunas)
+    proximos[:, :-1] = np.where(inicios[:, 1:], posicoes[1:], colunas)
+    proximos = np.minimum(np.minimum.accumulate(proximos[:, ::-1], axis=1)[:, ::-1], validos[:, None])
+
+    # Maior contagem primeiro; entre contagens iguais, a menor primeira posição
+    pontuacao = np.where(inicios & (posicoes < validos[:, None]), (proximos - posicoes) * (colunas + 1) - ordem, -1)
+    melhores = np.argmax(pontuacao, axis=1)
+    return ordenados[np.arange(linhas), melhores], validos > 0
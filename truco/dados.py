@@ -3,7 +3,9 @@ import os
 from pathlib import Path
 
 class Dados():
-    def __init__(self):
+    def __init__(self, arquivo=None):
+        # Arquivo da base de casos; sem ele, dbtrucoimitacao_maos.csv na raiz do projeto
+        self.arquivo = arquivo
         self.colunas = ['idMao', 'jogadorMao', 'cartaAltaRobo', 'cartaMediaRobo', 'cartaBaixaRobo', 'cartaAltaHumano', 'cartaMediaHumano', 'cartaBaixaHumano', 'primeiraCartaRobo', 'primeiraCartaHumano', 'segundaCartaRobo', 'segundaCartaHumano', 'terceiraCartaRobo', 'terceiraCartaHumano', 'ganhadorPrimeiraRodada', 'ganhadorSegundaRodada', 'ganhadorTerceiraRodada', 'quemPediuEnvido', 'quemPediuFaltaEnvido', 'quemPediuRealEnvido', 'pontosEnvidoRobo', 'pontosEnvidoHumano', 'quemNegouEnvido', 'quemGanhouEnvido', 'quemFlor', 'quemContraFlor', 'quemContraFlorResto', 'quemNegouFlor', 'pontosFlorRobo', 'pontosFlorHumano', 'quemGanhouFlor', 'quemEscondeuPontosEnvido', 'quemEscondeuPontosFlor', 'quemTruco', 'quemRetruco', 'quemValeQuatro', 'quemNegouTruco', 'quemGanhouTruco','quemEnvidoEnvido', 'quemFlor', 'naipeCartaAltaRobo', 'naipeCartaMediaRobo', 'naipeCartaBaixaRobo', 'naipeCartaAltaHumano', 'naipeCartaMediaHumano', 'naipeCartaBaixaHumano', 'naipePrimeiraCartaRobo', 'naipePrimeiraCartaHumano', 'naipeSegundaCartaRobo', 'naipeSegundaCartaHumano', 'naipeTerceiraCartaRobo', 'naipeTerceiraCartaHumano', 'qualidadeMaoRobo', 'qualidadeMaoHumano']
         self.registro = self.carregar_modelo_zerado()
         self.casos = self.tratamento_inicial_df()
@@ -11,11 +13,13 @@ class Dados():
     def tratamento_inicial_df(self):
         """Tratamento de dados do dataframe que será utilizado para alimentar a base de casos"""
         base_dir = Path(__file__).resolve().parent.parent
-        csv_path = base_dir / 'dbtrucoimitacao_maos.csv'
+        csv_path = base_dir / 'dbtrucoimitacao_maos.csv' if self.arquivo is None else Path(self.arquivo)
         # leitura robusta: arquivo neste projeto usa separador por tab e contém 'NULL' como string para valores ausentes
         try:
             df = pd.read_csv(csv_path, usecols=self.colunas, index_col='idMao', sep='\t', na_values=['NULL'], encoding='utf-8', low_memory=False)
         except FileNotFoundError:
+            if (self.arquivo is not None):
+                raise
             # fallback para caminho relativo ao cwd (comportamento antigo)
             df = pd.read_csv('dbtrucoimitacao_maos.csv', usecols=self.colunas, index_col='idMao', sep='\t', na_values=['NULL'], encoding='utf-8', low_memory=False)
 
@@ -1,5 +1,11 @@
+from .politicas import PoliticaHumana
+from .motor import ENVIDO, REAL_ENVIDO, FALTA_ENVIDO, QUERO, NAO_QUERO
+
+
 class Envido():
-    def __init__(self):
+    def __init__(self, politica=None):
+        # Decide pelo Jogador 1 quando o pedido é do Bot; por padrão, lê do teclado
+        self.politica = politica or PoliticaHumana()
         self.valor_envido = 2
         self.estado_atual = 0
         self.jogador_pediu_envido = 0
@@ -26,6 +32,11 @@ class Envido():
         self.jogador_bloqueado = quem_pediu
 
 
+    def responder_jogador(self, tipo, opcoes):
+        """Consulta a política do Jogador 1 e retorna a posição da resposta nas opções ([0] Recusar, [1] Aceitar, ...)."""
+        return opcoes.index(self.politica.responder_envido(1, tipo, opcoes))
+
+
     def controlador_envido(self, cbr, dados, tipo, quem_pediu, jogador1, jogador2, interface):
         """Controlador de métodos, para selecionar o que pode ser chamado ou não."""
         print(2)
@@ -67,9 +78,7 @@ class Envido():
 
         else:
             self.jogador_pediu_envido = 2
-            escolha = -1
-            while(escolha not in [0, 1, 2, 3]):
-                escolha = int(input(f"Jogador {quem_pediu}, você aceita o pedido de envido?\n[0] Recusar\n[1] Aceitar\n[2] Real Envido\n[3] Falta Envido"))
+            escolha = self.responder_jogador(ENVIDO, [NAO_QUERO, QUERO, REAL_ENVIDO, FALTA_ENVIDO])
         
 
         if escolha == 0:
@@ -108,9 +117,7 @@ class Envido():
 
         else:
             # self.jogador_pediu_real_envido = 2
-            escolha = -1
-            while(escolha not in [0, 1, 2]):
-                escolha = int(input(f"Jogador {quem_pediu}, você aceita o pedido de Real envido?\n[0] Recusar\n[1] Aceitar\n[2] Falta Envido"))
+            escolha = self.responder_jogador(REAL_ENVIDO, [NAO_QUERO, QUERO, FALTA_ENVIDO])
         
 
         if escolha == 0:
@@ -151,9 +158,7 @@ class Envido():
 
         else:
             self.jogador_pediu_envido = 2
-            escolha = -1
-            while(escolha not in [0, 1]):
-                escolha = int(input(f"Jogador {quem_pediu}, você aceita o pedido de envido?\n[0] Recusar\n[1] Aceitar\n"))
+            escolha = self.responder_jogador(FALTA_ENVIDO, [NAO_QUERO, QUERO])
         
 
         if escolha == 0:
@@ -1,5 +1,11 @@
+from .politicas import PoliticaHumana
+from .motor import QUERO, NAO_QUERO
+
+
 class Flor():
-    def __init__(self):
+    def __init__(self, politica=None):
+        # Decide pelo Jogador 1 quando o pedido é do Bot; por padrão, lê do teclado
+        self.politica = politica or PoliticaHumana()
         self.valor_flor = 3
         self.quem_pediu_flor = 0
         self.quem_pediu_contraflor = 0
@@ -90,15 +96,7 @@ class Flor():
 
 
     def decisao_jogador(self):
-        escolha = -1
-        while (escolha not in [0, 1]):
-            escolha = int(input(f"Jogador 1, você aceita o pedido de {self.estado_atual}?\n[0] Não\n[1] Sim"))
-        
-        if (escolha == 0):
-            return False
-        
-        else: 
-            return True
+        return self.politica.responder_flor(1, self.estado_atual, [NAO_QUERO, QUERO]) == QUERO
 
     def resetar_flor(self):
         self.valor_flor = 3
@@ -37,6 +37,10 @@ class Interface():
 
     def mostrar_carta_ganhadora(self, carta):
         """Exibe quem ganhou a rodada."""
+        if (carta == "Empate"):
+            print("\nParda: as cartas empataram\n")
+            return
+
         print(f"\nCarta ganhadora: {carta.retornar_carta()}\n")
 
     def mostrar_ganhador_rodada(self, jogador):
@@ -1,3 +1,7 @@
+from .maos import avaliar_envido_flor, calcular_envido, checar_flor
+from .motor import ACOES_MASCARA, NOMES_ACOES, mascara_vez
+
+
 class Jogador():
     def __init__(self, nome):
         self.nome = nome
@@ -6,6 +10,7 @@ class Jogador():
         self.pontos = 0
         self.rodadas = 0
         self.envido = 0
+        self.pontos_flor = 0
         self.primeiro = False
         self.ultimo = False
         self.flor = False
@@ -17,17 +22,13 @@ class Jogador():
         """Mostrar as opções que o jogador pode jogar"""
         # print(f'pontos self.envido: {self.envido}')
         self.mostrar_mao(interface)
-        if (len(self.mao) >= 2 and self.pediu_truco is False): 
-            print('[4] Truco')
+        pode_flor = len(self.mao) == 3 and self.flor is False and self.checa_flor()
+        mascara = mascara_vez(0, len(self.mao) >= 2 and self.pediu_truco is False, pode_flor, len(self.mao) == 3)
+        for acao in ACOES_MASCARA[mascara]:
+            print(f'[{acao}] {NOMES_ACOES[acao]}')
 
-        if ((len(self.mao)) == 3 and self.flor is False and (self.checa_flor())):
-            print('[5] Flor')
+        if (pode_flor):
             self.flor = True
-
-        if ((len(self.mao) == 3)):
-            print(f'[6] Envido\n[7] Real Envido\n[8] Falta Envido')
-
-        print('[9] Ir ao baralho')
         cartas = [(f"{carta.numero} de {carta.naipe}") for carta in self.mao]
         # interface.exibir_cartas(cartas)
         # interface.exibir_unica_carta(cartas[0])
@@ -35,10 +36,13 @@ class Jogador():
 
     def criar_mao(self, baralho):
         """Cria a mão do jogador e insere três cartas do baralho a ela."""
-        for i in range(3):
-            self.mao.append(baralho.retirar_carta())
+        self.receber_mao([baralho.retirar_carta() for i in range(3)])
+
 
-        self.envido = self.calcula_envido(self.mao)
+    def receber_mao(self, cartas):
+        """Recebe as cartas já distribuídas (ex: por Baralho.distribuir) e consulta o envido e os pontos de flor na tabela de mãos."""
+        self.mao.extend(cartas)
+        self.envido, _, self.pontos_flor = avaliar_envido_flor(self.mao)
 
 
     def jogar_carta(self, carta_escolhida):
@@ -71,30 +75,12 @@ class Jogador():
 
     def calcula_envido(self, mao):
         """Realização do cálculo de envido."""
-        pontos_envido = []
-
-        for i in range(len(mao)):
-            for j in range(i+1, len(mao)):
-                if ((mao[i].retornar_naipe() == mao[j].retornar_naipe())):
-                    if (mao[0].retornar_pontos_envido(mao[i]) > 0 and mao[0].retornar_pontos_envido(mao[j]) > 0):
-                        pontos_envido.append(20 + (mao[0].retornar_pontos_envido(mao[i]) + mao[0].retornar_pontos_envido(mao[j])))
-                    
-                    else:
-                        pontos_envido.append(0)
-                
-                else:
-                    pontos_envido.append(max(mao[0].retornar_pontos_envido(mao[i]), mao[0].retornar_pontos_envido(mao[j])))
-        
-        return max(pontos_envido)
+        return calcular_envido(mao)
     
     
     def checa_flor(self):
         """Verifica se o jogador possui flor em sua mão."""
-        if all(carta.retornar_naipe() == self.mao[0].retornar_naipe() for carta in self.mao):
-            # print('Flor do Jogador')
-            return True
-            
-        return False
+        return checar_flor(self.mao)
 
     
     def retorna_pontos_envido(self):
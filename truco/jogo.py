@@ -1,7 +1,7 @@
 from .baralho import Baralho
 from .jogador import Jogador
 from .bot import Bot
-from .pontos import MANILHA, CARTAS_VALORES
+from .vazas import ganhador_mao, resultado_vaza, VITORIA, DERROTA
 import random
 
 class Jogo():
@@ -36,19 +36,20 @@ class Jogo():
 
     
     def adicionar_rodada(self, jogador1, jogador2, carta1, carta2, ganhador):
-        """Adição da rodada para cada jogador"""
-        # if ganhador == "Empate":
-        #     jogador1.adicionar_rodada()
-        #     jogador2.adicionar_rodada()
-        #     return "Empate"
-        
+        """Adição da rodada para cada jogador, registrando o resultado da vaza (0 em caso de parda)"""
+        if (ganhador == "Empate"):
+            self.rodadas.append(0)
+            return 0
+
         if (ganhador == carta1):
             jogador1.adicionar_rodada()
+            self.rodadas.append(1)
             return 1
             # ganhador.adicionar_rodada()
         
         elif (ganhador == carta2):
             jogador2.adicionar_rodada()
+            self.rodadas.append(2)
             return 2
             # ganhador.adicionar_rodada()
         
@@ -56,6 +57,16 @@ class Jogo():
             return "Erro"
 
 
+    def verificar_ganhador_mao(self, mao=1):
+        """Retorna o jogador (1 ou 2) que venceu a mão, seguindo as regras de parda, ou None se a mão não terminou."""
+        return ganhador_mao(self.rodadas, mao)
+
+
+    def resetar(self):
+        """Resetar as vazas registradas na mão atual."""
+        self.rodadas = []
+
+
     def quem_joga_primeiro(self, jogador1, jogador2, carta1, carta2, ganhador):
         """Definição de quem joga primeiro, a cada round"""
         if (carta1 == ganhador):
@@ -86,29 +97,15 @@ class Jogo():
 
 
     def verificar_carta_vencedora(self, carta_jogador_01, carta_jogador_02):
-        """Verifica a carta vencedora entre as duas cartas escolhidas"""
-        if ((str(carta_jogador_01.numero)+" de "+carta_jogador_01.naipe) in MANILHA and (str(carta_jogador_02.numero)+" de "+carta_jogador_02.naipe) in MANILHA):
-            if MANILHA[str(carta_jogador_01.numero)+" de "+carta_jogador_01.naipe] > MANILHA[str(carta_jogador_02.numero)+" de "+carta_jogador_02.naipe]:
-                return carta_jogador_01
-           
-            elif (MANILHA[str(carta_jogador_02.numero)+" de "+carta_jogador_02.naipe] > MANILHA[str(carta_jogador_01.numero)+" de "+carta_jogador_01.naipe]):
-                return carta_jogador_02
-        
-        elif ((str(carta_jogador_01.numero)+" de "+carta_jogador_01.naipe) in MANILHA):
+        """Verifica a carta vencedora entre as duas cartas escolhidas, retornando "Empate" em caso de parda"""
+        resultado = resultado_vaza(carta_jogador_01.id, carta_jogador_02.id)
+        if (resultado == VITORIA):
             return carta_jogador_01
-        
-        elif ((str(carta_jogador_02.numero)+" de "+carta_jogador_02.naipe) in MANILHA):
+
+        elif (resultado == DERROTA):
             return carta_jogador_02
-        
-        else:
-            if (CARTAS_VALORES[str(carta_jogador_01.numero)] >= CARTAS_VALORES[str(carta_jogador_02.numero)]):
-                return carta_jogador_01
-        
-            elif (CARTAS_VALORES[str(carta_jogador_01.retornar_numero())] < CARTAS_VALORES[str(carta_jogador_02.retornar_numero())]):
-                return carta_jogador_02
-        
-            # else:
-            #     return "Empate"
+
+        return "Empate"
 
 
     def jogador_fugiu(self, jogador, jogador1, jogador2, pontos):
@@ -0,0 +1,202 @@
+import itertools
+from math import comb
+import numpy as np
+from .pontos import ENVIDO_CARTAS, PONTOS_CARTAS
+
+# Códigos usados na classificação vetorizada, na mesma ordem de RANKS
+RANK_BAIXA = 0
+RANK_MEDIA = 1
+RANK_ALTA = 2
+RANKS = ('Baixa', 'Media', 'Alta')
+
+PONTOS_IDS = np.array(PONTOS_CARTAS, dtype=np.int8)
+
+
+def classificar_maos(ids_maos):
+    """Versão vetorizada de Carta.classificar_carta: recebe um array (N, 3) de ids e retorna os arrays (N, 3) de pontos e de ranks."""
+    ids_maos = np.asarray(ids_maos, dtype=np.intp)
+    pontos = PONTOS_IDS[ids_maos]
+    linhas = np.arange(len(pontos))
+
+    # Mesmo critério de desempate de verificar_carta_alta/verificar_carta_baixa, aplicado em pares
+    alta = np.where(pontos[:, 0] > pontos[:, 1], 0, 1)
+    alta = np.where(pontos[linhas, alta] > pontos[:, 2], alta, 2)
+    baixa = np.where(pontos[:, 0] < pontos[:, 1], 0, 1)
+    baixa = np.where(pontos[linhas, baixa] < pontos[:, 2], baixa, 2)
+
+    ranks = np.full(pontos.shape, RANK_MEDIA, dtype=np.int8)
+    ranks[linhas, alta] = RANK_ALTA
+    ranks[linhas, baixa] = RANK_BAIXA
+    return pontos, ranks
+
+
+def rotular_mao(pontos):
+    """Rótulos ('Alta', 'Media' ou 'Baixa') das três cartas de uma mão pelas suas pontuações, exatamente um de cada.
+
+    Ao contrário de Carta.classificar_carta, que deixa sem 'Alta' uma mão de três cartas de mesmos pontos,
+    os empates são desfeitos pela posição: entre cartas de mesmos pontos, a que vem antes fica com o rank mais alto.
+    """
+    ordem = sorted(range(3), key=lambda posicao: -pontos[posicao])
+    ranks = [None] * 3
+    for rank, posicao in zip((RANK_ALTA, RANK_MEDIA, RANK_BAIXA), ordem):
+        ranks[posicao] = RANKS[rank]
+    return ranks
+
+
+# Índice combinatório (ordem colexicográfica) das mãos de 3 cartas entre as 40 do baralho:
+# para ids a < b < c, indice = C(a, 1) + C(b, 2) + C(c, 3), no intervalo [0, C(40, 3)).
+TOTAL_MAOS = comb(40, 3)
+
+_BINOMIAIS = np.array([[comb(n, k) for k in range(4)] for n in range(40)], dtype=np.int32)
+_BINOMIAIS_1 = tuple(_BINOMIAIS[:, 1].tolist())
+_BINOMIAIS_2 = tuple(_BINOMIAIS[:, 2].tolist())
+_BINOMIAIS_3 = tuple(_BINOMIAIS[:, 3].tolist())
+
+# Todas as mãos (ids em ordem crescente), na posição do seu índice
+MAOS = np.array(sorted(itertools.combinations(range(40), 3), key=lambda mao: mao[::-1]), dtype=np.int8)
+MAOS.flags.writeable = False
+
+
+def indice_mao(ids_mao):
+    """Retorna o índice (0..9879) de uma mão de 3 cartas, a partir dos ids em qualquer ordem."""
+    a, b, c = sorted(ids_mao)
+    return _BINOMIAIS_1[a] + _BINOMIAIS_2[b] + _BINOMIAIS_3[c]
+
+
+def mao_do_indice(indice):
+    """Retorna os ids (em ordem crescente) da mão correspondente ao índice."""
+    return tuple(MAOS[indice].tolist())
+
+
+def indices_maos(ids_maos):
+    """Versão vetorizada de indice_mao: recebe um array (N, 3) de ids e retorna um array (N,) de índices."""
+    ids_maos = np.sort(np.asarray(ids_maos, dtype=np.intp), axis=1)
+    return _BINOMIAIS[ids_maos[:, 0], 1] + _BINOMIAIS[ids_maos[:, 1], 2] + _BINOMIAIS[ids_maos[:, 2], 3]
+
+
+def maos_dos_indices(indices):
+    """Versão vetorizada de mao_do_indice: retorna um array (N, 3) de ids para os índices informados."""
+    return MAOS[np.asarray(indices, dtype=np.intp)]
+
+
+# Envido e flor de todas as mãos, na posição do seu índice. Segue o mesmo critério de
+# Jogador.calcula_envido: entre cada par de cartas, mesmo naipe vale 20 + soma (ou 0 se
+# alguma das duas não pontua) e naipes diferentes valem a maior carta; o envido é o maior par.
+ENVIDO_IDS = np.array(ENVIDO_CARTAS, dtype=np.int8)
+
+
+def _tabela_envido_flor():
+    """Calcula as tabelas de envido, flor e pontos de flor para as 9880 mãos."""
+    envido = ENVIDO_IDS[MAOS]
+    naipes = MAOS // 10
+    pares = []
+    for i, j in ((0, 1), (0, 2), (1, 2)):
+        mesmo_naipe = naipes[:, i] == naipes[:, j]
+        pontuam = (envido[:, i] > 0) & (envido[:, j] > 0)
+        soma = np.where(pontuam, 20 + envido[:, i] + envido[:, j], 0)
+        pares.append(np.where(mesmo_naipe, soma, np.maximum(envido[:, i], envido[:, j])))
+
+    flor = (naipes[:, 0] == naipes[:, 1]) & (naipes[:, 1] == naipes[:, 2])
+    pontos_flor = np.where(flor, 20 + envido.sum(axis=1), 0)
+    tabelas = (np.max(pares, axis=0).astype(np.int8), flor, pontos_flor.astype(np.int8))
+    for tabela in tabelas:
+        tabela.flags.writeable = False
+    return tabelas
+
+
+ENVIDO_MAOS, FLOR_MAOS, PONTOS_FLOR_MAOS = _tabela_envido_flor()
+
+# Cópias em tuplas para consultas escalares (mais rápidas que indexar o array)
+_ENVIDO_FLOR = tuple(zip(ENVIDO_MAOS.tolist(), FLOR_MAOS.tolist(), PONTOS_FLOR_MAOS.tolist()))
+
+
+def envido_flor_maos(ids_maos):
+    """Versão vetorizada de avaliar_envido_flor: recebe um array (N, 3) de ids e retorna os arrays (N,) de envido, flor e pontos de flor."""
+    indices = indices_maos(ids_maos)
+    return ENVIDO_MAOS[indices], FLOR_MAOS[indices], PONTOS_FLOR_MAOS[indices]
+
+
+def envido_flor_ids(ids_mao):
+    """Retorna (envido, flor, pontos_flor) de uma mão de 3 cartas a partir dos ids, em qualquer ordem."""
+    return _ENVIDO_FLOR[indice_mao(ids_mao)]
+
+
+def _calcular_envido_pares(mao):
+    """Cálculo do envido par a par, usado para mãos que não são de 3 cartas do baralho."""
+    pontos_envido = []
+
+    for i in range(len(mao)):
+        for j in range(i+1, len(mao)):
+            if ((mao[i].retornar_naipe() == mao[j].retornar_naipe())):
+                if (mao[0].retornar_pontos_envido(mao[i]) > 0 and mao[0].retornar_pontos_envido(mao[j]) > 0):
+                    pontos_envido.append(20 + (mao[0].retornar_pontos_envido(mao[i]) + mao[0].retornar_pontos_envido(mao[j])))
+                else:
+                    pontos_envido.append(0)
+            else:
+                pontos_envido.append(max(mao[0].retornar_pontos_envido(mao[i]), mao[0].retornar_pontos_envido(mao[j])))
+
+    return max(pontos_envido)
+
+
+def _consultar_tabela(mao):
+    """Retorna (envido, flor, pontos_flor) da tabela, ou None se a mão não for de 3 cartas do baralho."""
+    if len(mao) != 3 or any(carta.id is None for carta in mao):
+        return None
+    return envido_flor_ids([carta.id for carta in mao])
+
+
+def calcular_envido(mao):
+    """Calcula os pontos de envido da mão (lista de Carta)."""
+    tabela = _consultar_tabela(mao)
+    if tabela is None:
+        return _calcular_envido_pares(mao)
+    return tabela[0]
+
+
+def checar_flor(mao):
+    """Verifica se todas as cartas da mão são do mesmo naipe."""
+    tabela = _consultar_tabela(mao)
+    if tabela is None:
+        return all(carta.retornar_naipe() == mao[0].retornar_naipe() for carta in mao)
+    return tabela[1]
+
+
+def avaliar_envido_flor(mao):
+    """Retorna (envido, flor, pontos_flor) da mão; os pontos de flor são 20 + a soma do envido das cartas, ou 0 sem flor."""
+    tabela = _consultar_tabela(mao)
+    if tabela is not None:
+        return tabela
+
+    flor = checar_flor(mao)
+    pontos_flor = 20 + sum(mao[0].retornar_pontos_envido(carta) for carta in mao) if flor else 0
+    return _calcular_envido_pares(mao), flor, pontos_flor
+
+
+def qualidade_pontos(alta, media, baixa):
+    """Versão vetorizada de Bot.calcular_qualidade_mao a partir dos pontos das cartas alta, média e baixa (ex: colunas cartaAltaRobo, cartaMediaRobo e cartaBaixaRobo da base de casos)."""
+    alta, media, baixa = (np.asarray(pontos, dtype=np.float64) for pontos in (alta, media, baixa))
+    m1 = 2 / ((1 / alta) + (1 / media))
+    m2 = (2 * media) + baixa / 2 + 1
+    return ((2 * m1) + m2) / (2 + 1)
+
+
+def _tabela_qualidade():
+    """Calcula a qualidade de todas as mãos; só depende dos pontos ordenados, então os empates não importam."""
+    baixa, media, alta = np.sort(PONTOS_IDS[MAOS], axis=1).T
+    qualidade = qualidade_pontos(alta, media, baixa)
+    qualidade.flags.writeable = False
+    return qualidade
+
+
+QUALIDADE_MAOS = _tabela_qualidade()
+_QUALIDADE_MAOS = tuple(QUALIDADE_MAOS.tolist())
+
+
+def qualidade_maos(ids_maos):
+    """Consulta em lote da qualidade: recebe um array (N, 3) de ids e retorna um array float64 (N,)."""
+    return QUALIDADE_MAOS[indices_maos(ids_maos)]
+
+
+def qualidade_mao(mao):
+    """Retorna a qualidade de uma mão de 3 cartas (lista de Carta), consultando a tabela."""
+    return _QUALIDADE_MAOS[indice_mao([carta.id for carta in mao])]
@@ -0,0 +1,113 @@
+from .carta import CARTAS
+from .pontos import NAIPES, NUMEROS, PONTOS_CARTAS, ENVIDO_CARTAS
+
+# Uma mão é representada por um inteiro de 40 bits, onde o bit i indica a presença da carta de id i.
+# Como id = (índice do naipe * 10) + índice do número, cada naipe ocupa 10 bits consecutivos.
+BITS_POR_NAIPE = len(NUMEROS)
+
+MASCARA_NAIPE = {naipe: ((1 << BITS_POR_NAIPE) - 1) << (i * BITS_POR_NAIPE) for i, naipe in enumerate(NAIPES)}
+
+_MASCARAS_NAIPES = tuple(MASCARA_NAIPE.values())
+
+
+def _envido_do_naipe(padrao):
+    """Calcula, para um padrão de 10 bits de um naipe, o maior envido entre pares do naipe (-1 se não houver par) e o maior envido individual."""
+    valores = [ENVIDO_CARTAS[j] for j in range(BITS_POR_NAIPE) if (padrao >> j) & 1]
+    maior_par = -1
+    for i in range(len(valores)):
+        for j in range(i + 1, len(valores)):
+            if (valores[i] > 0 and valores[j] > 0):
+                maior_par = max(maior_par, 20 + valores[i] + valores[j])
+
+            else:
+                maior_par = max(maior_par, 0)
+
+    return maior_par, max(valores, default=-1)
+
+
+# Tabelas indexadas pelo padrão de 10 bits de um naipe (os valores de envido não dependem do naipe)
+_ENVIDO_PARES, _ENVIDO_MAIOR_CARTA = zip(*(_envido_do_naipe(padrao) for padrao in range(1 << BITS_POR_NAIPE)))
+
+
+def mao_para_bits(mao):
+    """Converte uma lista de cartas (como Jogador.mao) para a máscara de bits."""
+    bits = 0
+    for carta in mao:
+        bits |= 1 << carta.id
+
+    return bits
+
+
+def bits_para_mao(bits):
+    """Converte a máscara de bits para uma lista de cartas, em ordem de id."""
+    mao = []
+    while bits:
+        menor = bits & -bits
+        mao.append(CARTAS[menor.bit_length() - 1])
+        bits ^= menor
+
+    return mao
+
+
+def contar_cartas(bits):
+    """Retorna a quantidade de cartas na máscara."""
+    return bits.bit_count()
+
+
+def tem_carta(bits, carta):
+    """Verifica se a carta está na máscara."""
+    return (bits >> carta.id) & 1 == 1
+
+
+def remover_carta(bits, carta):
+    """Retorna a máscara sem a carta informada."""
+    return bits & ~(1 << carta.id)
+
+
+def tem_naipe(bits, naipe):
+    """Verifica se a máscara possui alguma carta do naipe."""
+    return (bits & MASCARA_NAIPE[naipe]) != 0
+
+
+def tem_flor(bits):
+    """Verifica se a mão de três cartas tem flor (todas do mesmo naipe)."""
+    if (bits.bit_count() != 3):
+        return False
+
+    for mascara in _MASCARAS_NAIPES:
+        if (bits & mascara == bits):
+            return True
+
+    return False
+
+
+def calcular_envido_bits(bits):
+    """Calcula o envido da mão com o mesmo critério de Jogador.calcula_envido, usando tabelas por naipe."""
+    maior_par = -1
+    maior_carta = -1
+    naipes_com_cartas = 0
+    for i in range(len(NAIPES)):
+        padrao = (bits >> (i * BITS_POR_NAIPE)) & ((1 << BITS_POR_NAIPE) - 1)
+        if (padrao):
+            naipes_com_cartas += 1
+            maior_par = max(maior_par, _ENVIDO_PARES[padrao])
+            maior_carta = max(maior_carta, _ENVIDO_MAIOR_CARTA[padrao])
+
+    # Pares de naipes diferentes valem a maior carta do par
+    if (naipes_com_cartas > 1):
+        return max(maior_par, maior_carta)
+
+    return maior_par
+
+
+def carta_mais_alta(bits):
+    """Retorna a carta de maior valor no truco presente na máscara (None se estiver vazia)."""
+    maior = None
+    while bits:
+        menor = bits & -bits
+        id = menor.bit_length() - 1
+        if (maior is None or PONTOS_CARTAS[id] > PONTOS_CARTAS[maior]):
+            maior = id
+        bits ^= menor
+
+    return None if maior is None else CARTAS[maior]
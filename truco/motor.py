@@ -0,0 +1,501 @@
+import struct
+from .baralho import Baralho
+from .maos import envido_flor_ids
+from .vazas import ganhador_mao, resultado_vaza, VITORIA, DERROTA
+from .zobrist import CHAVES_MAO, CHAVES_JOGADA, CHAVES_MESA, CHAVES_VAZA, CHAVES_PONTOS, chave_situacao, chave_cartas
+
+# Ações aceitas por Motor.aplicar. As cartas são escolhidas pela posição (0 a 2) na mão
+# distribuída, e os demais códigos seguem o menu do jogo em linha de comando.
+JOGAR_CARTA_1 = 0
+JOGAR_CARTA_2 = 1
+JOGAR_CARTA_3 = 2
+TRUCO = 4
+FLOR = 5
+ENVIDO = 6
+REAL_ENVIDO = 7
+FALTA_ENVIDO = 8
+IR_AO_BARALHO = 9
+QUERO = 10
+NAO_QUERO = 11
+
+JOGAR_CARTA = (JOGAR_CARTA_1, JOGAR_CARTA_2, JOGAR_CARTA_3)
+
+NOMES_ACOES = {
+    JOGAR_CARTA_1: 'Jogar a 1ª carta',
+    JOGAR_CARTA_2: 'Jogar a 2ª carta',
+    JOGAR_CARTA_3: 'Jogar a 3ª carta',
+    TRUCO: 'Truco',
+    FLOR: 'Flor',
+    ENVIDO: 'Envido',
+    REAL_ENVIDO: 'Real Envido',
+    FALTA_ENVIDO: 'Falta Envido',
+    IR_AO_BARALHO: 'Ir ao baralho',
+    QUERO: 'Quero',
+    NAO_QUERO: 'Não quero',
+}
+
+# Ações legais como máscara de bits: o bit 'acao' está ligado quando a ação é permitida
+CARTAS_MAO = (1 << JOGAR_CARTA_1) | (1 << JOGAR_CARTA_2) | (1 << JOGAR_CARTA_3)
+BIT_TRUCO = 1 << TRUCO
+BIT_FLOR = 1 << FLOR
+BITS_ENVIDO = (1 << ENVIDO) | (1 << REAL_ENVIDO) | (1 << FALTA_ENVIDO)
+BIT_IR_AO_BARALHO = 1 << IR_AO_BARALHO
+BITS_RESPOSTA = (1 << QUERO) | (1 << NAO_QUERO)
+# Aumentos possíveis em resposta a cada tipo de envido
+BITS_AUMENTO_ENVIDO = {ENVIDO: (1 << REAL_ENVIDO) | (1 << FALTA_ENVIDO), REAL_ENVIDO: 1 << FALTA_ENVIDO, FALTA_ENVIDO: 0}
+
+# Ações de cada máscara, em ordem crescente de código
+ACOES_MASCARA = tuple(tuple(acao for acao in range(NAO_QUERO + 1) if mascara >> acao & 1) for mascara in range(1 << (NAO_QUERO + 1)))
+
+# Pedido aguardando resposta do oponente
+SEM_PEDIDO = 0
+PEDIDO_TRUCO = 1
+PEDIDO_ENVIDO = 2
+PEDIDO_FLOR = 3
+
+# Posição de carta já jogada na mão
+SEM_CARTA = -1
+
+PONTOS_VITORIA = 12
+
+# Pontos de cada envido aceito (RN10), que se somam ao longo dos aumentos, e do primeiro envido recusado
+# (para quem pediu), pelo tipo de pedido; recusar um aumento entrega o que já estava aceito
+VALOR_ENVIDO = {ENVIDO: 2, REAL_ENVIDO: 3}
+PONTOS_RECUSA_ENVIDO = {ENVIDO: 1, REAL_ENVIDO: 2, FALTA_ENVIDO: 5}
+VALOR_FLOR = 3
+VALOR_CONTRAFLOR = 6
+PONTOS_RECUSA_CONTRAFLOR = 4
+
+
+def mascara_vez(cartas, pode_truco, pode_flor, pode_envido):
+    """Máscara das ações na vez do jogador, sem pedido pendente.
+
+    'cartas' é a máscara das posições da mão que ainda têm carta; ir ao baralho é sempre permitido.
+    """
+    return (cartas | (BIT_TRUCO if pode_truco else 0) | (BIT_FLOR if pode_flor else 0)
+            | (BITS_ENVIDO if pode_envido else 0) | BIT_IR_AO_BARALHO)
+
+
+def mascara_acoes_legais(estado):
+    """Máscara das ações que o jogador da vez pode aplicar no estado: a fonte única das ações legais."""
+    if (estado.vencedor_mao):
+        return 0
+
+    vez = estado.vez
+    pedido = estado.pedido
+    if (pedido == PEDIDO_TRUCO):
+        return BITS_RESPOSTA | (BIT_TRUCO if estado.valor_pedido < 4 else 0)
+
+    pode_flor = estado.flor[vez - 1] and not estado.envido_fechado
+    if (pedido == PEDIDO_ENVIDO):
+        return BITS_RESPOSTA | BITS_AUMENTO_ENVIDO[estado.valor_pedido] | (BIT_FLOR if pode_flor else 0)
+
+    if (pedido == PEDIDO_FLOR):
+        return BITS_RESPOSTA
+
+    mao = estado.maos[vez - 1]
+    cartas = ((mao[0] != SEM_CARTA) | (mao[1] != SEM_CARTA) << 1 | (mao[2] != SEM_CARTA) << 2)
+    return mascara_vez(cartas, estado.valor_aposta < 4 and estado.quem_aumentou != vez, pode_flor, not estado.envido_fechado)
+
+
+# Codificação binária do EstadoJogo, de tamanho fixo (ver EstadoJogo.serializar). As jogadas
+# são guardadas como (jogador - 1) << 6 | id da carta; vazas e jogadas não usadas ficam com 0.
+FORMATO_ESTADO = struct.Struct('<BB6bBHBBbB3bB6BBBBBBBB?BB??BBBBBBB')
+TAMANHO_ESTADO = FORMATO_ESTADO.size
+
+
+class EstadoJogo():
+    """Estado completo de uma partida, sem nenhuma referência a entrada ou saída.
+
+    Os jogadores são 1 e 2; listas por jogador são indexadas por jogador - 1.
+    """
+
+    __slots__ = ('pontos', 'maos', 'jogador_mao', 'numero_mao', 'vez', 'lider', 'carta_mesa', 'vazas', 'jogadas',
+                 'valor_aposta', 'quem_aumentou', 'pedido', 'quem_pediu', 'valor_pedido', 'vez_retorno',
+                 'valor_envido', 'envido_fechado', 'envido', 'flor', 'pontos_flor', 'vencedor_envido', 'vencedor_flor',
+                 'vencedor_mao', 'pontos_mao', 'vencedor', 'chave_cartas')
+
+    def __init__(self):
+        self.pontos = [0, 0]
+        self.maos = [[SEM_CARTA] * 3, [SEM_CARTA] * 3]
+        # Quem é mão na mão atual (abre a primeira vaza e vence em caso de três pardas)
+        self.jogador_mao = 2
+        self.numero_mao = 0
+        self.vez = 1
+        self.lider = 1
+        self.carta_mesa = SEM_CARTA
+        # Resultado das vazas como em Jogo.rodadas: 1 ou 2 para o vencedor, 0 para parda
+        self.vazas = []
+        # Cartas jogadas na mão atual, em ordem, como (jogador, id da carta)
+        self.jogadas = []
+
+        self.valor_aposta = 1
+        self.quem_aumentou = 0
+        self.pedido = SEM_PEDIDO
+        self.quem_pediu = 0
+        self.valor_pedido = 0
+        self.vez_retorno = 0
+
+        # Pontos do envido já aceitos pelos aumentos do pedido pendente (0 antes de qualquer aumento)
+        self.valor_envido = 0
+        self.envido_fechado = False
+        self.envido = [0, 0]
+        self.flor = [False, False]
+        self.pontos_flor = [0, 0]
+        self.vencedor_envido = 0
+        self.vencedor_flor = 0
+
+        self.vencedor_mao = 0
+        self.pontos_mao = 0
+        self.vencedor = 0
+
+        # Parte da chave de Zobrist dada pelas cartas, vazas e placar (ver truco.zobrist),
+        # atualizada pelo Motor a cada carta jogada e a cada ponto somado
+        self.chave_cartas = chave_cartas(self)
+
+    def serializar(self):
+        """Codifica o estado em TAMANHO_ESTADO bytes."""
+        vazas = self.vazas + [0] * (3 - len(self.vazas))
+        jogadas = [(jogador - 1) << 6 | carta for jogador, carta in self.jogadas]
+        jogadas += [0] * (6 - len(jogadas))
+        return FORMATO_ESTADO.pack(
+            *self.pontos, *self.maos[0], *self.maos[1], self.jogador_mao, self.numero_mao, self.vez, self.lider,
+            self.carta_mesa, len(self.vazas), *vazas, len(self.jogadas), *jogadas,
+            self.valor_aposta, self.quem_aumentou, self.pedido, self.quem_pediu, self.valor_pedido, self.vez_retorno,
+            self.valor_envido, self.envido_fechado, *self.envido, *self.flor, *self.pontos_flor, self.vencedor_envido, self.vencedor_flor,
+            self.vencedor_mao, self.pontos_mao, self.vencedor)
+
+    @classmethod
+    def desserializar(cls, dados):
+        """Reconstrói o estado codificado por serializar."""
+        campos = FORMATO_ESTADO.unpack(dados)
+        estado = cls.__new__(cls)
+        estado.pontos = list(campos[0:2])
+        estado.maos = [list(campos[2:5]), list(campos[5:8])]
+        (estado.jogador_mao, estado.numero_mao, estado.vez, estado.lider, estado.carta_mesa) = campos[8:13]
+        estado.vazas = list(campos[14:14 + campos[13]])
+        estado.jogadas = [((jogada >> 6) + 1, jogada & 63) for jogada in campos[18:18 + campos[17]]]
+        (estado.valor_aposta, estado.quem_aumentou, estado.pedido, estado.quem_pediu, estado.valor_pedido,
+         estado.vez_retorno, estado.valor_envido, estado.envido_fechado) = campos[24:32]
+        estado.envido = list(campos[32:34])
+        estado.flor = list(campos[34:36])
+        estado.pontos_flor = list(campos[36:38])
+        (estado.vencedor_envido, estado.vencedor_flor, estado.vencedor_mao, estado.pontos_mao,
+         estado.vencedor) = campos[38:43]
+        estado.chave_cartas = chave_cartas(estado)
+        return estado
+
+
+class Motor():
+    """Motor do jogo sem entrada nem saída: mantém um EstadoJogo e o altera a cada ação aplicada."""
+
+    __slots__ = ('baralho', 'pontos_vitoria', 'estado', '_mascara', '_pilha')
+
+    def __init__(self, gerador=None, pontos_vitoria=PONTOS_VITORIA):
+        self.baralho = Baralho(gerador)
+        self.pontos_vitoria = pontos_vitoria
+        self.estado = EstadoJogo()
+        # Máscara das ações legais do estado atual, calculada sob demanda e descartada a cada alteração
+        self._mascara = None
+        # Registros para desfazer as ações aplicadas com empilhar, do mais antigo ao mais recente
+        self._pilha = []
+
+    def nova_partida(self):
+        """Zera o placar e distribui a primeira mão, com o jogador 1 como mão."""
+        self.estado = EstadoJogo()
+        self.nova_mao()
+        return self.estado
+
+    def restaurar(self, dados):
+        """Substitui o estado pelo codificado em 'dados' (ver EstadoJogo.serializar), descartando a pilha."""
+        self.estado = EstadoJogo.desserializar(dados)
+        self._mascara = None
+        self._pilha.clear()
+        return self.estado
+
+    def nova_mao(self, maos=None):
+        """Distribui uma nova mão (ou usa os ids informados em 'maos'), alternando quem é mão."""
+        estado = self.estado
+        self._mascara = None
+        self._pilha.clear()
+        if (maos is None):
+            maos = self.baralho.distribuir_ids(jogadores=2, cartas=3)
+
+        estado.maos = [list(maos[0]), list(maos[1])]
+        for i in (0, 1):
+            estado.envido[i], estado.flor[i], estado.pontos_flor[i] = envido_flor_ids(estado.maos[i])
+
+        estado.jogador_mao = 3 - estado.jogador_mao
+        estado.numero_mao += 1
+        estado.vez = estado.lider = estado.jogador_mao
+        estado.carta_mesa = SEM_CARTA
+        estado.vazas = []
+        estado.jogadas = []
+        estado.valor_aposta = 1
+        estado.quem_aumentou = 0
+        estado.pedido = SEM_PEDIDO
+        estado.quem_pediu = 0
+        estado.valor_pedido = 0
+        estado.vez_retorno = 0
+        estado.valor_envido = 0
+        estado.envido_fechado = False
+        estado.vencedor_envido = 0
+        estado.vencedor_flor = 0
+        estado.vencedor_mao = 0
+        estado.pontos_mao = 0
+        estado.chave_cartas = chave_cartas(estado)
+        return estado
+
+    def chave(self):
+        """Chave de Zobrist de 64 bits do estado atual.
+
+        A parte das cartas, vazas e placar é mantida por XOR a cada ação; a da vez e das apostas
+        é combinada aqui, com três consultas às tabelas.
+        """
+        estado = self.estado
+        return estado.chave_cartas ^ chave_situacao(estado)
+
+    def mascara_legal(self):
+        """Retorna a máscara de bits das ações que o jogador da vez pode aplicar."""
+        if (self._mascara is None):
+            self._mascara = mascara_acoes_legais(self.estado)
+        return self._mascara
+
+    def acoes_legais(self):
+        """Retorna a tupla de ações que o jogador da vez pode aplicar."""
+        return ACOES_MASCARA[self.mascara_legal()]
+
+    def aplicar(self, acao):
+        """Aplica a ação do jogador da vez, levantando ValueError se ela não for legal no estado atual."""
+        if (not 0 <= acao <= NAO_QUERO or not self.mascara_legal() >> acao & 1):
+            raise ValueError(f"Ação {acao} não é permitida no estado atual.")
+        return self._executar(acao)
+
+    def _executar(self, acao):
+        estado = self.estado
+        vez = estado.vez
+        pedido = estado.pedido
+        self._mascara = None
+
+        if (acao <= JOGAR_CARTA_3):
+            self._jogar_carta(vez, acao)
+
+        elif (acao == IR_AO_BARALHO):
+            self._encerrar_mao(3 - vez, estado.valor_aposta)
+
+        elif (acao == TRUCO):
+            if (pedido == PEDIDO_TRUCO):
+                # Aumentar a aposta aceita o pedido anterior
+                estado.valor_aposta = estado.valor_pedido
+                estado.quem_aumentou = estado.quem_pediu
+            else:
+                estado.pedido = PEDIDO_TRUCO
+                estado.vez_retorno = vez
+            estado.valor_pedido = estado.valor_aposta + 1
+            self._pedir(vez)
+
+        elif (acao == FLOR):
+            self._cantar_flor(vez)
+
+        elif (acao in (ENVIDO, REAL_ENVIDO, FALTA_ENVIDO)):
+            if (pedido == SEM_PEDIDO):
+                estado.pedido = PEDIDO_ENVIDO
+                estado.vez_retorno = vez
+            elif (pedido == PEDIDO_ENVIDO):
+                # Aumentar o envido aceita o pedido anterior, cujos pontos se somam aos do aumento
+                estado.valor_envido += VALOR_ENVIDO[estado.valor_pedido]
+            estado.valor_pedido = acao
+            self._pedir(vez)
+
+        elif (pedido == PEDIDO_TRUCO):
+            self._responder_truco(acao == QUERO)
+
+        elif (pedido == PEDIDO_ENVIDO):
+            self._responder_envido(acao == QUERO)
+
+        else:
+            self._responder_flor(acao == QUERO)
+
+        return estado
+
+    def empilhar(self, acao):
+        """Aplica a ação guardando o necessário para desfazê-la com desempilhar, sem copiar o estado.
+
+        Vale para as ações dentro de uma mão: nova_mao e nova_partida descartam a pilha.
+        """
+        mascara = self.mascara_legal()
+        if (not 0 <= acao <= NAO_QUERO or not mascara >> acao & 1):
+            raise ValueError(f"Ação {acao} não é permitida no estado atual.")
+
+        estado = self.estado
+        pontos = estado.pontos
+        self._pilha.append((acao, mascara, estado.vez, estado.lider, estado.carta_mesa, len(estado.vazas),
+                            estado.valor_aposta, estado.quem_aumentou, estado.pedido, estado.quem_pediu,
+                            estado.valor_pedido, estado.vez_retorno, estado.valor_envido, estado.envido_fechado,
+                            estado.vencedor_envido, estado.vencedor_flor, estado.vencedor_mao,
+                            estado.pontos_mao, estado.vencedor, pontos[0], pontos[1],
+                            estado.chave_cartas))
+        return self._executar(acao)
+
+    def desempilhar(self):
+        """Desfaz a última ação aplicada com empilhar e a retorna."""
+        estado = self.estado
+        (acao, self._mascara, estado.vez, estado.lider, estado.carta_mesa, vazas,
+         estado.valor_aposta, estado.quem_aumentou, estado.pedido, estado.quem_pediu,
+         estado.valor_pedido, estado.vez_retorno, estado.valor_envido, estado.envido_fechado,
+         estado.vencedor_envido, estado.vencedor_flor, estado.vencedor_mao,
+         estado.pontos_mao, estado.vencedor, pontos_1, pontos_2,
+         estado.chave_cartas) = self._pilha.pop()
+
+        if (acao <= JOGAR_CARTA_3):
+            # A carta volta para a posição de onde saiu
+            jogador, carta = estado.jogadas.pop()
+            estado.maos[jogador - 1][acao] = carta
+            del estado.vazas[vazas:]
+        estado.pontos[0] = pontos_1
+        estado.pontos[1] = pontos_2
+        return acao
+
+    def _pedir(self, jogador):
+        """Registra quem fez o pedido e passa a vez ao oponente, que deve responder."""
+        estado = self.estado
+        estado.quem_pediu = jogador
+        estado.vez = 3 - jogador
+
+    def _fechar_pedido(self):
+        """Encerra o pedido pendente e devolve a vez a quem estava jogando."""
+        estado = self.estado
+        estado.pedido = SEM_PEDIDO
+        estado.vez = estado.vez_retorno
+
+    def _jogar_carta(self, jogador, posicao):
+        estado = self.estado
+        mao = estado.maos[jogador - 1]
+        carta = mao[posicao]
+        mao[posicao] = SEM_CARTA
+        estado.jogadas.append((jogador, carta))
+        estado.chave_cartas ^= CHAVES_MAO[(jogador - 1) * 3 + posicao][carta] ^ CHAVES_JOGADA[jogador - 1][carta]
+
+        if (estado.carta_mesa == SEM_CARTA):
+            estado.carta_mesa = carta
+            estado.chave_cartas ^= CHAVES_MESA[carta]
+            estado.vez = 3 - jogador
+            return
+
+        # Segunda carta da vaza: o resultado é do ponto de vista de quem abriu
+        lider = estado.lider
+        resultado = resultado_vaza(estado.carta_mesa, carta)
+        if (resultado == VITORIA):
+            vencedor = lider
+        elif (resultado == DERROTA):
+            vencedor = jogador
+        else:
+            vencedor = 0
+
+        estado.chave_cartas ^= CHAVES_MESA[estado.carta_mesa] ^ CHAVES_VAZA[len(estado.vazas)][vencedor]
+        estado.vazas.append(vencedor)
+        estado.carta_mesa = SEM_CARTA
+        estado.envido_fechado = True
+
+        vencedor_mao = ganhador_mao(estado.vazas, estado.jogador_mao)
+        if (vencedor_mao is not None):
+            self._encerrar_mao(vencedor_mao, estado.valor_aposta)
+            return
+
+        # Quem vence a vaza abre a próxima; em caso de parda, quem abriu continua abrindo
+        if (vencedor):
+            estado.lider = vencedor
+        estado.vez = estado.lider
+
+    def _responder_truco(self, aceitou):
+        estado = self.estado
+        if (aceitou):
+            estado.valor_aposta = estado.valor_pedido
+            estado.quem_aumentou = estado.quem_pediu
+            self._fechar_pedido()
+        else:
+            # Quem recusou entrega a aposta que valia antes do pedido
+            self._encerrar_mao(estado.quem_pediu, estado.valor_aposta)
+
+    def _responder_envido(self, aceitou):
+        estado = self.estado
+        tipo = estado.valor_pedido
+        estado.envido_fechado = True
+        self._fechar_pedido()
+
+        if (aceitou):
+            if (tipo == FALTA_ENVIDO):
+                # A falta é o que falta para quem está ganhando vencer a partida
+                valor = self.pontos_vitoria - max(estado.pontos)
+            else:
+                valor = estado.valor_envido + VALOR_ENVIDO[tipo]
+            envido_1, envido_2 = estado.envido
+            if (envido_1 == envido_2):
+                vencedor = estado.jogador_mao
+            else:
+                vencedor = 1 if envido_1 > envido_2 else 2
+        else:
+            vencedor = estado.quem_pediu
+            # Recusar um aumento entrega o envido já aceito; recusar o primeiro pedido, os pontos do seu tipo
+            valor = estado.valor_envido or PONTOS_RECUSA_ENVIDO[tipo]
+
+        estado.vencedor_envido = vencedor
+        self._adicionar_pontos(vencedor, valor)
+
+    def _cantar_flor(self, jogador):
+        estado = self.estado
+        if (estado.pedido == SEM_PEDIDO):
+            estado.vez_retorno = jogador
+        estado.envido_fechado = True
+
+        if (estado.flor[2 - jogador]):
+            # O oponente também tem flor: ele decide se aceita a contraflor
+            estado.pedido = PEDIDO_FLOR
+            self._pedir(jogador)
+            return
+
+        self._fechar_pedido()
+        estado.vencedor_flor = jogador
+        self._adicionar_pontos(jogador, VALOR_FLOR)
+
+    def _responder_flor(self, aceitou):
+        estado = self.estado
+        self._fechar_pedido()
+
+        if (aceitou):
+            flor_1, flor_2 = estado.pontos_flor
+            if (flor_1 == flor_2):
+                vencedor = estado.jogador_mao
+            else:
+                vencedor = 1 if flor_1 > flor_2 else 2
+            valor = VALOR_CONTRAFLOR
+        else:
+            vencedor = estado.quem_pediu
+            valor = PONTOS_RECUSA_CONTRAFLOR
+
+        estado.vencedor_flor = vencedor
+        self._adicionar_pontos(vencedor, valor)
+
+    def _adicionar_pontos(self, jogador, pontos):
+        """Soma pontos fora do resultado da mão (envido e flor), encerrando a partida se alguém chegar à vitória."""
+        estado = self.estado
+        self._somar_pontos(estado, jogador, pontos)
+        if (estado.pontos[jogador - 1] >= self.pontos_vitoria):
+            estado.vencedor = jogador
+            estado.vencedor_mao = jogador
+
+    def _somar_pontos(self, estado, jogador, pontos):
+        """Soma os pontos ao placar do jogador, atualizando a chave do estado."""
+        chaves = CHAVES_PONTOS[jogador - 1]
+        anterior = estado.pontos[jogador - 1]
+        estado.pontos[jogador - 1] = anterior + pontos
+        estado.chave_cartas ^= chaves[anterior] ^ chaves[anterior + pontos]
+
+    def _encerrar_mao(self, vencedor, pontos):
+        estado = self.estado
+        estado.pedido = SEM_PEDIDO
+        estado.vencedor_mao = vencedor
+        estado.pontos_mao = pontos
+        self._somar_pontos(estado, vencedor, pontos)
+        if (estado.pontos[vencedor - 1] >= self.pontos_vitoria):
+            estado.vencedor = vencedor
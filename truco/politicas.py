@@ -0,0 +1,334 @@
+import random
+from abc import ABC, abstractmethod
+from .carta import CARTAS
+from .pontos import PONTOS_CARTAS
+from .motor import JOGAR_CARTA, SEM_CARTA, SEM_PEDIDO, PEDIDO_TRUCO, PEDIDO_ENVIDO
+from .motor import TRUCO, FLOR, ENVIDO, REAL_ENVIDO, FALTA_ENVIDO, QUERO, NAO_QUERO, NOMES_ACOES
+
+# Ordem das respostas nos menus numerados, a mesma dos pedidos de Truco, Envido e Flor:
+# [0] Recusar, [1] Aceitar e, em seguida, os aumentos possíveis
+ORDEM_RESPOSTAS = (NAO_QUERO, QUERO, TRUCO, REAL_ENVIDO, FALTA_ENVIDO, FLOR)
+ROTULOS_RESPOSTAS = {
+    NAO_QUERO: 'Recusar',
+    QUERO: 'Aceitar',
+    TRUCO: 'Aumentar Aposta',
+    REAL_ENVIDO: 'Real Envido',
+    FALTA_ENVIDO: 'Falta Envido',
+    FLOR: 'Flor',
+}
+NOMES_TRUCO = {2: 'Truco', 3: 'Retruco', 4: 'Vale 4'}
+
+
+class Politica(ABC):
+    """Interface de decisão de um jogador, chamada pelos dois lados da mesa.
+
+    Cada método recebe o jogador (1 ou 2) que decide e as opções legais (códigos de ação
+    de truco.motor) e retorna uma delas. 'estado' é o EstadoJogo quando a decisão vem do
+    motor, ou None quando vem das classes Truco, Envido e Flor.
+    """
+
+    @abstractmethod
+    def escolher_carta(self, jogador, opcoes, estado):
+        """Escolhe a ação na vez do jogador: jogar uma carta, fazer um pedido ou ir ao baralho."""
+
+    @abstractmethod
+    def responder_truco(self, jogador, valor, opcoes, estado=None):
+        """Responde a um pedido de truco que, se aceito, faz a mão valer 'valor' pontos."""
+
+    @abstractmethod
+    def responder_envido(self, jogador, tipo, opcoes, estado=None):
+        """Responde a um pedido de envido do tipo ENVIDO, REAL_ENVIDO ou FALTA_ENVIDO."""
+
+    @abstractmethod
+    def responder_flor(self, jogador, tipo, opcoes, estado=None):
+        """Responde a uma flor cantada quando também se tem flor ('tipo' é o nome da disputa)."""
+
+    def iniciar_mao(self, estado, jogador):
+        """Chamado quando uma nova mão é distribuída."""
+
+    def observar(self, estado, jogador, acao):
+        """Chamado depois de cada ação aplicada no motor, por qualquer um dos jogadores."""
+
+    def decidir(self, motor):
+        """Encaminha a decisão do jogador da vez no motor ao método correspondente."""
+        estado = motor.estado
+        jogador = estado.vez
+        opcoes = motor.acoes_legais()
+        pedido = estado.pedido
+        if (pedido == SEM_PEDIDO):
+            return self.escolher_carta(jogador, opcoes, estado)
+
+        if (pedido == PEDIDO_TRUCO):
+            return self.responder_truco(jogador, estado.valor_pedido, opcoes, estado)
+
+        if (pedido == PEDIDO_ENVIDO):
+            return self.responder_envido(jogador, estado.valor_pedido, opcoes, estado)
+
+        return self.responder_flor(jogador, 'Contraflor', opcoes, estado)
+
+
+class PoliticaHumana(Politica):
+    """Decisões lidas do teclado.
+
+    'entrada' substitui input(). Entradas fora das opções repetem a pergunta; entradas não
+    numéricas levantam ValueError, a menos que 'insistir' seja verdadeiro, quando também
+    repetem a pergunta.
+    """
+
+    def __init__(self, nome=None, entrada=None, insistir=False):
+        self.nome = nome
+        self.entrada = entrada
+        self.insistir = insistir
+
+    def _ler(self, mensagem, validas):
+        escolha = -1
+        while (escolha not in validas):
+            try:
+                escolha = int((self.entrada or input)(mensagem))
+            except ValueError:
+                if (not self.insistir):
+                    raise
+                escolha = -1
+
+            if (self.insistir and escolha not in validas):
+                print('Selecione um valor válido!')
+
+        return escolha
+
+    def _quem(self, jogador):
+        return self.nome or f"Jogador {jogador}"
+
+    def _responder(self, pergunta, opcoes):
+        opcoes = sorted(opcoes, key=ORDEM_RESPOSTAS.index)
+        menu = ''.join(f"\n[{i}] {ROTULOS_RESPOSTAS[acao]}" for i, acao in enumerate(opcoes))
+        return opcoes[self._ler(pergunta + menu, range(len(opcoes)))]
+
+    def escolher_carta(self, jogador, opcoes, estado):
+        print(f"\n<< {self._quem(jogador)} - Jogador {jogador} >>")
+        mao = estado.maos[jogador - 1]
+        for acao in opcoes:
+            if (acao in JOGAR_CARTA):
+                print(f"[{acao}] {CARTAS[mao[acao]].retornar_carta()}")
+            elif (acao == TRUCO):
+                print(f"[{acao}] {NOMES_TRUCO[estado.valor_aposta + 1]}")
+            else:
+                print(f"[{acao}] {NOMES_ACOES[acao]}")
+
+        return self._ler(f"\n{self._quem(jogador)}, qual a sua jogada? ", opcoes)
+
+    def responder_truco(self, jogador, valor, opcoes, estado=None):
+        return self._responder(f"{self._quem(jogador)}, você aceita o pedido (a mão passa a valer {valor} pontos)", opcoes)
+
+    def responder_envido(self, jogador, tipo, opcoes, estado=None):
+        return self._responder(f"{self._quem(jogador)}, você aceita o pedido de {NOMES_ACOES[tipo]}?", opcoes)
+
+    def responder_flor(self, jogador, tipo, opcoes, estado=None):
+        return self._responder(f"{self._quem(jogador)}, você aceita o pedido de {tipo}?", opcoes)
+
+
+class PoliticaAleatoria(Politica):
+    """Escolhe uniformemente entre as opções legais."""
+
+    def __init__(self, gerador=None):
+        self.gerador = random.Random(gerador) if gerador is None or isinstance(gerador, int) else gerador
+
+    def escolher_carta(self, jogador, opcoes, estado):
+        return self.gerador.choice(opcoes)
+
+    def responder_truco(self, jogador, valor, opcoes, estado=None):
+        return self.gerador.choice(opcoes)
+
+    def responder_envido(self, jogador, tipo, opcoes, estado=None):
+        return self.gerador.choice(opcoes)
+
+    def responder_flor(self, jogador, tipo, opcoes, estado=None):
+        return self.gerador.choice(opcoes)
+
+
+class PoliticaHeuristica(Politica):
+    """Regras fixas e simples, como referência para comparar bots: só decide a partir do estado do motor.
+
+    Abre cada vaza com a carta mais alta e responde com a menor carta que vence a da mesa (ou a menor,
+    se nenhuma vence). Canta flor sempre que pode e pede ou aceita envido e truco conforme os limiares:
+    pontos de envido ou de flor, e pontos (PONTOS_CARTAS) da maior carta que resta na mão.
+    """
+
+    LIMIAR_ENVIDO = 27
+    LIMIAR_FLOR = 31
+    LIMIAR_TRUCO = 24
+
+    def _cartas(self, jogador, estado):
+        """Posições e pontos das cartas que restam na mão do jogador."""
+        return [(PONTOS_CARTAS[carta], posicao) for posicao, carta in enumerate(estado.maos[jogador - 1]) if carta != SEM_CARTA]
+
+    def _maior_carta(self, jogador, estado):
+        return max(self._cartas(jogador, estado), default=(0, None))[0]
+
+    def escolher_carta(self, jogador, opcoes, estado):
+        if (FLOR in opcoes):
+            return FLOR
+
+        if (ENVIDO in opcoes and estado.envido[jogador - 1] >= self.LIMIAR_ENVIDO):
+            return ENVIDO
+
+        if (TRUCO in opcoes and estado.pedido == SEM_PEDIDO and self._maior_carta(jogador, estado) >= self.LIMIAR_TRUCO):
+            return TRUCO
+
+        cartas = self._cartas(jogador, estado)
+        if (estado.carta_mesa == SEM_CARTA):
+            return max(cartas)[1]
+
+        mesa = PONTOS_CARTAS[estado.carta_mesa]
+        vencem = [carta for carta in cartas if carta[0] > mesa]
+        return min(vencem or cartas)[1]
+
+    def responder_truco(self, jogador, valor, opcoes, estado=None):
+        return QUERO if self._maior_carta(jogador, estado) >= self.LIMIAR_TRUCO else NAO_QUERO
+
+    def responder_envido(self, jogador, tipo, opcoes, estado=None):
+        if (FLOR in opcoes):
+            return FLOR
+        return QUERO if estado.envido[jogador - 1] >= self.LIMIAR_ENVIDO else NAO_QUERO
+
+    def responder_flor(self, jogador, tipo, opcoes, estado=None):
+        return QUERO if estado.pontos_flor[jogador - 1] >= self.LIMIAR_FLOR else NAO_QUERO
+
+
+class PoliticaRoteirizada(Politica):
+    """Repete uma sequência fixa de ações, na ordem em que as decisões acontecem."""
+
+    def __init__(self, acoes):
+        self.acoes = iter(acoes)
+
+    def _proxima(self, opcoes):
+        acao = next(self.acoes, None)
+        if (acao not in opcoes):
+            raise ValueError(f"Ação roteirizada {acao} não está entre as opções {opcoes}.")
+        return acao
+
+    def escolher_carta(self, jogador, opcoes, estado):
+        return self._proxima(opcoes)
+
+    def responder_truco(self, jogador, valor, opcoes, estado=None):
+        return self._proxima(opcoes)
+
+    def responder_envido(self, jogador, tipo, opcoes, estado=None):
+        return self._proxima(opcoes)
+
+    def responder_flor(self, jogador, tipo, opcoes, estado=None):
+        return self._proxima(opcoes)
+
+
+class PoliticaCbr(Politica):
+    """Decisões do Bot consultando a base de casos (CBR), traduzidas para as ações do motor.
+
+    Ao fim de cada mão o caso é gravado com dados.finalizar_partida(), a menos que 'salvar' seja falso.
+    """
+
+    TIPOS_TRUCO = {2: 'truco', 3: 'retruco', 4: 'vale_quatro'}
+    RESPOSTAS_TRUCO = (NAO_QUERO, QUERO, TRUCO)
+    RESPOSTAS_ENVIDO = (NAO_QUERO, QUERO, REAL_ENVIDO, FALTA_ENVIDO)
+
+    def __init__(self, bot, cbr, dados, salvar=True):
+        self.bot = bot
+        self.cbr = cbr
+        self.dados = dados
+        self.salvar = salvar
+        self.jogador = 2
+        self.vazas = 0
+        self.mao_salva = False
+
+    def _quem_pediu(self, estado, jogador):
+        """Quem fez o pedido na codificação da base de casos: 1 para o oponente, 2 para o bot."""
+        return 2 if estado.quem_pediu == jogador else 1
+
+    def iniciar_mao(self, estado, jogador):
+        self.bot.resetar()
+        self.bot.receber_mao([CARTAS[id] for id in estado.maos[jogador - 1]])
+        self.jogador = jogador
+        self.vazas = 0
+        self.mao_salva = False
+
+    def observar(self, estado, jogador, acao):
+        # Enriquece o caso com as cartas de cada vaza encerrada e salva a mão ao final.
+        # Na base de casos o oponente é sempre o jogador 1 e o bot, o jogador 2.
+        if (len(estado.vazas) > self.vazas):
+            self.vazas = len(estado.vazas)
+            cartas = dict(estado.jogadas[-2:])
+            vencedor = estado.vazas[-1] and (2 if estado.vazas[-1] == self.jogador else 1)
+            self.bot.enriquecer_bot(self.dados, CARTAS[cartas[3 - self.jogador]], CARTAS[cartas[self.jogador]], vencedor)
+
+        if (estado.vencedor_mao and not self.mao_salva):
+            self.mao_salva = True
+            if (self.salvar):
+                self.dados.finalizar_partida()
+
+    def escolher_carta(self, jogador, opcoes, estado):
+        bot = self.bot
+        bot.pontos = estado.pontos[jogador - 1]
+        pontos_oponente = estado.pontos[2 - jogador]
+        if (FLOR in opcoes):
+            return FLOR
+
+        if (ENVIDO in opcoes and bot.envido):
+            escolha = bot.avaliar_envido(self.cbr, 'Envido', 2, pontos_oponente)
+            if (escolha in (ENVIDO, REAL_ENVIDO, FALTA_ENVIDO)):
+                return escolha
+
+        # Enriquece o caso com a carta que o oponente abriu na primeira vaza
+        if (len(bot.mao) == 3 and estado.carta_mesa != SEM_CARTA):
+            bot.enriquecer_bot(dados=self.dados, carta_jogador_01=CARTAS[estado.carta_mesa])
+
+        while True:
+            escolha = bot.jogar_carta(self.cbr, None)
+            if (escolha == TRUCO):
+                if (TRUCO in opcoes):
+                    return TRUCO
+                continue
+
+            # O Bot escolhe pela posição entre as cartas que restam; o motor, pela posição na mão distribuída
+            mao = estado.maos[jogador - 1]
+            posicoes = [posicao for posicao in JOGAR_CARTA if mao[posicao] != SEM_CARTA]
+            bot.mao.pop(escolha)
+            return posicoes[escolha]
+
+    def responder_truco(self, jogador, valor, opcoes, estado=None):
+        escolha = self.bot.avaliar_truco(self.cbr, self.TIPOS_TRUCO[valor], self._quem_pediu(estado, jogador))
+        acao = self.RESPOSTAS_TRUCO[escolha] if escolha in (0, 1, 2) else QUERO
+        return acao if acao in opcoes else QUERO
+
+    def responder_envido(self, jogador, tipo, opcoes, estado=None):
+        self.bot.pontos = estado.pontos[jogador - 1]
+        escolha = self.bot.avaliar_envido(self.cbr, tipo, self._quem_pediu(estado, jogador), estado.pontos[2 - jogador])
+        acao = self.RESPOSTAS_ENVIDO[escolha] if escolha in (0, 1, 2, 3) else QUERO
+        return acao if acao in opcoes else QUERO
+
+    def responder_flor(self, jogador, tipo, opcoes, estado=None):
+        return QUERO
+
+
+def jogar_partida(motor, politicas, observador=None):
+    """Joga uma partida completa no motor entre as políticas dos jogadores 1 e 2, retornando o vencedor.
+
+    'observador', se informado, é chamado como observador(motor, jogador, acao) depois de cada ação.
+    """
+    estado = motor.nova_partida()
+    for jogador, politica in enumerate(politicas, 1):
+        politica.iniciar_mao(estado, jogador)
+
+    while True:
+        jogador = estado.vez
+        acao = politicas[jogador - 1].decidir(motor)
+        motor.aplicar(acao)
+        for politica in politicas:
+            politica.observar(estado, jogador, acao)
+        if (observador is not None):
+            observador(motor, jogador, acao)
+
+        if (estado.vencedor):
+            return estado.vencedor
+
+        if (estado.vencedor_mao):
+            motor.nova_mao()
+            for outro, politica in enumerate(politicas, 1):
+                politica.iniciar_mao(estado, outro)
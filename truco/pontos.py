@@ -29,4 +29,26 @@ ENVIDO = {
     "6": 6,
     "5": 5,
     "4": 4
-}
\ No newline at end of file
+}
+
+# Identificação das 40 cartas do baralho por inteiros estáveis (0..39), na mesma
+# ordem em que o Baralho as cria: id = (índice do naipe * 10) + índice do número.
+NAIPES = ("ESPADAS", "OUROS", "COPAS", "BASTOS")
+
+NUMEROS = (1, 2, 3, 4, 5, 6, 7, 10, 11, 12)
+
+CARTA_ID = {
+    (numero, naipe): (i * len(NUMEROS)) + j
+    for i, naipe in enumerate(NAIPES)
+    for j, numero in enumerate(NUMEROS)
+}
+
+# Pontuação de cada carta indexada pelo id, já considerando as manilhas.
+PONTOS_CARTAS = tuple(
+    MANILHA.get(f"{numero} de {naipe}", CARTAS_VALORES[str(numero)])
+    for naipe in NAIPES
+    for numero in NUMEROS
+)
+
+# Pontos de envido de cada carta indexados pelo id.
+ENVIDO_CARTAS = tuple(ENVIDO[str(numero)] for naipe in NAIPES for numero in NUMEROS)
@@ -0,0 +1,306 @@
+import copy
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .aleatorio import random_do_jogo
+from .bot import Bot
+from .cbr import Cbr
+from .motor import Motor, PEDIDO_TRUCO, PEDIDO_ENVIDO, PEDIDO_FLOR, TRUCO, REAL_ENVIDO, FALTA_ENVIDO, QUERO, NAO_QUERO
+from .politicas import PoliticaAleatoria, PoliticaCbr, PoliticaHeuristica, jogar_partida
+
+# Políticas que podem ser simuladas, pelo nome usado na linha de comando
+POLITICAS = ('cbr', 'aleatorio', 'heuristico')
+
+# Pedidos cujas respostas são contadas, e as respostas que contam como aceite (aumentar também aceita)
+PEDIDOS = {PEDIDO_TRUCO: 'truco', PEDIDO_ENVIDO: 'envido', PEDIDO_FLOR: 'flor'}
+ACEITES = {PEDIDO_TRUCO: (QUERO, TRUCO), PEDIDO_ENVIDO: (QUERO, REAL_ENVIDO, FALTA_ENVIDO), PEDIDO_FLOR: (QUERO,)}
+
+PARTIDAS_POR_BLOCO = 50
+NIVEL_CONFIANCA = 0.95
+
+
+class Estatisticas():
+    """Contagens agregadas de partidas simuladas, por jogador (1 e 2); as de vários processos são somadas com somar."""
+
+    def __init__(self):
+        self.partidas = 0
+        self.vitorias = [0, 0]
+        self.maos = 0
+        self.pontos = [0, 0]
+        # Pedidos respondidos e aceitos por cada jogador, por tipo de pedido
+        self.pedidos = {nome: [0, 0] for nome in PEDIDOS.values()}
+        self.aceitos = {nome: [0, 0] for nome in PEDIDOS.values()}
+        self.semente = None
+        # Pedido pendente depois da última ação observada, ou seja, o que a próxima ação responde
+        self._pendente = 0
+
+    def observar(self, motor, jogador, acao):
+        """Observador para jogar_partida: conta as respostas aos pedidos e as mãos encerradas."""
+        estado = motor.estado
+        pendente = self._pendente
+        if (pendente and acao in (NAO_QUERO, *ACEITES[pendente])):
+            nome = PEDIDOS[pendente]
+            self.pedidos[nome][jogador - 1] += 1
+            self.aceitos[nome][jogador - 1] += acao != NAO_QUERO
+
+        self._pendente = estado.pedido
+        if (estado.vencedor_mao):
+            self.maos += 1
+
+    def registrar_partida(self, estado):
+        """Soma o resultado da partida encerrada no estado."""
+        self.partidas += 1
+        self.vitorias[estado.vencedor - 1] += 1
+        for i in (0, 1):
+            self.pontos[i] += estado.pontos[i]
+
+    def somar(self, outras):
+        """Acumula as contagens de outras Estatisticas."""
+        self.partidas += outras.partidas
+        self.maos += outras.maos
+        for i in (0, 1):
+            self.vitorias[i] += outras.vitorias[i]
+            self.pontos[i] += outras.pontos[i]
+            for nome in self.pedidos:
+                self.pedidos[nome][i] += outras.pedidos[nome][i]
+                self.aceitos[nome][i] += outras.aceitos[nome][i]
+        return self
+
+    def como_dict(self, nomes=('Jogador 1', 'Jogador 2')):
+        """Resultados agregados, por nome de jogador, prontos para gravar em JSON."""
+        jogadores = {}
+        for i, nome in enumerate(nomes):
+            jogadores[nome] = {
+                'vitorias': self.vitorias[i],
+                'pontos': self.pontos[i],
+                'pontos_por_mao': self.pontos[i] / self.maos if self.maos else 0.0,
+                'aceitacao': {pedido: {'pedidos': self.pedidos[pedido][i], 'aceitos': self.aceitos[pedido][i],
+                                       'taxa': self.aceitos[pedido][i] / self.pedidos[pedido][i] if self.pedidos[pedido][i] else None}
+                              for pedido in self.pedidos},
+            }
+        return {'partidas': self.partidas, 'maos': self.maos, 'semente': self.semente, 'jogadores': jogadores}
+
+    def relatorio(self, nomes=('Jogador 1', 'Jogador 2')):
+        """Texto com os resultados agregados, um jogador por coluna."""
+        resultados = self.como_dict(nomes)
+        jogadores = list(resultados['jogadores'].items())
+
+        def linha(rotulo, formatar):
+            return f"{rotulo}: " + ' | '.join(f"{nome} {formatar(dados)}" for nome, dados in jogadores)
+
+        def aceitacao(pedido):
+            def formatar(dados):
+                contagem = dados['aceitacao'][pedido]
+                taxa = '-' if contagem['taxa'] is None else f"{contagem['taxa']:.1%}"
+                return f"{taxa} ({contagem['aceitos']}/{contagem['pedidos']})"
+            return formatar
+
+        linhas = [
+            f"Partidas: {self.partidas} ({' x '.join(nomes)}), semente {self.semente}",
+            linha("Vitórias", lambda dados: f"{dados['vitorias']} ({dados['vitorias'] / max(self.partidas, 1):.1%})"),
+            f"Mãos: {self.maos}",
+            linha("Pontos por mão", lambda dados: f"{dados['pontos_por_mao']:.3f}"),
+        ]
+        linhas += [linha(f"Aceitação de {pedido}", aceitacao(pedido)) for pedido in self.pedidos]
+        return '\n'.join(linhas)
+
+
+class ComparacaoDuplicada():
+    """Resultados de partidas duplicadas: cada distribuição é jogada duas vezes, com as políticas 1 e 2 trocando de lugar.
+
+    Como as duas partidas recebem as mesmas cartas, a sorte da distribuição se cancela no saldo de cada
+    par de partidas, e a diferença entre as políticas é estimada com muito menos partidas.
+    """
+
+    def __init__(self):
+        self.vitorias = [0, 0]
+        self.pontos = [0, 0]
+        # Saldo de cada distribuição nas duas partidas, política 1 menos política 2
+        self.saldos_vitorias = []
+        self.saldos_pontos = []
+        self.semente = None
+
+    @property
+    def distribuicoes(self):
+        return len(self.saldos_vitorias)
+
+    def registrar(self, vitorias, pontos):
+        """Soma o resultado das duas partidas de uma distribuição, por política."""
+        for i in (0, 1):
+            self.vitorias[i] += vitorias[i]
+            self.pontos[i] += pontos[i]
+        self.saldos_vitorias.append(vitorias[0] - vitorias[1])
+        self.saldos_pontos.append(pontos[0] - pontos[1])
+
+    def somar(self, outras):
+        """Acumula os resultados de outra ComparacaoDuplicada, com as distribuições depois das já registradas."""
+        for i in (0, 1):
+            self.vitorias[i] += outras.vitorias[i]
+            self.pontos[i] += outras.pontos[i]
+        self.saldos_vitorias.extend(outras.saldos_vitorias)
+        self.saldos_pontos.extend(outras.saldos_pontos)
+        return self
+
+    def diferenca(self, saldos, nivel=NIVEL_CONFIANCA):
+        """Diferença média por partida (metade do saldo de cada distribuição) e a meia largura do intervalo de confiança."""
+        diferencas = np.asarray(saldos, dtype=float) / 2
+        if (len(diferencas) < 2):
+            return (float(diferencas.mean()) if len(diferencas) else 0.0), float('inf')
+        z = statistics.NormalDist().inv_cdf((1 + nivel) / 2)
+        return float(diferencas.mean()), float(z * diferencas.std(ddof=1) / np.sqrt(len(diferencas)))
+
+    def como_dict(self, nomes=('Política 1', 'Política 2'), nivel=NIVEL_CONFIANCA):
+        """Resultados agregados, com as diferenças da política 1 para a 2 e os seus intervalos, prontos para gravar em JSON."""
+        def intervalo(saldos):
+            media, margem = self.diferenca(saldos, nivel)
+            return {'media': media, 'margem': margem, 'intervalo': [media - margem, media + margem]}
+
+        partidas = 2 * self.distribuicoes
+        return {
+            'distribuicoes': self.distribuicoes,
+            'partidas': partidas,
+            'semente': self.semente,
+            'nivel_confianca': nivel,
+            'jogadores': {nome: {'vitorias': self.vitorias[i], 'pontos': self.pontos[i]} for i, nome in enumerate(nomes)},
+            'diferenca_taxa_vitoria': intervalo(self.saldos_vitorias),
+            'diferenca_pontos_por_partida': intervalo(self.saldos_pontos),
+            'distribuicoes_divididas': self.saldos_vitorias.count(0) / self.distribuicoes if self.distribuicoes else 0.0,
+        }
+
+    def relatorio(self, nomes=('Política 1', 'Política 2'), nivel=NIVEL_CONFIANCA):
+        """Texto com as vitórias de cada política e as diferenças pareadas com o intervalo de confiança."""
+        resultados = self.como_dict(nomes, nivel)
+        partidas = max(resultados['partidas'], 1)
+
+        def diferenca(chave, formato):
+            valores = resultados[chave]
+            inicio, fim = valores['intervalo']
+            return f"{valores['media']:{formato}} ± {valores['margem']:{formato.lstrip('+')}} [{inicio:{formato}}, {fim:{formato}}]"
+
+        return '\n'.join([
+            f"Distribuições: {self.distribuicoes} ({' x '.join(nomes)}), {resultados['partidas']} partidas com os lugares trocados, semente {self.semente}",
+            "Vitórias: " + ' | '.join(f"{nome} {self.vitorias[i]} ({self.vitorias[i] / partidas:.1%})" for i, nome in enumerate(nomes)),
+            f"Distribuições divididas (uma vitória para cada): {resultados['distribuicoes_divididas']:.1%}",
+            f"Diferença na taxa de vitória ({nomes[0]} - {nomes[1]}, IC {nivel:.0%}): {diferenca('diferenca_taxa_vitoria', '+.1%')}",
+            f"Diferença de pontos por partida (IC {nivel:.0%}): {diferenca('diferenca_pontos_por_partida', '+.3f')}",
+        ])
+
+
+# Estado de cada processo do pool, preenchido por iniciar_processo
+_processo = {}
+
+
+def iniciar_processo(politicas):
+    """Inicializador dos processos: carrega a base de casos uma única vez por processo, se algum jogador usar o CBR."""
+    cbr = Cbr() if 'cbr' in politicas else None
+    _processo['politicas'] = tuple(politicas)
+    # Cada bot consulta o seu próprio registro de caso, o mesmo que a PoliticaCbr enriquece durante a mão,
+    # sobre a base de casos e os vizinhos já carregados
+    _processo['cbrs'] = [cbr.com_dados(copiar_dados(cbr.dados)) if nome == 'cbr' else None for nome in politicas]
+
+
+def copiar_dados(dados):
+    """Cópia de Dados com um registro de caso próprio, compartilhando a base de casos já carregada."""
+    dados = copy.copy(dados)
+    dados.registro = dados.carregar_modelo_zerado()
+    return dados
+
+
+def criar_politica(nome, gerador, cbr=None):
+    """Cria a política de nome 'nome' (ver POLITICAS); as decisões aleatórias usam o random.Random 'gerador'.
+
+    A política do CBR enriquece e consulta o registro de caso de cbr.dados, zerado a cada política
+    criada: sem isso, o que sobrou da partida anterior no processo mudaria as consultas.
+    """
+    if (nome == 'aleatorio'):
+        return PoliticaAleatoria(gerador)
+    if (nome == 'heuristico'):
+        return PoliticaHeuristica()
+    if (nome == 'cbr'):
+        cbr.dados.registro = cbr.dados.carregar_modelo_zerado()
+        return PoliticaCbr(Bot('Bot'), cbr, cbr.dados, salvar=False)
+    raise ValueError(f"Política desconhecida: {nome!r}. Use uma de: {', '.join(POLITICAS)}.")
+
+
+def simular_partidas(semente, inicio, quantidade):
+    """Joga as partidas de números inicio a inicio + quantidade - 1 no processo atual, retornando as Estatisticas.
+
+    Cada partida tem o seu próprio fluxo aleatório (ver random_do_jogo), então o resultado não
+    depende de qual processo a joga.
+    """
+    estatisticas = Estatisticas()
+    for jogo in range(inicio, inicio + quantidade):
+        gerador = random_do_jogo(semente, jogo)
+        politicas = [criar_politica(nome, random.Random(gerador.getrandbits(64)), cbr)
+                     for nome, cbr in zip(_processo['politicas'], _processo['cbrs'])]
+        motor = Motor(gerador)
+        jogar_partida(motor, politicas, estatisticas.observar)
+        estatisticas.registrar_partida(motor.estado)
+    return estatisticas
+
+
+def jogar_duplicadas(semente, inicio, quantidade):
+    """Joga as distribuições de números inicio a inicio + quantidade - 1, duas vezes cada, retornando a ComparacaoDuplicada.
+
+    Na segunda partida as políticas trocam de lugar, e o baralho e cada política repetem o fluxo
+    aleatório da primeira (números aleatórios comuns): cada mão tem as mesmas cartas nos mesmos lugares.
+    As duas partidas começam com o registro de caso do CBR zerado (ver criar_politica).
+    """
+    comparacao = ComparacaoDuplicada()
+    nomes = _processo['politicas']
+    for distribuicao in range(inicio, inicio + quantidade):
+        sorteio = random_do_jogo(semente, (distribuicao, 1))
+        sementes_politicas = [sorteio.getrandbits(64) for _ in nomes]
+        vitorias = [0, 0]
+        pontos = [0, 0]
+        for lugares in ((0, 1), (1, 0)):
+            politicas = [criar_politica(nomes[i], random.Random(sementes_politicas[i]), _processo['cbrs'][i]) for i in lugares]
+            motor = Motor(random_do_jogo(semente, (distribuicao, 0)))
+            vencedor = jogar_partida(motor, politicas)
+            vitorias[lugares[vencedor - 1]] += 1
+            for jogador, i in enumerate(lugares):
+                pontos[i] += motor.estado.pontos[jogador]
+        comparacao.registrar(vitorias, pontos)
+    return comparacao
+
+
+def _executar(politicas, tarefa, total, quantidade, processos, semente, partidas_por_bloco):
+    """Executa a tarefa em blocos de partidas (no pool ou, com processos=1, no próprio processo) e soma os resultados em 'total'."""
+    politicas = tuple(politicas)
+    for nome in politicas:
+        if (nome not in POLITICAS):
+            raise ValueError(f"Política desconhecida: {nome!r}. Use uma de: {', '.join(POLITICAS)}.")
+    if (semente is None):
+        semente = np.random.SeedSequence().entropy
+
+    blocos = [(inicio, min(partidas_por_bloco, quantidade - inicio)) for inicio in range(0, quantidade, partidas_por_bloco)]
+    if (processos == 1):
+        iniciar_processo(politicas)
+        for inicio, tamanho in blocos:
+            total.somar(tarefa(semente, inicio, tamanho))
+    else:
+        with ProcessPoolExecutor(processos, initializer=iniciar_processo, initargs=(politicas,)) as executor:
+            futuros = [executor.submit(tarefa, semente, inicio, tamanho) for inicio, tamanho in blocos]
+            for futuro in futuros:
+                total.somar(futuro.result())
+
+    total.semente = semente
+    return total
+
+
+def simular(politicas, partidas, processos=None, semente=None, partidas_por_bloco=PARTIDAS_POR_BLOCO):
+    """Joga 'partidas' partidas entre as duas políticas (nomes de POLITICAS) num pool de processos.
+
+    Com processos=1 as partidas são jogadas no próprio processo, sem pool. Sem semente, uma é
+    sorteada e fica registrada nas Estatisticas retornadas, para repetir a simulação.
+    """
+    return _executar(politicas, simular_partidas, Estatisticas(), partidas, processos, semente, partidas_por_bloco)
+
+
+def comparar_duplicado(politicas, distribuicoes, processos=None, semente=None, partidas_por_bloco=PARTIDAS_POR_BLOCO):
+    """Como simular, mas jogando cada uma das 'distribuicoes' distribuições duas vezes, com as políticas trocando de lugar.
+
+    Retorna a ComparacaoDuplicada, com a diferença pareada entre as políticas e o seu intervalo de confiança.
+    """
+    return _executar(politicas, jogar_duplicadas, ComparacaoDuplicada(), distribuicoes, processos, semente, partidas_por_bloco)
@@ -0,0 +1,115 @@
+import numpy as np
+from .aleatorio import criar_gerador
+from .maos import PONTOS_IDS
+from .vazas import RESULTADO_VAZAS, SEM_VAZA, VITORIA, DERROTA, ganhadores_maos
+
+# Simulação vetorizada só da disputa das cartas (as três vazas, sem apostas), para estudar regras
+# fixas de escolha de carta em milhões de mãos de uma vez. As regras recebem os pontos (PONTOS_CARTAS)
+# das cartas na mão de cada linha, um array (N, 3) com -1 nas cartas já jogadas, e os pontos da carta
+# na mesa (N,), -1 quando o jogador abre a vaza; retornam a posição (N,) da carta a jogar.
+
+_SEM_PONTOS = -1
+_MAIOR_PONTO = np.iinfo(np.int16).max
+
+
+def maior_primeiro(pontos, mesa, gerador=None):
+    """Joga sempre a carta mais alta que resta."""
+    return np.argmax(pontos, axis=1)
+
+
+def menor_primeiro(pontos, mesa, gerador=None):
+    """Joga sempre a carta mais baixa que resta."""
+    return np.argmin(np.where(pontos == _SEM_PONTOS, _MAIOR_PONTO, pontos), axis=1)
+
+
+def menor_que_vence(pontos, mesa, gerador=None):
+    """Abre com a carta mais alta; respondendo, joga a menor carta que vence a da mesa, ou a menor se nenhuma vence."""
+    vencem = pontos > mesa[:, None]
+    menor_vencedora = np.argmin(np.where(vencem, pontos, _MAIOR_PONTO), axis=1)
+    escolhas = np.where(vencem.any(axis=1), menor_vencedora, menor_primeiro(pontos, mesa))
+    return np.where(mesa == _SEM_PONTOS, maior_primeiro(pontos, mesa), escolhas)
+
+
+def aleatoria(pontos, mesa, gerador):
+    """Joga uma das cartas que restam, sorteada uniformemente com o numpy.random.Generator."""
+    return np.argmax(np.where(pontos == _SEM_PONTOS, -1.0, gerador.random(pontos.shape)), axis=1)
+
+
+REGRAS = {
+    'maior_primeiro': maior_primeiro,
+    'menor_primeiro': menor_primeiro,
+    'menor_que_vence': menor_que_vence,
+    'aleatoria': aleatoria,
+}
+
+
+def _regra(regra):
+    return REGRAS[regra] if isinstance(regra, str) else regra
+
+
+def simular_maos(distribuicoes, regras=('maior_primeiro', 'maior_primeiro'), mao=1, gerador=None):
+    """Joga as três vazas de cada distribuição com as regras dos jogadores 1 e 2 (nomes de REGRAS ou funções).
+
+    'distribuicoes' é um array (N, 6) ou (N, 2, 3) de ids, com as cartas do jogador 1 antes das do
+    jogador 2, como gerar_distribuicoes; 'mao' é quem abre a primeira vaza (escalar ou (N,)).
+    Cada vaza de todas as mãos ainda em jogo é resolvida com uma única consulta a RESULTADO_VAZAS.
+
+    Retorna as vazas (N, 3), com 1 ou 2 para o vencedor, 0 para parda e SEM_VAZA para as vazas não
+    jogadas porque a mão já estava decidida, e o ganhador (N,) de cada mão.
+    """
+    maos = np.asarray(distribuicoes).reshape(-1, 2, 3).astype(np.intp)
+    quantidade = len(maos)
+    regras = [_regra(regra) for regra in regras]
+    gerador = criar_gerador(gerador)
+    pontos = PONTOS_IDS[maos].astype(np.int16)
+    mao = np.broadcast_to(np.asarray(mao, dtype=np.int8), (quantidade,))
+    lider = mao.copy()
+    vazas = np.full((quantidade, 3), SEM_VAZA, dtype=np.int8)
+    vencedores = np.zeros(quantidade, dtype=np.int8)
+
+    def jogar(linhas, jogadores, mesa):
+        """Cada jogador escolhe a carta pela sua regra; retorna os ids jogados e tira as cartas das mãos."""
+        cartas = np.empty(len(linhas), dtype=np.intp)
+        for jogador, regra in enumerate(regras, 1):
+            selecao = np.flatnonzero(jogadores == jogador)
+            if (len(selecao) == 0):
+                continue
+            escolhidas = linhas[selecao]
+            posicoes = regra(pontos[escolhidas, jogador - 1], mesa[selecao], gerador)
+            cartas[selecao] = maos[escolhidas, jogador - 1, posicoes]
+            pontos[escolhidas, jogador - 1, posicoes] = _SEM_PONTOS
+        return cartas
+
+    linhas = np.arange(quantidade)
+    for vaza in range(3):
+        lideres = lider[linhas]
+        seguidores = 3 - lideres
+        abertas = jogar(linhas, lideres, np.full(len(linhas), _SEM_PONTOS, dtype=np.int16))
+        respostas = jogar(linhas, seguidores, PONTOS_IDS[abertas].astype(np.int16))
+
+        resultados = RESULTADO_VAZAS[abertas, respostas]
+        vencedores_vaza = np.where(resultados == VITORIA, lideres, np.where(resultados == DERROTA, seguidores, 0))
+        vazas[linhas, vaza] = vencedores_vaza
+        # Quem vence a vaza abre a próxima; em caso de parda, quem abriu continua abrindo
+        lider[linhas] = np.where(vencedores_vaza > 0, vencedores_vaza, lideres)
+
+        vencedores[linhas] = ganhadores_maos(vazas[linhas], mao[linhas])
+        linhas = linhas[vencedores[linhas] == 0]
+
+    return vazas, vencedores
+
+
+def comparar_regras(distribuicoes, regras=tuple(REGRAS), gerador=None):
+    """Fração de mãos vencidas pelo jogador 1 para cada par de regras (linhas: jogador 1, colunas: jogador 2).
+
+    Todos os pares jogam as mesmas distribuições, alternando quem é mão entre as linhas.
+    """
+    distribuicoes = np.asarray(distribuicoes).reshape(-1, 2, 3)
+    mao = np.arange(len(distribuicoes)) % 2 + 1
+    gerador = criar_gerador(gerador)
+    taxas = np.empty((len(regras), len(regras)))
+    for i, regra_1 in enumerate(regras):
+        for j, regra_2 in enumerate(regras):
+            _, vencedores = simular_maos(distribuicoes, (regra_1, regra_2), mao, gerador)
+            taxas[i, j] = np.mean(vencedores == 1)
+    return taxas
@@ -0,0 +1,255 @@
+import itertools
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from .aleatorio import random_do_jogo
+from .bot import Bot
+from .cbr import Cbr
+from .dados import Dados
+from .motor import Motor
+from .politicas import PoliticaCbr, jogar_partida
+from .simulacao import POLITICAS, copiar_dados, criar_politica
+
+# Torneio todos contra todos entre configurações de bots, com rating Elo. Cada configuração é um
+# dicionário com 'nome' e 'politica' (ver POLITICAS); as do CBR aceitam ainda 'vizinhos' (quantidade
+# de vizinhos consultados), 'casos' (arquivo da base de casos) e os limiares de Bot.avaliar_envido
+# ('limiar_perdendo' e 'fator_perdendo').
+
+CHAVES_CONFIGURACAO = ('nome', 'politica', 'vizinhos', 'casos', 'limiar_perdendo', 'fator_perdendo')
+CHAVES_BOT = ('limiar_perdendo', 'fator_perdendo')
+
+ELO_INICIAL = 1500.0
+FATOR_ELO = 16.0
+PARTIDAS_POR_LOTE = 20
+
+
+def validar_configuracoes(configuracoes):
+    """Normaliza as configurações (um nome de política vira {'nome': nome, 'politica': nome}) e as valida."""
+    normalizadas = []
+    for configuracao in configuracoes:
+        if (isinstance(configuracao, str)):
+            configuracao = {'nome': configuracao, 'politica': configuracao}
+        configuracao = dict(configuracao)
+        configuracao.setdefault('nome', configuracao.get('politica'))
+        desconhecidas = set(configuracao) - set(CHAVES_CONFIGURACAO)
+        if (desconhecidas):
+            raise ValueError(f"Chaves desconhecidas na configuração {configuracao['nome']!r}: {', '.join(sorted(desconhecidas))}.")
+        if (configuracao.get('politica') not in POLITICAS):
+            raise ValueError(f"Política desconhecida: {configuracao.get('politica')!r}. Use uma de: {', '.join(POLITICAS)}.")
+        normalizadas.append(configuracao)
+
+    nomes = [configuracao['nome'] for configuracao in normalizadas]
+    if (len(set(nomes)) != len(nomes)):
+        raise ValueError("Os nomes das configurações do torneio devem ser únicos.")
+    if (len(nomes) < 2):
+        raise ValueError("O torneio precisa de pelo menos duas configurações.")
+    return normalizadas
+
+
+def esperado(elo, elo_oponente):
+    """Pontuação esperada (probabilidade de vitória) de quem tem 'elo' contra quem tem 'elo_oponente'."""
+    return 1 / (1 + 10 ** ((elo_oponente - elo) / 400))
+
+
+def atualizar_elo(elos, vencedor, perdedor, fator=FATOR_ELO):
+    """Atualiza o dicionário de ratings 'elos' com uma vitória de 'vencedor' sobre 'perdedor'."""
+    ganho = fator * (1 - esperado(elos[vencedor], elos[perdedor]))
+    elos[vencedor] += ganho
+    elos[perdedor] -= ganho
+
+
+def lotes_do_torneio(quantidade, partidas, partidas_por_lote=PARTIDAS_POR_LOTE):
+    """Lotes (i, j, inicio, quantidade) de todos os pares de configurações, intercalando os pares."""
+    pares = list(itertools.combinations(range(quantidade), 2))
+    return [(i, j, inicio, min(partidas_por_lote, partidas - inicio))
+            for inicio in range(0, partidas, partidas_por_lote) for i, j in pares]
+
+
+# Estado de cada processo do pool, preenchido por iniciar_processo
+_processo = {}
+
+
+def iniciar_processo(configuracoes):
+    """Inicializador dos processos; cada base de casos e cada Cbr são carregados no primeiro lote que os usa."""
+    _processo['configuracoes'] = configuracoes
+    _processo['bases'] = {}
+    _processo['cbrs'] = {}
+    _processo['cbrs_dos_bots'] = {}
+
+
+def _cbr(configuracao):
+    """Cbr da configuração, compartilhado pelas configurações com o mesmo arquivo de casos e os mesmos vizinhos."""
+    casos = configuracao.get('casos')
+    chave = (casos, configuracao.get('vizinhos', Cbr.vizinhos))
+    if (chave not in _processo['cbrs']):
+        if (casos not in _processo['bases']):
+            _processo['bases'][casos] = Dados(casos)
+        _processo['cbrs'][chave] = Cbr(copiar_dados(_processo['bases'][casos]), chave[1])
+    return _processo['cbrs'][chave]
+
+
+def criar_politica_configurada(indice, gerador):
+    """Cria a política da configuração de índice 'indice'; as decisões aleatórias usam o random.Random 'gerador'."""
+    configuracao = _processo['configuracoes'][indice]
+    if (configuracao['politica'] != 'cbr'):
+        return criar_politica(configuracao['politica'], gerador)
+
+    # Cada configuração consulta o seu próprio registro de caso, o mesmo que a PoliticaCbr enriquece,
+    # sobre a base de casos e os vizinhos do Cbr compartilhado; o registro é zerado a cada partida,
+    # para que o resultado de um lote não dependa dos lotes que o processo jogou antes
+    if (indice not in _processo['cbrs_dos_bots']):
+        cbr = _cbr(configuracao)
+        _processo['cbrs_dos_bots'][indice] = cbr.com_dados(copiar_dados(cbr.dados))
+    cbr = _processo['cbrs_dos_bots'][indice]
+    cbr.dados.registro = cbr.dados.carregar_modelo_zerado()
+    bot = Bot(configuracao['nome'], **{chave: configuracao[chave] for chave in CHAVES_BOT if chave in configuracao})
+    return PoliticaCbr(bot, cbr, cbr.dados, salvar=False)
+
+
+def jogar_lote(semente, i, j, inicio, quantidade):
+    """Joga as partidas de números inicio a inicio + quantidade - 1 entre as configurações i e j.
+
+    As configurações trocam de lugar a cada partida (nas pares, i é o jogador 1). Cada partida tem o
+    seu próprio fluxo aleatório, então o resultado do lote não depende do processo que o joga.
+    Retorna o lote com o vencedor de cada partida (0 para i, 1 para j) e os pontos de cada configuração.
+    """
+    vencedores = []
+    pontos = [0, 0]
+    for partida in range(inicio, inicio + quantidade):
+        gerador = random_do_jogo(semente, (i, j, partida))
+        lugares = (0, 1) if partida % 2 == 0 else (1, 0)
+        indices = [(i, j)[lugar] for lugar in lugares]
+        politicas = [criar_politica_configurada(indice, random.Random(gerador.getrandbits(64))) for indice in indices]
+        motor = Motor(gerador)
+        vencedor = jogar_partida(motor, politicas)
+        vencedores.append(lugares[vencedor - 1])
+        for jogador, lugar in enumerate(lugares):
+            pontos[lugar] += motor.estado.pontos[jogador]
+    return {'par': [i, j], 'inicio': inicio, 'vencedores': vencedores, 'pontos': pontos}
+
+
+def novo_estado(configuracoes, partidas, semente, partidas_por_lote=PARTIDAS_POR_LOTE, fator_elo=FATOR_ELO):
+    """Estado inicial do torneio, no formato gravado em JSON."""
+    return {
+        'configuracoes': configuracoes,
+        'partidas_por_par': partidas,
+        'partidas_por_lote': partidas_por_lote,
+        'fator_elo': fator_elo,
+        'semente': semente,
+        'elo': {configuracao['nome']: ELO_INICIAL for configuracao in configuracoes},
+        # Quantos lotes do início da agenda (lotes_do_torneio) já entraram nos ratings
+        'lotes_no_elo': 0,
+        'lotes': [],
+    }
+
+
+def carregar_estado(arquivo):
+    with open(arquivo, encoding='utf-8') as entrada:
+        return json.load(entrada)
+
+
+def gravar_estado(estado, arquivo):
+    """Grava o estado por cima do arquivo de uma vez, para que uma interrupção não deixe o JSON pela metade."""
+    temporario = f"{arquivo}.tmp"
+    with open(temporario, 'w', encoding='utf-8') as saida:
+        json.dump(estado, saida, ensure_ascii=False, indent=2)
+    os.replace(temporario, arquivo)
+
+
+def registrar_lote(estado, lote, agenda, concluidos):
+    """Acrescenta o lote ao estado e atualiza os ratings, partida a partida, na ordem da agenda.
+
+    'concluidos' indexa os lotes já registrados por (i, j, inicio). Um lote que termina antes dos que o
+    precedem na agenda espera por eles, então os ratings não dependem da ordem em que os lotes terminam.
+    """
+    estado['lotes'].append(lote)
+    concluidos[(*lote['par'], lote['inicio'])] = lote
+    while (estado['lotes_no_elo'] < len(agenda)):
+        proximo = concluidos.get(agenda[estado['lotes_no_elo']][:3])
+        if (proximo is None):
+            break
+        nomes = [estado['configuracoes'][indice]['nome'] for indice in proximo['par']]
+        for vencedor in proximo['vencedores']:
+            atualizar_elo(estado['elo'], nomes[vencedor], nomes[1 - vencedor], estado['fator_elo'])
+        estado['lotes_no_elo'] += 1
+
+
+def torneio(configuracoes, partidas, arquivo=None, processos=None, semente=None,
+            partidas_por_lote=PARTIDAS_POR_LOTE, fator_elo=FATOR_ELO, observador=None):
+    """Joga 'partidas' partidas entre cada par de configurações num pool de processos e retorna o estado.
+
+    Os ratings Elo são atualizados à medida que os lotes terminam, sempre na ordem da agenda (ver
+    registrar_lote), então a mesma semente dá os mesmos ratings com ou sem pool, interrompido ou não.
+    Com 'arquivo', o estado é gravado depois de cada lote; se o arquivo já existir, o torneio continua
+    de onde parou, jogando só os lotes que faltam. 'observador', se informado, é chamado como
+    observador(estado, lote) depois de cada lote.
+    Com processos=1 os lotes são jogados no próprio processo, sem pool.
+    """
+    configuracoes = validar_configuracoes(configuracoes)
+    if (arquivo is not None and os.path.exists(arquivo)):
+        estado = carregar_estado(arquivo)
+        parametros = {'configuracoes': configuracoes, 'partidas_por_par': partidas,
+                      'partidas_por_lote': partidas_por_lote, 'fator_elo': fator_elo}
+        if (semente is not None):
+            parametros['semente'] = semente
+        diferentes = [chave for chave, valor in parametros.items() if estado[chave] != valor]
+        if (diferentes):
+            raise ValueError(f"O torneio gravado em {arquivo} não corresponde a este: {', '.join(diferentes)}.")
+    else:
+        if (semente is None):
+            semente = np.random.SeedSequence().entropy
+        estado = novo_estado(configuracoes, partidas, semente, partidas_por_lote, fator_elo)
+
+    agenda = lotes_do_torneio(len(configuracoes), partidas, partidas_por_lote)
+    concluidos = {(*lote['par'], lote['inicio']): lote for lote in estado['lotes']}
+    pendentes = [lote for lote in agenda if lote[:3] not in concluidos]
+
+    def concluir(lote):
+        registrar_lote(estado, lote, agenda, concluidos)
+        if (arquivo is not None):
+            gravar_estado(estado, arquivo)
+        if (observador is not None):
+            observador(estado, lote)
+
+    if (processos == 1):
+        iniciar_processo(configuracoes)
+        for lote in pendentes:
+            concluir(jogar_lote(estado['semente'], *lote))
+    elif (pendentes):
+        executor = ProcessPoolExecutor(processos, initializer=iniciar_processo, initargs=(configuracoes,))
+        try:
+            futuros = [executor.submit(jogar_lote, estado['semente'], *lote) for lote in pendentes]
+            for futuro in as_completed(futuros):
+                concluir(futuro.result())
+        finally:
+            # Numa interrupção, os lotes que ainda não começaram são cancelados e ficam para a retomada
+            executor.shutdown(cancel_futures=True)
+
+    return estado
+
+
+def classificacao(estado):
+    """Linhas (nome, elo, partidas, vitorias, pontos) de cada configuração, da maior para a menor rating."""
+    totais = {configuracao['nome']: [0, 0, 0] for configuracao in estado['configuracoes']}
+    for lote in estado['lotes']:
+        nomes = [estado['configuracoes'][indice]['nome'] for indice in lote['par']]
+        for lugar, nome in enumerate(nomes):
+            totais[nome][0] += len(lote['vencedores'])
+            totais[nome][1] += lote['vencedores'].count(lugar)
+            totais[nome][2] += lote['pontos'][lugar]
+    linhas = [(nome, estado['elo'][nome], *totais[nome]) for nome in totais]
+    return sorted(linhas, key=lambda linha: linha[1], reverse=True)
+
+
+def relatorio(estado):
+    """Texto com a classificação do torneio."""
+    total = math.comb(len(estado['configuracoes']), 2) * estado['partidas_por_par']
+    jogadas = sum(len(lote['vencedores']) for lote in estado['lotes'])
+    linhas = [f"Partidas: {jogadas}/{total}, semente {estado['semente']}"]
+    for posicao, (nome, elo, partidas, vitorias, pontos) in enumerate(classificacao(estado), 1):
+        taxa = vitorias / partidas if partidas else 0.0
+        linhas.append(f"{posicao}. {nome}: Elo {elo:.0f}, {vitorias}/{partidas} vitórias ({taxa:.1%}), {pontos} pontos")
+    return '\n'.join(linhas)
@@ -1,5 +1,11 @@
+from .politicas import PoliticaHumana
+from .motor import TRUCO, QUERO, NAO_QUERO
+
+
 class Truco():
-    def __init__(self):
+    def __init__(self, politica=None):
+        # Decide pelo Jogador 1 quando o pedido é do Bot; por padrão, lê do teclado
+        self.politica = politica or PoliticaHumana()
         self.valor_aposta = 1
         self.jogador_bloqueado = 0
         self.jogador_pediu = 0
@@ -23,6 +29,11 @@ class Truco():
         self.jogador_bloqueado = quem_pediu
 
 
+    def responder_jogador(self, valor, opcoes):
+        """Consulta a política do Jogador 1 e retorna a posição da resposta nas opções ([0] Recusar, [1] Aceitar, [2] Aumentar)."""
+        return opcoes.index(self.politica.responder_truco(1, valor, opcoes))
+
+
     def controlador_truco(self, cbr, dados, quem_pediu, jogador1, jogador2):
         """Controlador de métodos, para selecionar o que pode ser chamado ou não."""
         if (self.estado_atual == "vale_quatro"):
@@ -58,9 +69,7 @@ class Truco():
             self.jogador_bloqueado = 1
 
         else:
-            escolha = -1
-            while(escolha not in [0, 1, 2]):
-                escolha = int(input(f"{quem_pediu}, você aceita o pedido (a mão passa a valer {(self.valor_aposta)} pontos)\n[0] Recusar\n[1] Aceitar\n[2] Aumentar Aposta"))
+            escolha = self.responder_jogador(2, [NAO_QUERO, QUERO, TRUCO])
             self.jogador_bloqueado = 2
         
 
@@ -95,9 +104,7 @@ class Truco():
             self.jogador_bloqueado = 1
 
         else:
-            escolha = -1
-            while(escolha not in [0, 1, 2]):
-                escolha = int(input(f"Jogador {quem_pediu}, você aceita o pedido (a mão passa a valer {(self.valor_aposta)} pontos)\n[0] Recusar\n[1] Aceitar\n[2] Aumentar Aposta"))
+            escolha = self.responder_jogador(3, [NAO_QUERO, QUERO, TRUCO])
             self.jogador_bloqueado = 2
         
 
@@ -131,9 +138,7 @@ class Truco():
             self.jogador_bloqueado = 1
 
         else:
-            escolha = -1
-            while(escolha not in [0, 1]):
-                escolha = int(input(f"Jogador {quem_pediu}, você aceita o pedido (a mão passa a valer {(self.valor_aposta)} pontos)\n[0] Recusar\n[1] Aceitar"))
+            escolha = self.responder_jogador(4, [NAO_QUERO, QUERO])
             self.jogador_bloqueado = 2
         
 
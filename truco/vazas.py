@@ -0,0 +1,88 @@
+import numpy as np
+from .pontos import PONTOS_CARTAS
+
+# Resultado de uma vaza do ponto de vista da primeira carta
+VITORIA = 1
+PARDA = 0
+DERROTA = -1
+
+# Vaza ainda não jogada, nos arrays de vazas
+SEM_VAZA = -1
+
+_pontos = np.array(PONTOS_CARTAS, dtype=np.int16)
+
+# Matriz 40x40 (int8): RESULTADO_VAZAS[a, b] é o resultado da carta de id a contra a carta de id b
+RESULTADO_VAZAS = np.sign(_pontos[:, None] - _pontos[None, :]).astype(np.int8)
+RESULTADO_VAZAS.flags.writeable = False
+
+# Cópia em tuplas para consultas individuais, mais rápidas que indexar o array escalarmente
+_RESULTADOS = tuple(tuple(linha) for linha in RESULTADO_VAZAS.tolist())
+
+
+def resultado_vaza(id_carta_01, id_carta_02):
+    """Retorna o resultado (VITORIA, PARDA ou DERROTA) da primeira carta contra a segunda, a partir dos ids."""
+    return _RESULTADOS[id_carta_01][id_carta_02]
+
+
+def resolver_vazas(ids_cartas_01, ids_cartas_02):
+    """Resolve vários pares de cartas de uma vez, retornando um array int8 com o resultado de cada vaza."""
+    return RESULTADO_VAZAS[np.asarray(ids_cartas_01, dtype=np.intp), np.asarray(ids_cartas_02, dtype=np.intp)]
+
+
+def ganhador_mao(vazas, mao=1):
+    """Retorna o jogador (1 ou 2) que venceu a mão, seguindo as regras de parda, ou None se a mão não terminou.
+
+    'vazas' é a lista de resultados das vazas já jogadas (1 ou 2 para o vencedor, 0 para parda)
+    e 'mao' é o jogador que abriu a mão, que vence se as três vazas forem pardas.
+    """
+    if (not vazas):
+        return None
+
+    primeira = vazas[0]
+    if (primeira == 0):
+        # Parda na primeira vaza: vence quem ganhar a próxima vaza, ou o mão se todas empatarem
+        for vaza in vazas[1:]:
+            if (vaza != 0):
+                return vaza
+
+        if (len(vazas) == 3):
+            return mao
+
+        return None
+
+    if (len(vazas) >= 2 and vazas[1] in (0, primeira)):
+        # Parda na segunda vaza: vence quem ganhou a primeira
+        return primeira
+
+    if (len(vazas) == 3):
+        # Parda na terceira vaza: vence quem ganhou a primeira
+        return primeira if vazas[2] == 0 else vazas[2]
+
+    return None
+
+
+def _tabela_ganhador():
+    """Tabela de ganhador_mao para todas as sequências de vazas, com 0 onde a mão continua."""
+    tabela = np.zeros((4, 3, 3, 3, 3), dtype=np.int8)
+    for jogadas in range(1, 4):
+        for vazas in np.ndindex(3, 3, 3):
+            for mao in (1, 2):
+                tabela[(jogadas,) + vazas + (mao,)] = ganhador_mao(list(vazas[:jogadas]), mao) or 0
+    tabela.flags.writeable = False
+    return tabela
+
+
+# GANHADOR_VAZAS[vazas jogadas, vaza 1, vaza 2, vaza 3, jogador mão]: o ganhador da mão (0 se ela continua),
+# com 1 ou 2 para o vencedor de cada vaza e 0 para parda ou vaza ainda não jogada
+GANHADOR_VAZAS = _tabela_ganhador()
+
+
+def ganhadores_maos(vazas, mao=1):
+    """Versão vetorizada de ganhador_mao: recebe um array (N, 3) de vazas, com SEM_VAZA nas não jogadas, e o jogador mão (escalar ou (N,)).
+
+    Retorna um array int8 (N,) com o ganhador de cada mão, ou 0 onde a mão ainda não terminou.
+    """
+    vazas = np.asarray(vazas)
+    jogadas = np.count_nonzero(vazas != SEM_VAZA, axis=1)
+    vazas = np.maximum(vazas, 0)
+    return GANHADOR_VAZAS[jogadas, vazas[:, 0], vazas[:, 1], vazas[:, 2], mao]
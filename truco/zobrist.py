@@ -0,0 +1,79 @@
+import random
+
+# Chaves aleatórias de 64 bits, fixas entre execuções, para o hash de Zobrist dos estados do motor:
+# a chave de um estado é o XOR das chaves de cada um dos seus componentes.
+_gerador = random.Random(0x5452_5543_4f5a_4f42)
+
+
+def _chaves(*dimensoes):
+    """Tabela (tuplas aninhadas) de chaves aleatórias com as dimensões informadas."""
+    if (len(dimensoes) == 1):
+        return tuple(_gerador.getrandbits(64) for _ in range(dimensoes[0]))
+    return tuple(_chaves(*dimensoes[1:]) for _ in range(dimensoes[0]))
+
+
+# Carta na mão, por jogador e posição: CHAVES_MAO[(jogador - 1) * 3 + posicao][id]
+CHAVES_MAO = _chaves(6, 40)
+# Carta já jogada, por quem a jogou: CHAVES_JOGADA[jogador - 1][id]
+CHAVES_JOGADA = _chaves(2, 40)
+# Carta na mesa aguardando a resposta da vaza
+CHAVES_MESA = _chaves(40)
+# Resultado de cada vaza (0 para parda, 1 ou 2 para o vencedor): CHAVES_VAZA[indice][resultado]
+CHAVES_VAZA = _chaves(3, 3)
+# Placar de cada jogador: CHAVES_PONTOS[jogador - 1][pontos]
+CHAVES_PONTOS = _chaves(2, 256)
+
+# Situação da aposta e da vez, em três grupos de campos pequenos:
+# (vez, jogador_mao, envido_fechado, vencedor_mao), (valor_aposta, quem_aumentou) e
+# (pedido, quem_pediu, valor_pedido, vez_retorno), mais o envido já aceito no pedido pendente
+CHAVES_VEZ = _chaves(3 * 3 * 2 * 3)
+CHAVES_APOSTA = _chaves(5 * 3)
+CHAVES_PEDIDO = _chaves(4 * 3 * 9 * 3)
+# Pontos do envido já aceitos pelos aumentos do pedido pendente (0, 2, 3 ou 5)
+CHAVES_ENVIDO = _chaves(6)
+
+
+def chave_situacao(estado):
+    """Parte da chave dada pela vez e pela situação das apostas: três consultas às tabelas, em O(1).
+
+    Os campos do pedido só entram enquanto há um pedido pendente: depois de respondido, seus
+    valores antigos não mudam o jogo e não devem separar estados equivalentes.
+    """
+    chave = (CHAVES_VEZ[((estado.vez * 3 + estado.jogador_mao) * 2 + estado.envido_fechado) * 3 + estado.vencedor_mao]
+             ^ CHAVES_APOSTA[estado.valor_aposta * 3 + estado.quem_aumentou])
+    if (estado.pedido):
+        chave ^= (CHAVES_PEDIDO[((estado.pedido * 3 + estado.quem_pediu) * 9 + estado.valor_pedido) * 3 + estado.vez_retorno]
+                  ^ CHAVES_ENVIDO[estado.valor_envido])
+    return chave
+
+
+def chave_cartas(estado):
+    """Calcula do zero a parte da chave dada pelas cartas, pelas vazas e pelo placar.
+
+    É a parte que o Motor atualiza por XOR a cada carta jogada e a cada ponto somado.
+    """
+    pontos = estado.pontos
+    mao_1, mao_2 = estado.maos
+    chave = CHAVES_PONTOS[0][pontos[0]] ^ CHAVES_PONTOS[1][pontos[1]]
+    for posicao in (0, 1, 2):
+        if (mao_1[posicao] >= 0):
+            chave ^= CHAVES_MAO[posicao][mao_1[posicao]]
+        if (mao_2[posicao] >= 0):
+            chave ^= CHAVES_MAO[3 + posicao][mao_2[posicao]]
+
+    for jogador, carta in estado.jogadas:
+        chave ^= CHAVES_JOGADA[jogador - 1][carta]
+    if (estado.carta_mesa >= 0):
+        chave ^= CHAVES_MESA[estado.carta_mesa]
+    for indice, resultado in enumerate(estado.vazas):
+        chave ^= CHAVES_VAZA[indice][resultado]
+    return chave
+
+
+def chave_estado(estado):
+    """Calcula do zero a chave de Zobrist do estado: cartas, vazas, placar e situação das apostas.
+
+    Ficam de fora os campos que decorrem dos demais (lider, vencedor, pontos_mao, envido e flor de cada
+    mão) ou que não mudam o jogo dali em diante (numero_mao, vencedor_envido, vencedor_flor).
+    """
+    return chave_cartas(estado) ^ chave_situacao(estado)